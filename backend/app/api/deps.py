@@ -1,37 +1,218 @@
+import math
 from collections.abc import AsyncGenerator
 from typing import Annotated
 
 from fastapi import Cookie, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.admission import get_user_rate_limiter
 from app.core.firebase import FirebaseNotConfiguredError, verify_session_cookie
+from app.core.storage import LocalMediaStorage, get_media_storage
+from app.db.models.user import COACH_ROLE, User
+from app.db.repositories.activity_log import ActivityLogRepository
+from app.db.repositories.annotation import AnnotationRepository
+from app.db.repositories.coach import CoachRepository
+from app.db.repositories.content import ContentRepository
+from app.db.repositories.credit import CreditRepository
 from app.db.repositories.item import ItemRepository
+from app.db.repositories.job import JobRepository
+from app.db.repositories.media import MediaRepository
+from app.db.repositories.program import ProgramRepository
 from app.db.repositories.user import UserRepository
-from app.db.session import get_session
-from app.services.item import ItemService
+from app.db.session import admitted_session_scope
+from app.services.activity_log import ActivityLogService
+from app.services.annotation import AnnotationService
+from app.services.autocomplete import Autocomplete, get_autocomplete
+from app.services.coach import CoachService
+from app.services.content import ContentService
+from app.services.credit import CreditService
+from app.services.events import EventPublisher
+from app.services.item import ItemImportService, ItemService
+from app.services.jobs import JobQueue
+from app.services.media import MediaChunkService, MediaService
+from app.services.program import ProgramService
+from app.services.recommendations import CoachRecommender, get_coach_recommender
+
+
+async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
+    """Dependency for a request's database session.
+
+    Waits for a slot of the process-wide session limiter and holds it until
+    the session has committed and closed. Everything built on the session is
+    declared with ``scope="function"``, so that happens as soon as the
+    endpoint returns, before a streamed response body is sent.
+
+    Raises:
+        ServerBusyError: If no slot frees up within the queue budget.
+    """
+    async with admitted_session_scope() as session:
+        yield session
 
 
 async def get_item_repository(
-    session: Annotated[AsyncSession, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_db_session, scope="function")],
 ) -> AsyncGenerator[ItemRepository, None]:
     """Dependency for getting ItemRepository instance."""
     yield ItemRepository(session)
 
 
+async def get_event_publisher(
+    session: Annotated[AsyncSession, Depends(get_db_session, scope="function")],
+) -> AsyncGenerator[EventPublisher, None]:
+    """Dependency for getting an EventPublisher bound to the request transaction."""
+    yield EventPublisher(session)
+
+
 async def get_item_service(
-    repository: Annotated[ItemRepository, Depends(get_item_repository)],
+    repository: Annotated[
+        ItemRepository, Depends(get_item_repository, scope="function")
+    ],
+    events: Annotated[EventPublisher, Depends(get_event_publisher, scope="function")],
 ) -> AsyncGenerator[ItemService, None]:
     """Dependency for getting ItemService instance."""
-    yield ItemService(repository)
+    yield ItemService(repository, events)
+
+
+async def get_item_import_service() -> AsyncGenerator[ItemImportService, None]:
+    """Dependency for getting ItemImportService instance."""
+    yield ItemImportService()
 
 
 async def get_user_repository(
-    session: Annotated[AsyncSession, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_db_session, scope="function")],
 ) -> AsyncGenerator[UserRepository, None]:
     """Dependency for getting UserRepository instance."""
     yield UserRepository(session)
 
 
+async def get_credit_repository(
+    session: Annotated[AsyncSession, Depends(get_db_session, scope="function")],
+) -> AsyncGenerator[CreditRepository, None]:
+    """Dependency for getting CreditRepository instance."""
+    yield CreditRepository(session)
+
+
+async def get_credit_service(
+    repository: Annotated[
+        CreditRepository, Depends(get_credit_repository, scope="function")
+    ],
+) -> AsyncGenerator[CreditService, None]:
+    """Dependency for getting CreditService instance."""
+    yield CreditService(repository)
+
+
+async def get_media_repository(
+    session: Annotated[AsyncSession, Depends(get_db_session, scope="function")],
+) -> AsyncGenerator[MediaRepository, None]:
+    """Dependency for getting MediaRepository instance."""
+    yield MediaRepository(session)
+
+
+async def get_media_service(
+    repository: Annotated[
+        MediaRepository, Depends(get_media_repository, scope="function")
+    ],
+    storage: Annotated[LocalMediaStorage, Depends(get_media_storage)],
+) -> AsyncGenerator[MediaService, None]:
+    """Dependency for getting MediaService instance."""
+    yield MediaService(repository, storage)
+
+
+async def get_media_chunk_service(
+    storage: Annotated[LocalMediaStorage, Depends(get_media_storage)],
+) -> AsyncGenerator[MediaChunkService, None]:
+    """Dependency for getting MediaChunkService instance."""
+    yield MediaChunkService(storage)
+
+
+async def get_program_repository(
+    session: Annotated[AsyncSession, Depends(get_db_session, scope="function")],
+) -> AsyncGenerator[ProgramRepository, None]:
+    """Dependency for getting ProgramRepository instance."""
+    yield ProgramRepository(session)
+
+
+async def get_program_service(
+    repository: Annotated[
+        ProgramRepository, Depends(get_program_repository, scope="function")
+    ],
+) -> AsyncGenerator[ProgramService, None]:
+    """Dependency for getting ProgramService instance."""
+    yield ProgramService(repository)
+
+
+async def get_content_repository(
+    session: Annotated[AsyncSession, Depends(get_db_session, scope="function")],
+) -> AsyncGenerator[ContentRepository, None]:
+    """Dependency for getting ContentRepository instance."""
+    yield ContentRepository(session)
+
+
+async def get_content_service(
+    repository: Annotated[
+        ContentRepository, Depends(get_content_repository, scope="function")
+    ],
+) -> AsyncGenerator[ContentService, None]:
+    """Dependency for getting ContentService instance."""
+    yield ContentService(repository)
+
+
+async def get_annotation_repository(
+    session: Annotated[AsyncSession, Depends(get_db_session, scope="function")],
+) -> AsyncGenerator[AnnotationRepository, None]:
+    """Dependency for getting AnnotationRepository instance."""
+    yield AnnotationRepository(session)
+
+
+async def get_annotation_service(
+    repository: Annotated[
+        AnnotationRepository, Depends(get_annotation_repository, scope="function")
+    ],
+    media: Annotated[MediaRepository, Depends(get_media_repository, scope="function")],
+) -> AsyncGenerator[AnnotationService, None]:
+    """Dependency for getting AnnotationService instance."""
+    yield AnnotationService(repository, media)
+
+
+async def get_activity_log_repository(
+    session: Annotated[AsyncSession, Depends(get_db_session, scope="function")],
+) -> AsyncGenerator[ActivityLogRepository, None]:
+    """Dependency for getting ActivityLogRepository instance."""
+    yield ActivityLogRepository(session)
+
+
+async def get_activity_log_service(
+    repository: Annotated[
+        ActivityLogRepository, Depends(get_activity_log_repository, scope="function")
+    ],
+) -> AsyncGenerator[ActivityLogService, None]:
+    """Dependency for getting ActivityLogService instance."""
+    yield ActivityLogService(repository)
+
+
+async def get_coach_repository(
+    session: Annotated[AsyncSession, Depends(get_db_session, scope="function")],
+) -> AsyncGenerator[CoachRepository, None]:
+    """Dependency for getting CoachRepository instance."""
+    yield CoachRepository(session)
+
+
+async def get_coach_service(
+    repository: Annotated[
+        CoachRepository, Depends(get_coach_repository, scope="function")
+    ],
+) -> AsyncGenerator[CoachService, None]:
+    """Dependency for getting CoachService instance."""
+    yield CoachService(repository)
+
+
+async def get_job_queue(
+    session: Annotated[AsyncSession, Depends(get_db_session, scope="function")],
+) -> AsyncGenerator[JobQueue, None]:
+    """Dependency for getting a JobQueue bound to the request transaction."""
+    yield JobQueue(JobRepository(session))
+
+
 async def get_current_user(
     __session: Annotated[str | None, Cookie(alias="__session")] = None,
 ) -> dict:
@@ -44,6 +225,7 @@ async def get_current_user(
     - Session cookies are HttpOnly, preventing XSS access
     - Cookies are verified server-side with Firebase Admin SDK
     - Revocation checking is enabled to catch invalidated sessions
+    - Each user is rate limited with a token bucket keyed on their UID
 
     Args:
         __session: The Firebase session cookie value from the request.
@@ -54,6 +236,7 @@ async def get_current_user(
     Raises:
         HTTPException 503: If Firebase is not configured.
         HTTPException 401: If cookie is missing, invalid, or expired.
+        HTTPException 429: If the user is over their rate limit.
     """
     if not __session:
         raise HTTPException(
@@ -64,7 +247,6 @@ async def get_current_user(
     try:
         # Verify the session cookie and check if it's been revoked
         decoded_token = verify_session_cookie(__session, check_revoked=True)
-        return decoded_token
     except FirebaseNotConfiguredError:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
@@ -78,10 +260,88 @@ async def get_current_user(
             detail="Invalid or expired session",
         )
 
+    rate_limiter = get_user_rate_limiter()
+    if rate_limiter is not None:
+        wait = rate_limiter.check(decoded_token["uid"])
+        if wait:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too many requests",
+                headers={"Retry-After": str(math.ceil(wait))},
+            )
+    return decoded_token
+
+
+async def get_current_db_user(
+    current_user: Annotated[dict, Depends(get_current_user)],
+    user_repo: Annotated[
+        UserRepository, Depends(get_user_repository, scope="function")
+    ],
+) -> User:
+    """Dependency for resolving the authenticated user's local record.
+
+    The local record is created by GET /auth/me, which clients call right
+    after login.
+
+    Raises:
+        HTTPException 403: If the user has no local profile yet.
+    """
+    user = await user_repo.get_by_auth_subject("firebase", current_user["uid"])
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="User profile not found",
+        )
+    return user
+
+
+async def get_current_coach(
+    user: Annotated[User, Depends(get_current_db_user)],
+) -> User:
+    """Dependency for the authenticated user, who must hold the coach role.
+
+    Raises:
+        HTTPException 403: If the user is not a coach.
+    """
+    if COACH_ROLE not in user.roles:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Coach role required",
+        )
+    return user
+
 
 # Type aliases for cleaner route signatures
-SessionDep = Annotated[AsyncSession, Depends(get_session)]
-ItemRepositoryDep = Annotated[ItemRepository, Depends(get_item_repository)]
-ItemServiceDep = Annotated[ItemService, Depends(get_item_service)]
-UserRepositoryDep = Annotated[UserRepository, Depends(get_user_repository)]
+SessionDep = Annotated[AsyncSession, Depends(get_db_session, scope="function")]
+ItemRepositoryDep = Annotated[
+    ItemRepository, Depends(get_item_repository, scope="function")
+]
+ItemServiceDep = Annotated[ItemService, Depends(get_item_service, scope="function")]
+ItemImportServiceDep = Annotated[ItemImportService, Depends(get_item_import_service)]
+UserRepositoryDep = Annotated[
+    UserRepository, Depends(get_user_repository, scope="function")
+]
+CreditServiceDep = Annotated[
+    CreditService, Depends(get_credit_service, scope="function")
+]
+JobQueueDep = Annotated[JobQueue, Depends(get_job_queue, scope="function")]
+MediaServiceDep = Annotated[MediaService, Depends(get_media_service, scope="function")]
+MediaChunkServiceDep = Annotated[MediaChunkService, Depends(get_media_chunk_service)]
+ProgramServiceDep = Annotated[
+    ProgramService, Depends(get_program_service, scope="function")
+]
+ContentServiceDep = Annotated[
+    ContentService, Depends(get_content_service, scope="function")
+]
+AnnotationServiceDep = Annotated[
+    AnnotationService, Depends(get_annotation_service, scope="function")
+]
+ActivityLogServiceDep = Annotated[
+    ActivityLogService, Depends(get_activity_log_service, scope="function")
+]
+CoachServiceDep = Annotated[CoachService, Depends(get_coach_service, scope="function")]
+AutocompleteDep = Annotated[Autocomplete, Depends(get_autocomplete)]
+CoachRecommenderDep = Annotated[CoachRecommender, Depends(get_coach_recommender)]
 CurrentUserDep = Annotated[dict, Depends(get_current_user)]
+CurrentDbUserDep = Annotated[User, Depends(get_current_db_user)]
+CurrentCoachDep = Annotated[User, Depends(get_current_coach)]
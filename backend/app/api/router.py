@@ -1,12 +1,34 @@
 from fastapi import APIRouter
 
-from app.api.routes import auth_router, health_router, items_router
+from app.api.routes import (
+    activity_logs_router,
+    annotations_router,
+    auth_router,
+    autocomplete_router,
+    coaches_router,
+    content_router,
+    credits_router,
+    events_router,
+    health_router,
+    items_router,
+    media_router,
+    programs_router,
+)
 
 api_router = APIRouter()
 
 # Include all route modules
 api_router.include_router(items_router)
 api_router.include_router(auth_router)
+api_router.include_router(credits_router)
+api_router.include_router(media_router)
+api_router.include_router(programs_router)
+api_router.include_router(content_router)
+api_router.include_router(annotations_router)
+api_router.include_router(events_router)
+api_router.include_router(activity_logs_router)
+api_router.include_router(coaches_router)
+api_router.include_router(autocomplete_router)
 
 # Health router is mounted at root level, not under API prefix
 __all__ = ["api_router", "health_router"]
@@ -1,5 +1,27 @@
+from app.api.routes.activity_logs import router as activity_logs_router
+from app.api.routes.annotations import router as annotations_router
 from app.api.routes.auth import router as auth_router
+from app.api.routes.autocomplete import router as autocomplete_router
+from app.api.routes.coaches import router as coaches_router
+from app.api.routes.content import router as content_router
+from app.api.routes.credits import router as credits_router
+from app.api.routes.events import router as events_router
 from app.api.routes.health import router as health_router
 from app.api.routes.items import router as items_router
+from app.api.routes.media import router as media_router
+from app.api.routes.programs import router as programs_router
 
-__all__ = ["auth_router", "health_router", "items_router"]
+__all__ = [
+    "activity_logs_router",
+    "annotations_router",
+    "auth_router",
+    "autocomplete_router",
+    "coaches_router",
+    "content_router",
+    "credits_router",
+    "events_router",
+    "health_router",
+    "items_router",
+    "media_router",
+    "programs_router",
+]
@@ -0,0 +1,74 @@
+from datetime import date
+from uuid import UUID
+
+from fastapi import APIRouter, HTTPException, Query, status
+
+from app.api.deps import ActivityLogServiceDep, CurrentDbUserDep
+from app.core.admission import AdmissionControlRoute
+from app.schemas.activity_log import (
+    ActivityLogBatch,
+    ActivityLogBatchResult,
+    ActivityRollupResponse,
+    RollupPeriod,
+)
+
+router = APIRouter(
+    prefix="/activity-logs",
+    tags=["activity-logs"],
+    route_class=AdmissionControlRoute,
+)
+
+
+@router.post(
+    "",
+    response_model=ActivityLogBatchResult,
+    status_code=status.HTTP_201_CREATED,
+    summary="Log Activities",
+    description=(
+        "Record up to 1000 activity log entries at once, typically a whole "
+        "workout. Entries are append-only and are added to your daily and "
+        "weekly totals in the same transaction. Entries may date back to the "
+        "start of last month."
+    ),
+)
+async def log_activities(
+    data: ActivityLogBatch,
+    service: ActivityLogServiceDep,
+    user: CurrentDbUserDep,
+) -> ActivityLogBatchResult:
+    """Record a batch of activity log entries."""
+    try:
+        return await service.log_entries(user.id, data)
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail=str(exc),
+        )
+
+
+@router.get(
+    "/rollups",
+    response_model=list[ActivityRollupResponse],
+    summary="Get Activity Totals",
+    description=(
+        "Retrieve your precomputed per-day or per-week totals for the periods "
+        "starting between `start` and `end`, for progress charts."
+    ),
+)
+async def get_rollups(
+    service: ActivityLogServiceDep,
+    user: CurrentDbUserDep,
+    start: date = Query(..., description="First day, inclusive"),
+    end: date = Query(..., description="Last day, inclusive"),
+    period: RollupPeriod = Query(default=RollupPeriod.DAY),
+    activity_id: UUID | None = Query(default=None, description="Only this activity"),
+) -> list[ActivityRollupResponse]:
+    """Get daily or weekly activity totals."""
+    try:
+        rollups = await service.get_rollups(user.id, period, start, end, activity_id)
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail=str(exc),
+        )
+    return [ActivityRollupResponse.model_validate(rollup) for rollup in rollups]
@@ -0,0 +1,128 @@
+from uuid import UUID
+
+from fastapi import APIRouter, HTTPException, Query, status
+
+from app.api.deps import AnnotationServiceDep, CurrentDbUserDep
+from app.core.admission import AdmissionControlRoute
+from app.schemas.annotation import (
+    MAX_ANNOTATION_BATCH,
+    MAX_VIDEO_SECONDS,
+    VideoAnnotationBatch,
+    VideoAnnotationResponse,
+    VideoAnnotationUpdate,
+)
+
+router = APIRouter(
+    prefix="/media/{media_id}/annotations",
+    tags=["annotations"],
+    route_class=AdmissionControlRoute,
+)
+
+
+@router.get(
+    "",
+    response_model=list[VideoAnnotationResponse],
+    summary="List Annotations",
+    description=(
+        "Retrieve the annotations on screen at any point between `start` and "
+        "`end` (in seconds) of a video you may watch. Omit `end` to load the "
+        "rest of the video."
+    ),
+)
+async def list_annotations(
+    media_id: UUID,
+    service: AnnotationServiceDep,
+    user: CurrentDbUserDep,
+    start: float = Query(
+        default=0, ge=0, le=MAX_VIDEO_SECONDS, description="Window start in seconds"
+    ),
+    end: float | None = Query(
+        default=None, ge=0, le=MAX_VIDEO_SECONDS, description="Window end in seconds"
+    ),
+) -> list[VideoAnnotationResponse]:
+    """List annotations in a time window."""
+    annotations = await service.get_annotations(media_id, user.id, start, end)
+    if annotations is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Media with id '{media_id}' not found",
+        )
+    return annotations
+
+
+@router.post(
+    "",
+    response_model=list[VideoAnnotationResponse],
+    status_code=status.HTTP_201_CREATED,
+    summary="Save Annotations",
+    description=(
+        f"Save up to {MAX_ANNOTATION_BATCH} annotations drawn over a completed "
+        "video you may watch."
+    ),
+)
+async def create_annotations(
+    media_id: UUID,
+    data: VideoAnnotationBatch,
+    service: AnnotationServiceDep,
+    user: CurrentDbUserDep,
+) -> list[VideoAnnotationResponse]:
+    """Save a batch of annotations."""
+    annotations = await service.create_annotations(media_id, user.id, data)
+    if annotations is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Media with id '{media_id}' not found",
+        )
+    return annotations
+
+
+@router.patch(
+    "/{annotation_id}",
+    response_model=VideoAnnotationResponse,
+    summary="Update Annotation",
+    description="Update the label, timing or shapes of your annotation.",
+)
+async def update_annotation(
+    media_id: UUID,
+    annotation_id: UUID,
+    data: VideoAnnotationUpdate,
+    service: AnnotationServiceDep,
+    user: CurrentDbUserDep,
+) -> VideoAnnotationResponse:
+    """Update an annotation."""
+    try:
+        annotation = await service.update_annotation(
+            media_id, annotation_id, user.id, data
+        )
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail=str(exc),
+        )
+    if annotation is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Annotation with id '{annotation_id}' not found",
+        )
+    return annotation
+
+
+@router.delete(
+    "/{annotation_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Delete Annotation",
+    description="Delete your annotation.",
+)
+async def delete_annotation(
+    media_id: UUID,
+    annotation_id: UUID,
+    service: AnnotationServiceDep,
+    user: CurrentDbUserDep,
+) -> None:
+    """Delete an annotation."""
+    deleted = await service.delete_annotation(media_id, annotation_id, user.id)
+    if not deleted:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Annotation with id '{annotation_id}' not found",
+        )
@@ -14,13 +14,15 @@ Security design:
 
 from fastapi import APIRouter, HTTPException, Response, status
 
-from app.api.deps import CurrentUserDep, UserRepositoryDep
+from app.api.deps import CurrentUserDep, JobQueueDep, UserRepositoryDep
+from app.core.admission import AdmissionControlRoute
 from app.core.config import get_settings
 from app.core.firebase import (
     FirebaseNotConfiguredError,
     create_session_cookie,
     verify_id_token,
 )
+from app.core.query_stats import query_budget
 from app.schemas.user import (
     SessionLoginRequest,
     SessionLoginResponse,
@@ -28,7 +30,7 @@ from app.schemas.user import (
     UserResponse,
 )
 
-router = APIRouter(prefix="/auth", tags=["auth"])
+router = APIRouter(prefix="/auth", tags=["auth"], route_class=AdmissionControlRoute)
 
 # Cookie name must be __session for Firebase Hosting compatibility
 SESSION_COOKIE_NAME = "__session"
@@ -135,25 +137,46 @@ async def session_logout(response: Response) -> SessionLogoutResponse:
 
 
 @router.get("/me", response_model=UserResponse)
+@query_budget(4)
 async def get_me(
     current_user: CurrentUserDep,
     user_repo: UserRepositoryDep,
+    job_queue: JobQueueDep,
 ) -> UserResponse:
     """Get the current authenticated user's profile.
 
     This endpoint requires authentication via the session cookie.
-    It performs an upsert operation to ensure the local user record
-    is synchronized with Firebase (email, display name may have changed).
+    New users are created inline so the response has a local ID. For
+    existing users, changes to email or display name in Firebase are
+    synchronized by a background job rather than on the request path.
 
     Args:
         current_user: Decoded Firebase token from session cookie.
         user_repo: User repository for database operations.
+        job_queue: Job queue for deferring the profile sync.
 
     Returns:
         UserResponse with the user's local profile information.
     """
-    # Upsert user from Firebase token
-    # This creates the user if they don't exist, or updates their profile
-    user = await user_repo.upsert_from_firebase(current_user)
-
-    return UserResponse.model_validate(user)
+    user = await user_repo.get_by_auth_subject("firebase", current_user["uid"])
+    if user is None:
+        user = await user_repo.upsert_from_firebase(current_user)
+        return UserResponse.model_validate(user)
+
+    response = UserResponse.model_validate(user)
+    email = current_user.get("email", "")
+    display_name = current_user.get("name")
+    if user.email != email or (
+        display_name is not None and user.display_name != display_name
+    ):
+        await job_queue.enqueue(
+            "users.sync_profile",
+            {"uid": current_user["uid"], "email": email, "name": display_name},
+            # One pending sync per user, however often the page reloads
+            dedupe_key=current_user["uid"],
+        )
+        # Answer with the fresh claims while the sync is pending
+        response = response.model_copy(
+            update={"email": email, "display_name": display_name or user.display_name}
+        )
+    return response
@@ -0,0 +1,32 @@
+from fastapi import APIRouter, Query
+
+from app.api.deps import AutocompleteDep, CurrentUserDep
+from app.core.admission import AdmissionControlRoute
+from app.schemas.autocomplete import AutocompleteSuggestion
+from app.services.autocomplete import MAX_SUGGESTIONS
+
+router = APIRouter(
+    prefix="/autocomplete",
+    tags=["autocomplete"],
+    route_class=AdmissionControlRoute,
+)
+
+
+@router.get(
+    "",
+    response_model=list[AutocompleteSuggestion],
+    summary="Autocomplete Search",
+    description=(
+        "Suggest coach names, specialties and your own content titles with a "
+        "word starting with `q`, most popular first. Answered from memory, "
+        "without a database query, so it can be called on every keystroke."
+    ),
+)
+async def autocomplete(
+    autocomplete: AutocompleteDep,
+    current_user: CurrentUserDep,
+    q: str = Query(..., max_length=100, description="What has been typed so far"),
+    limit: int = Query(default=8, ge=1, le=MAX_SUGGESTIONS),
+) -> list[AutocompleteSuggestion]:
+    """Suggest search completions."""
+    return autocomplete.suggest(q, current_user["uid"], limit)
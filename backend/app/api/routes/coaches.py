@@ -0,0 +1,73 @@
+from fastapi import APIRouter, HTTPException, Query, status
+
+from app.api.deps import CoachRecommenderDep, CoachServiceDep, CurrentDbUserDep
+from app.core.admission import AdmissionControlRoute
+from app.schemas.coach import (
+    CoachProfileResponse,
+    CoachProfileUpdate,
+    CoachRecommendation,
+)
+
+router = APIRouter(
+    prefix="/coaches",
+    tags=["coaches"],
+    route_class=AdmissionControlRoute,
+)
+
+
+@router.get(
+    "/recommended",
+    response_model=list[CoachRecommendation],
+    summary="Recommended Coaches",
+    description=(
+        "Retrieve the coaches most similar to the ones you already train with, "
+        "by specialties, location, price and rating, best first. Served from "
+        "an index rebuilt in the background, so new profiles can take a few "
+        "minutes to appear."
+    ),
+)
+async def get_recommended_coaches(
+    recommender: CoachRecommenderDep,
+    user: CurrentDbUserDep,
+    limit: int = Query(default=10, ge=1, le=50),
+) -> list[CoachRecommendation]:
+    """Get coach recommendations for the current user."""
+    return recommender.recommend(user.id, limit)
+
+
+@router.get(
+    "/me/profile",
+    response_model=CoachProfileResponse,
+    summary="Get Coach Profile",
+    description="Retrieve your public coach profile.",
+)
+async def get_my_profile(
+    service: CoachServiceDep,
+    user: CurrentDbUserDep,
+) -> CoachProfileResponse:
+    """Get the current coach's profile."""
+    profile = await service.get_profile(user.id)
+    if profile is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Coach profile not found",
+        )
+    return profile
+
+
+@router.put(
+    "/me/profile",
+    response_model=CoachProfileResponse,
+    summary="Set Coach Profile",
+    description=(
+        "Create or replace your public coach profile. Rating and review "
+        "count come from student reviews and cannot be set."
+    ),
+)
+async def set_my_profile(
+    data: CoachProfileUpdate,
+    service: CoachServiceDep,
+    user: CurrentDbUserDep,
+) -> CoachProfileResponse:
+    """Create or replace the current coach's profile."""
+    return await service.set_profile(user.id, data)
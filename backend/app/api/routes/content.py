@@ -0,0 +1,274 @@
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import APIRouter, HTTPException, Query, status
+from pydantic import StringConstraints
+
+from app.api.deps import ContentServiceDep, CurrentDbUserDep
+from app.core.admission import AdmissionControlRoute
+from app.schemas.content import (
+    ContentFolderCreate,
+    ContentFolderResponse,
+    ContentFolderUpdate,
+    ContentItemCreate,
+    ContentItemResponse,
+    ContentItemUpdate,
+    ContentSearchResponse,
+    ContentTagMatch,
+)
+from app.services.content import ContentFolderError
+
+router = APIRouter(
+    prefix="/content", tags=["content"], route_class=AdmissionControlRoute
+)
+
+
+def _folder_not_found(folder_id: UUID) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail=f"Folder with id '{folder_id}' not found",
+    )
+
+
+def _item_not_found(item_id: UUID) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail=f"Content item with id '{item_id}' not found",
+    )
+
+
+def _invalid_folder(exc: ContentFolderError) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+        detail=str(exc),
+    )
+
+
+@router.get(
+    "/folders",
+    response_model=list[ContentFolderResponse],
+    summary="List Folders",
+    description=(
+        "Retrieve every folder in the current coach's library, ordered so "
+        "parents come before their children, with item counts."
+    ),
+)
+async def list_folders(
+    service: ContentServiceDep,
+    user: CurrentDbUserDep,
+) -> list[ContentFolderResponse]:
+    """List all folders with item counts."""
+    return await service.get_folders(user.id)
+
+
+@router.post(
+    "/folders",
+    response_model=ContentFolderResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Create Folder",
+    description="Create a folder at the top level or inside another folder.",
+)
+async def create_folder(
+    data: ContentFolderCreate,
+    service: ContentServiceDep,
+    user: CurrentDbUserDep,
+) -> ContentFolderResponse:
+    """Create a new folder."""
+    try:
+        folder = await service.create_folder(user.id, data)
+    except ContentFolderError as exc:
+        raise _invalid_folder(exc)
+    return ContentFolderResponse.model_validate(folder)
+
+
+@router.get(
+    "/folders/{folder_id}",
+    response_model=list[ContentFolderResponse],
+    summary="Get Folder Subtree",
+    description="Retrieve a folder and all of its descendants, with item counts.",
+)
+async def get_folder(
+    folder_id: UUID,
+    service: ContentServiceDep,
+    user: CurrentDbUserDep,
+) -> list[ContentFolderResponse]:
+    """Get a folder's subtree."""
+    folders = await service.get_folders(user.id, folder_id)
+    if folders is None:
+        raise _folder_not_found(folder_id)
+    return folders
+
+
+@router.patch(
+    "/folders/{folder_id}",
+    response_model=ContentFolderResponse,
+    summary="Update Folder",
+    description=(
+        "Rename or recolor a folder. Setting `parent_id` moves the folder "
+        "together with everything inside it."
+    ),
+)
+async def update_folder(
+    folder_id: UUID,
+    data: ContentFolderUpdate,
+    service: ContentServiceDep,
+    user: CurrentDbUserDep,
+) -> ContentFolderResponse:
+    """Update or move a folder."""
+    try:
+        folder = await service.update_folder(folder_id, user.id, data)
+    except ContentFolderError as exc:
+        raise _invalid_folder(exc)
+    if folder is None:
+        raise _folder_not_found(folder_id)
+    return folder
+
+
+@router.delete(
+    "/folders/{folder_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Delete Folder",
+    description=(
+        "Delete a folder and its subfolders. "
+        "Items inside them move to the library root."
+    ),
+)
+async def delete_folder(
+    folder_id: UUID,
+    service: ContentServiceDep,
+    user: CurrentDbUserDep,
+) -> None:
+    """Delete a folder subtree."""
+    deleted = await service.delete_folder(folder_id, user.id)
+    if not deleted:
+        raise _folder_not_found(folder_id)
+
+
+@router.get(
+    "/items",
+    response_model=list[ContentItemResponse],
+    summary="List Content",
+    description=(
+        "Retrieve content items, optionally only those in a folder. "
+        "With `recursive=true` items in all of its subfolders are included."
+    ),
+)
+async def list_items(
+    service: ContentServiceDep,
+    user: CurrentDbUserDep,
+    folder_id: UUID | None = Query(default=None, description="Filter by folder"),
+    recursive: bool = Query(default=False, description="Include subfolders"),
+    skip: int = Query(default=0, ge=0, description="Number of items to skip"),
+    limit: int = Query(default=100, ge=1, le=100, description="Max items to return"),
+) -> list[ContentItemResponse]:
+    """List content items."""
+    items = await service.get_items(
+        user.id, folder_id=folder_id, recursive=recursive, skip=skip, limit=limit
+    )
+    if items is None:
+        raise _folder_not_found(folder_id)
+    return [ContentItemResponse.model_validate(item) for item in items]
+
+
+@router.get(
+    "/search",
+    response_model=ContentSearchResponse,
+    summary="Search Content by Tags",
+    description=(
+        "Filter content by tags, e.g. `?tags=drills&tags=u12&match=all`, and get "
+        "the count of each tag across all matching items alongside the page."
+    ),
+)
+async def search_items(
+    service: ContentServiceDep,
+    user: CurrentDbUserDep,
+    tags: list[Annotated[str, StringConstraints(max_length=50)]] = Query(
+        default=[], max_length=20, description="Tags to match"
+    ),
+    match: ContentTagMatch = Query(
+        default=ContentTagMatch.ALL, description="Require all tags or any tag"
+    ),
+    skip: int = Query(default=0, ge=0, description="Number of items to skip"),
+    limit: int = Query(default=100, ge=1, le=100, description="Max items to return"),
+) -> ContentSearchResponse:
+    """Search content by tags with facet counts."""
+    return await service.search_items(
+        user.id, tags, match=match, skip=skip, limit=limit
+    )
+
+
+@router.post(
+    "/items",
+    response_model=ContentItemResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Create Content",
+    description="Add a video, image, document or link to the library.",
+)
+async def create_item(
+    data: ContentItemCreate,
+    service: ContentServiceDep,
+    user: CurrentDbUserDep,
+) -> ContentItemResponse:
+    """Create a content item."""
+    try:
+        item = await service.create_item(user.id, data)
+    except ContentFolderError as exc:
+        raise _invalid_folder(exc)
+    return ContentItemResponse.model_validate(item)
+
+
+@router.get(
+    "/items/{item_id}",
+    response_model=ContentItemResponse,
+    summary="Get Content",
+    description="Retrieve a single content item by its ID.",
+)
+async def get_item(
+    item_id: UUID,
+    service: ContentServiceDep,
+    user: CurrentDbUserDep,
+) -> ContentItemResponse:
+    """Get a content item by ID."""
+    item = await service.get_item(item_id, user.id)
+    if item is None:
+        raise _item_not_found(item_id)
+    return ContentItemResponse.model_validate(item)
+
+
+@router.patch(
+    "/items/{item_id}",
+    response_model=ContentItemResponse,
+    summary="Update Content",
+    description="Update a content item or move it to another folder.",
+)
+async def update_item(
+    item_id: UUID,
+    data: ContentItemUpdate,
+    service: ContentServiceDep,
+    user: CurrentDbUserDep,
+) -> ContentItemResponse:
+    """Update a content item."""
+    try:
+        item = await service.update_item(item_id, user.id, data)
+    except ContentFolderError as exc:
+        raise _invalid_folder(exc)
+    if item is None:
+        raise _item_not_found(item_id)
+    return ContentItemResponse.model_validate(item)
+
+
+@router.delete(
+    "/items/{item_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Delete Content",
+    description="Delete a content item.",
+)
+async def delete_item(
+    item_id: UUID,
+    service: ContentServiceDep,
+    user: CurrentDbUserDep,
+) -> None:
+    """Delete a content item."""
+    deleted = await service.delete_item(item_id, user.id)
+    if not deleted:
+        raise _item_not_found(item_id)
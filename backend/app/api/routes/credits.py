@@ -0,0 +1,57 @@
+from fastapi import APIRouter, HTTPException, status
+
+from app.api.deps import CreditServiceDep, CurrentDbUserDep
+from app.core.admission import AdmissionControlRoute
+from app.schemas.credit import (
+    CreditAccountResponse,
+    CreditLedgerEntryResponse,
+    CreditRedeemRequest,
+)
+from app.services.credit import InsufficientCreditsError
+
+router = APIRouter(
+    prefix="/credits", tags=["credits"], route_class=AdmissionControlRoute
+)
+
+
+@router.get(
+    "",
+    response_model=list[CreditAccountResponse],
+    summary="List Credit Balances",
+    description="Retrieve the current user's bundle credit balances.",
+)
+async def list_credits(
+    service: CreditServiceDep,
+    user: CurrentDbUserDep,
+) -> list[CreditAccountResponse]:
+    """List the current user's credit balances."""
+    accounts = await service.get_balances(user.id)
+    return [CreditAccountResponse.model_validate(account) for account in accounts]
+
+
+@router.post(
+    "/redeem",
+    response_model=CreditLedgerEntryResponse,
+    summary="Redeem Credits",
+    description="Redeem bundle credits. Fails with 409 if the balance is too low.",
+)
+async def redeem_credits(
+    data: CreditRedeemRequest,
+    service: CreditServiceDep,
+    user: CurrentDbUserDep,
+) -> CreditLedgerEntryResponse:
+    """Redeem credits from one of the current user's bundles."""
+    try:
+        entry = await service.redeem(
+            user.id,
+            data.coach_id,
+            data.service_id,
+            credits=data.amount,
+            reference=data.reference,
+        )
+    except InsufficientCreditsError:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Insufficient credits",
+        )
+    return CreditLedgerEntryResponse.model_validate(entry)
@@ -0,0 +1,74 @@
+"""Server-sent event stream of change notifications.
+
+Clients open ``GET /events?topics=items`` with an ``EventSource`` and get
+pushed a message whenever something they show changes, instead of polling.
+Each stream is also subscribed to the user's private ``user:<uid>`` topic.
+
+The stream authenticates from the session cookie alone and never touches
+the database, so thousands of idle streams hold no pooled connections.
+"""
+
+import asyncio
+import json
+from collections.abc import AsyncIterator
+from itertools import count
+
+from fastapi import APIRouter, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+
+from app.api.deps import CurrentUserDep
+from app.core.admission import AdmissionControlRoute
+from app.core.config import get_settings
+from app.services.events import PUBLIC_TOPICS, EventBroker, get_event_broker, user_topic
+
+router = APIRouter(prefix="/events", tags=["events"], route_class=AdmissionControlRoute)
+
+
+async def _stream(
+    broker: EventBroker, topics: set[str], heartbeat: float
+) -> AsyncIterator[str]:
+    # Ask the browser to wait a few seconds before reconnecting
+    yield "retry: 3000\n\n"
+    async with broker.subscribe(topics) as subscription:
+        for event_id in count(1):
+            try:
+                event = await asyncio.wait_for(subscription.get(), timeout=heartbeat)
+            except TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+            data = json.dumps({"topic": event.topic, **event.data})
+            yield f"id: {event_id}\nevent: {event.type}\ndata: {data}\n\n"
+
+
+@router.get(
+    "",
+    summary="Subscribe to Events",
+    description=(
+        "Open a `text/event-stream` of change notifications for the given topics "
+        f"({', '.join(sorted(PUBLIC_TOPICS))}) plus the current user's profile. "
+        "A `resync` event means notifications were missed and the client should "
+        "refetch."
+    ),
+    response_class=StreamingResponse,
+    responses={200: {"content": {"text/event-stream": {}}}},
+)
+async def stream_events(
+    current_user: CurrentUserDep,
+    topics: list[str] = Query(default=[], max_length=20, description="Topics"),
+) -> StreamingResponse:
+    """Stream change events as server-sent events."""
+    unknown = set(topics) - PUBLIC_TOPICS
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown topics: {', '.join(sorted(unknown))}",
+        )
+    return StreamingResponse(
+        _stream(
+            get_event_broker(),
+            {*topics, user_topic(current_user["uid"])},
+            get_settings().events_heartbeat_seconds,
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
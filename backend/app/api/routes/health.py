@@ -1,6 +1,12 @@
-from fastapi import APIRouter, status
+import time
+
+from fastapi import APIRouter, Response, status
 from pydantic import BaseModel
 
+from app.core.config import get_settings
+from app.core.loop_monitor import get_loop_monitor
+from app.core.readiness import get_readiness_probe
+
 router = APIRouter(tags=["health"])
 
 
@@ -11,6 +17,47 @@ class HealthResponse(BaseModel):
     message: str
 
 
+class ReadinessCheckResponse(BaseModel):
+    """Latest result of one readiness check."""
+
+    ok: bool
+    critical: bool
+    detail: str
+    age_seconds: float
+
+
+class ReadinessResponse(BaseModel):
+    """Readiness probe response schema."""
+
+    status: str
+    checks: dict[str, ReadinessCheckResponse]
+
+
+class BlockedCallResponse(BaseModel):
+    """A recent stall of the event loop."""
+
+    duration_ms: float
+    route: str | None
+    stack: list[str] | None = None
+
+
+class LoopMetricsResponse(BaseModel):
+    """Event-loop lag metrics schema."""
+
+    running: bool
+    interval_ms: float
+    threshold_ms: float
+    samples: int
+    lag_mean_ms: float
+    lag_p50_ms: float
+    lag_p99_ms: float
+    lag_max_ms: float
+    # Samples per bucket, keyed by the bucket's upper bound in ms
+    lag_buckets: dict[str, int]
+    blocked_total: int
+    recent_blocked: list[BlockedCallResponse]
+
+
 @router.get(
     "/health",
     response_model=HealthResponse,
@@ -24,3 +71,75 @@ async def health_check() -> HealthResponse:
         status="healthy",
         message="API is running",
     )
+
+
+@router.get(
+    "/ready",
+    response_model=ReadinessResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Readiness Check",
+    description=(
+        "Check whether this worker should receive traffic: database "
+        "reachable, connection pool and event loop not saturated. Reports "
+        "results cached by a background refresher and returns 503 when not "
+        "ready."
+    ),
+    responses={503: {"model": ReadinessResponse}},
+)
+async def readiness_check(response: Response) -> ReadinessResponse:
+    """Readiness check endpoint."""
+    probe = get_readiness_probe()
+    ready = probe.ready
+    if not ready:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    now = time.monotonic()
+    return ReadinessResponse(
+        status="ready" if ready else "not_ready",
+        checks={
+            name: ReadinessCheckResponse(
+                ok=result.ok,
+                critical=result.critical,
+                detail=result.detail,
+                age_seconds=round(now - result.checked_at, 3),
+            )
+            for name, result in probe.results.items()
+        },
+    )
+
+
+@router.get(
+    "/health/loop",
+    response_model=LoopMetricsResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Event Loop Metrics",
+    description=(
+        "Event-loop lag histogram and recent blocking calls for this worker. "
+        "Stacks are included in debug mode only."
+    ),
+)
+async def loop_metrics() -> LoopMetricsResponse:
+    """Report this worker's event-loop lag and blocking calls."""
+    monitor = get_loop_monitor()
+    histogram = monitor.histogram
+    bounds = [str(bound) for bound in histogram.bounds] + ["+Inf"]
+    show_stacks = get_settings().debug
+    return LoopMetricsResponse(
+        running=monitor.running,
+        interval_ms=monitor.interval * 1000,
+        threshold_ms=monitor.threshold * 1000,
+        samples=histogram.count,
+        lag_mean_ms=histogram.sum / histogram.count if histogram.count else 0.0,
+        lag_p50_ms=histogram.quantile(0.5),
+        lag_p99_ms=histogram.quantile(0.99),
+        lag_max_ms=histogram.max,
+        lag_buckets=dict(zip(bounds, histogram.counts, strict=True)),
+        blocked_total=monitor.blocked_total,
+        recent_blocked=[
+            BlockedCallResponse(
+                duration_ms=blocked.duration * 1000,
+                route=blocked.route,
+                stack=blocked.stack if show_stacks else None,
+            )
+            for blocked in reversed(monitor.blocked)
+        ],
+    )
@@ -1,11 +1,29 @@
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, Query, status
+from fastapi import APIRouter, Header, HTTPException, Query, Request, status
 
-from app.api.deps import ItemServiceDep
-from app.schemas.item import ItemCreate, ItemResponse, ItemUpdate
+from app.api.deps import ItemImportServiceDep, ItemServiceDep
+from app.core.admission import AdmissionControlRoute
+from app.schemas.item import ItemCreate, ItemImportResult, ItemResponse, ItemUpdate
+from app.services.item import ItemNameTakenError
+from app.services.item_import import (
+    ImportFormatError,
+    ImportTooLargeError,
+    UnsupportedImportTypeError,
+)
+
+router = APIRouter(prefix="/items", tags=["items"], route_class=AdmissionControlRoute)
+
+
+def _timed_out() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+        detail="Timed out loading items",
+    )
 
-router = APIRouter(prefix="/items", tags=["items"])
+
+def _name_taken(exc: ItemNameTakenError) -> HTTPException:
+    return HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc))
 
 
 @router.get(
@@ -21,8 +39,11 @@ async def list_items(
     active_only: bool = Query(default=False, description="Filter to active items only"),
 ) -> list[ItemResponse]:
     """List all items."""
-    items = await service.get_items(skip=skip, limit=limit, active_only=active_only)
-    return [ItemResponse.model_validate(item) for item in items]
+    try:
+        items = await service.get_items(skip=skip, limit=limit, active_only=active_only)
+    except TimeoutError:
+        raise _timed_out()
+    return items
 
 
 @router.get(
@@ -36,13 +57,16 @@ async def get_item(
     service: ItemServiceDep,
 ) -> ItemResponse:
     """Get a single item by ID."""
-    item = await service.get_item(item_id)
+    try:
+        item = await service.get_item(item_id)
+    except TimeoutError:
+        raise _timed_out()
     if item is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Item with id '{item_id}' not found",
         )
-    return ItemResponse.model_validate(item)
+    return item
 
 
 @router.post(
@@ -50,22 +74,63 @@ async def get_item(
     response_model=ItemResponse,
     status_code=status.HTTP_201_CREATED,
     summary="Create Item",
-    description="Create a new item.",
+    description="Create a new item. Fails with 409 if the name is taken.",
 )
 async def create_item(
     data: ItemCreate,
     service: ItemServiceDep,
 ) -> ItemResponse:
     """Create a new item."""
-    item = await service.create_item(data)
+    try:
+        item = await service.create_item(data)
+    except ItemNameTakenError as exc:
+        raise _name_taken(exc)
     return ItemResponse.model_validate(item)
 
 
+@router.post(
+    "/import",
+    response_model=ItemImportResult,
+    summary="Import Items",
+    description=(
+        "Create or update items in bulk from a streamed CSV (text/csv, with a "
+        "header row) or NDJSON (application/x-ndjson) body. Items are matched "
+        "by name. Invalid rows are skipped and reported."
+    ),
+)
+async def import_items(
+    request: Request,
+    service: ItemImportServiceDep,
+    content_type: str = Header(default=""),
+) -> ItemImportResult:
+    """Import items from an uploaded file."""
+    try:
+        return await service.import_items(request.stream(), content_type)
+    except UnsupportedImportTypeError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail=str(exc),
+        )
+    except ImportFormatError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(exc),
+        )
+    except ImportTooLargeError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+            detail=str(exc),
+        )
+
+
 @router.patch(
     "/{item_id}",
     response_model=ItemResponse,
     summary="Update Item",
-    description="Update an existing item. Only provided fields will be updated.",
+    description=(
+        "Update an existing item. Only provided fields will be updated. "
+        "Fails with 409 if the new name is taken."
+    ),
 )
 async def update_item(
     item_id: UUID,
@@ -73,7 +138,10 @@ async def update_item(
     service: ItemServiceDep,
 ) -> ItemResponse:
     """Update an existing item."""
-    item = await service.update_item(item_id, data)
+    try:
+        item = await service.update_item(item_id, data)
+    except ItemNameTakenError as exc:
+        raise _name_taken(exc)
     if item is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -0,0 +1,207 @@
+"""Media upload and streaming routes.
+
+Uploads follow a resumable protocol modelled on tus:
+1. POST /media/uploads - Declare filename, size and SHA-256, get an upload ID
+2. PATCH /media/uploads/{id} - Send the next chunk with an Upload-Offset header
+3. GET /media/uploads/{id} - After a dropped connection, read the offset to
+   resume from
+
+Completed files are served by GET /media/{id} with HTTP Range support so the
+video player can seek without downloading the whole file.
+"""
+
+from uuid import UUID
+
+from fastapi import APIRouter, Header, HTTPException, Request, Response, status
+from starlette.responses import FileResponse
+
+from app.api.deps import (
+    CurrentDbUserDep,
+    CurrentUserDep,
+    MediaChunkServiceDep,
+    MediaServiceDep,
+)
+from app.core.admission import AdmissionControlRoute
+from app.core.storage import (
+    UploadChecksumError,
+    UploadConflictError,
+    UploadNotFoundError,
+    UploadTooLargeError,
+)
+from app.schemas.media import MediaResponse, MediaUploadCreate, MediaUploadStatus
+
+router = APIRouter(prefix="/media", tags=["media"], route_class=AdmissionControlRoute)
+
+UPLOAD_OFFSET_HEADER = "Upload-Offset"
+
+
+class MediaFileResponse(FileResponse):
+    """FileResponse that reads files in larger chunks.
+
+    Starlette handles Range/If-Range parsing and uses the
+    ``http.response.pathsend`` extension for whole files when the server
+    offers it. Uvicorn, which serves this app, does not, so every response
+    is streamed in ``chunk_size`` reads; the larger chunk keeps the number
+    of reads and sends per range low while a video player scrubs.
+    """
+
+    chunk_size = 256 * 1024
+
+
+def _upload_headers(upload: MediaUploadStatus, response: Response) -> None:
+    response.headers[UPLOAD_OFFSET_HEADER] = str(upload.offset)
+    response.headers["Upload-Length"] = str(upload.size)
+
+
+@router.post(
+    "/uploads",
+    response_model=MediaResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Start Upload",
+    description="Declare a new file and receive an upload ID to send chunks to.",
+)
+async def create_upload(
+    data: MediaUploadCreate,
+    service: MediaServiceDep,
+    user: CurrentDbUserDep,
+) -> MediaResponse:
+    """Start a resumable upload."""
+    try:
+        media = await service.create_upload(user, data)
+    except UploadTooLargeError:
+        raise HTTPException(
+            status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+            detail="File exceeds the maximum upload size",
+        )
+    return MediaResponse.model_validate(media)
+
+
+@router.get(
+    "/uploads/{media_id}",
+    response_model=MediaUploadStatus,
+    summary="Get Upload Offset",
+    description="Get the offset to resume an interrupted upload from.",
+)
+async def get_upload(
+    media_id: UUID,
+    response: Response,
+    service: MediaServiceDep,
+    user: CurrentDbUserDep,
+) -> MediaUploadStatus:
+    """Get the current offset of an upload."""
+    try:
+        upload = await service.get_upload_status(media_id, user)
+    except UploadNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Upload with id '{media_id}' not found",
+        )
+    _upload_headers(upload, response)
+    return upload
+
+
+@router.patch(
+    "/uploads/{media_id}",
+    response_model=MediaUploadStatus,
+    summary="Upload Chunk",
+    description=(
+        "Append the request body to an upload at the given Upload-Offset. "
+        "An optional X-Chunk-SHA256 header is verified before the chunk is kept."
+    ),
+)
+async def upload_chunk(
+    media_id: UUID,
+    request: Request,
+    response: Response,
+    service: MediaChunkServiceDep,
+    current_user: CurrentUserDep,
+    upload_offset: int = Header(..., alias=UPLOAD_OFFSET_HEADER, ge=0),
+    chunk_sha256: str | None = Header(
+        default=None, alias="X-Chunk-SHA256", pattern=r"^[0-9a-fA-F]{64}$"
+    ),
+) -> MediaUploadStatus:
+    """Append a chunk to an upload."""
+    try:
+        upload = await service.append_chunk(
+            media_id,
+            current_user["uid"],
+            upload_offset,
+            request.stream(),
+            chunk_sha256=chunk_sha256,
+        )
+    except UploadNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Upload with id '{media_id}' not found",
+        )
+    except UploadConflictError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Upload offset does not match",
+            headers={UPLOAD_OFFSET_HEADER: str(exc.offset)},
+        )
+    except UploadTooLargeError:
+        raise HTTPException(
+            status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+            detail="Chunk exceeds the chunk limit or the declared file size",
+        )
+    except UploadChecksumError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(exc),
+        )
+    _upload_headers(upload, response)
+    return upload
+
+
+@router.api_route(
+    "/{media_id}",
+    methods=["GET", "HEAD"],
+    summary="Stream Media",
+    description=(
+        "Download a media file you uploaded, or one uploaded by a coach or "
+        "student you train with. Supports HTTP Range requests for seeking."
+    ),
+    response_class=MediaFileResponse,
+)
+async def get_media(
+    media_id: UUID,
+    service: MediaServiceDep,
+    user: CurrentDbUserDep,
+) -> MediaFileResponse:
+    """Stream a completed media file the user owns or trains with its owner."""
+    found = await service.get_file(media_id, user)
+    if found is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Media with id '{media_id}' not found",
+        )
+    media, path = found
+    # Completed files never change, so browsers may cache ranges freely
+    return MediaFileResponse(
+        path,
+        media_type=media.content_type,
+        filename=media.filename,
+        content_disposition_type="inline",
+        headers={"Cache-Control": "private, max-age=31536000, immutable"},
+    )
+
+
+@router.delete(
+    "/{media_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Delete Media",
+    description="Delete a media file or abandon an in-progress upload.",
+)
+async def delete_media(
+    media_id: UUID,
+    service: MediaServiceDep,
+    user: CurrentDbUserDep,
+) -> None:
+    """Delete a media file owned by the current user."""
+    deleted = await service.delete_media(media_id, user)
+    if not deleted:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Media with id '{media_id}' not found",
+        )
@@ -0,0 +1,225 @@
+from collections.abc import AsyncIterator
+from uuid import UUID
+
+from fastapi import APIRouter, Body, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+
+from app.api.deps import CurrentCoachDep, CurrentDbUserDep, ProgramServiceDep
+from app.core.admission import AdmissionControlRoute
+from app.schemas.program import (
+    JsonPatchOperation,
+    ProgramAssignmentCreate,
+    ProgramAssignmentProgress,
+    ProgramAssignmentResponse,
+    ProgramCreate,
+    ProgramResponse,
+    ProgramSummary,
+)
+from app.services.program import ProgramPatchError
+
+router = APIRouter(
+    prefix="/programs", tags=["programs"], route_class=AdmissionControlRoute
+)
+
+
+@router.get(
+    "",
+    response_model=list[ProgramSummary],
+    summary="List Programs",
+    description="Retrieve the current coach's programs without their week trees.",
+)
+async def list_programs(
+    service: ProgramServiceDep,
+    user: CurrentDbUserDep,
+    skip: int = Query(default=0, ge=0, description="Number of programs to skip"),
+    limit: int = Query(default=100, ge=1, le=100, description="Max programs to return"),
+) -> list[ProgramSummary]:
+    """List the current coach's programs."""
+    programs = await service.get_programs(user.id, skip=skip, limit=limit)
+    return [ProgramSummary.model_validate(program) for program in programs]
+
+
+@router.get(
+    "/{program_id}",
+    response_model=ProgramResponse,
+    summary="Get Program",
+    description="Retrieve a program with all of its weeks, days and activities.",
+)
+async def get_program(
+    program_id: UUID,
+    service: ProgramServiceDep,
+    user: CurrentDbUserDep,
+) -> ProgramResponse:
+    """Get a program tree by ID."""
+    program = await service.get_program(program_id, user.id)
+    if program is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Program with id '{program_id}' not found",
+        )
+    return program
+
+
+@router.post(
+    "",
+    response_model=ProgramResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Create Program",
+    description=(
+        "Create a new program, optionally with its full week tree. Requires "
+        "the coach role."
+    ),
+)
+async def create_program(
+    data: ProgramCreate,
+    service: ProgramServiceDep,
+    user: CurrentCoachDep,
+) -> ProgramResponse:
+    """Create a new program."""
+    return await service.create_program(user.id, data)
+
+
+@router.patch(
+    "/{program_id}",
+    response_model=ProgramResponse,
+    summary="Patch Program",
+    description=(
+        "Apply an RFC 6902 JSON Patch to the program tree, e.g. "
+        '`[{"op": "replace", "path": "/weeks/0/days/1/name", "value": "Recovery"}]`. '
+        "Only the nodes the patch changes are written."
+    ),
+)
+async def patch_program(
+    program_id: UUID,
+    service: ProgramServiceDep,
+    user: CurrentDbUserDep,
+    operations: list[JsonPatchOperation] = Body(
+        ..., media_type="application/json-patch+json"
+    ),
+) -> ProgramResponse:
+    """Apply a JSON Patch to a program."""
+    try:
+        program = await service.patch_program(
+            program_id,
+            user.id,
+            [op.model_dump(by_alias=True, exclude_unset=True) for op in operations],
+        )
+    except ProgramPatchError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail=str(exc),
+        )
+    if program is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Program with id '{program_id}' not found",
+        )
+    return program
+
+
+@router.delete(
+    "/{program_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Delete Program",
+    description="Delete a program and all of its weeks, days and activities.",
+)
+async def delete_program(
+    program_id: UUID,
+    service: ProgramServiceDep,
+    user: CurrentDbUserDep,
+) -> None:
+    """Delete a program by ID."""
+    deleted = await service.delete_program(program_id, user.id)
+    if not deleted:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Program with id '{program_id}' not found",
+        )
+
+
+async def _ndjson(
+    progress: AsyncIterator[ProgramAssignmentProgress],
+) -> AsyncIterator[str]:
+    async for report in progress:
+        yield report.model_dump_json() + "\n"
+
+
+@router.post(
+    "/{program_id}/assignments",
+    response_model=ProgramAssignmentProgress,
+    summary="Assign Program",
+    description=(
+        "Assign a program to many of your students at once. Requires the coach "
+        "role. Only students who hold credits with you are assigned, and "
+        "students who already have the program are skipped, so the request "
+        "is safe to repeat. With `stream=true` the response is NDJSON with one "
+        "progress line per batch."
+    ),
+    responses={200: {"content": {"application/x-ndjson": {}}}},
+)
+async def assign_program(
+    program_id: UUID,
+    data: ProgramAssignmentCreate,
+    service: ProgramServiceDep,
+    user: CurrentCoachDep,
+    stream: bool = Query(default=False, description="Stream per-batch progress"),
+) -> ProgramAssignmentProgress | StreamingResponse:
+    """Assign a program to a roster of students."""
+    progress = await service.assign_program(program_id, user.id, data)
+    if progress is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Program with id '{program_id}' not found",
+        )
+    if stream:
+        return StreamingResponse(_ndjson(progress), media_type="application/x-ndjson")
+    reports = [report async for report in progress]
+    return reports[-1]
+
+
+@router.get(
+    "/{program_id}/assignments",
+    response_model=list[ProgramAssignmentResponse],
+    summary="List Assignments",
+    description="Retrieve the students a program is assigned to.",
+)
+async def list_assignments(
+    program_id: UUID,
+    service: ProgramServiceDep,
+    user: CurrentDbUserDep,
+    skip: int = Query(default=0, ge=0, description="Number of assignments to skip"),
+    limit: int = Query(
+        default=100, ge=1, le=1000, description="Max assignments to return"
+    ),
+) -> list[ProgramAssignmentResponse]:
+    """List a program's assignments."""
+    assignments = await service.get_assignments(
+        program_id, user.id, skip=skip, limit=limit
+    )
+    if assignments is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Program with id '{program_id}' not found",
+        )
+    return [ProgramAssignmentResponse.model_validate(a) for a in assignments]
+
+
+@router.delete(
+    "/{program_id}/assignments/{student_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Unassign Program",
+    description="Remove a program from a student.",
+)
+async def unassign_program(
+    program_id: UUID,
+    student_id: UUID,
+    service: ProgramServiceDep,
+    user: CurrentDbUserDep,
+) -> None:
+    """Remove a student's assignment."""
+    deleted = await service.unassign_student(program_id, user.id, student_id)
+    if not deleted:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Assignment for student '{student_id}' not found",
+        )
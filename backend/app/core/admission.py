@@ -0,0 +1,197 @@
+"""Admission control and load shedding.
+
+When the database slows down, requests pile up waiting for a pooled
+connection until clients give up, and every request gets slow. Instead,
+each route admits a bounded number of requests at a time, and the process
+as a whole opens at most as many request sessions as the pool has
+connections. The rest wait in a short queue and are turned away with
+``503 Retry-After`` as soon as they have waited longer than the budget,
+so the requests that are admitted keep finishing quickly. A request that
+still has to wait for a connection, because a background task holds one,
+gets the same 503 once the pool timeout passes.
+
+Per-user rate limits use token buckets keyed on the authenticated UID and
+answer ``429 Retry-After`` once a user's burst allowance is spent.
+"""
+
+import asyncio
+import math
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Coroutine, Hashable
+from functools import lru_cache
+from typing import Any
+
+from fastapi import Request, Response
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+
+from app.core.config import get_settings
+
+
+class ServerBusyError(Exception):
+    """Raised when a request cannot be admitted within the queue budget."""
+
+
+class TokenBucket:
+    """Refills at ``rate`` tokens per second up to ``burst`` tokens."""
+
+    __slots__ = ("_burst", "_rate", "_tokens", "_updated")
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+
+    def take(self) -> float:
+        """Take a token.
+
+        Returns:
+            0 if a token was taken, otherwise seconds until one is available.
+        """
+        now = time.monotonic()
+        self._tokens = min(
+            self._burst, self._tokens + (now - self._updated) * self._rate
+        )
+        self._updated = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0.0
+        return (1 - self._tokens) / self._rate
+
+
+class RateLimiter:
+    """Token buckets per key, keeping at most ``max_keys`` recent keys."""
+
+    def __init__(self, rate: float, burst: int, max_keys: int = 100_000) -> None:
+        self._rate = rate
+        self._burst = burst
+        self._max_keys = max_keys
+        self._buckets: OrderedDict[Hashable, TokenBucket] = OrderedDict()
+        self.rejected = 0
+
+    def check(self, key: Hashable) -> float:
+        """Spend one request for a key.
+
+        Returns:
+            0 if the request is allowed, otherwise seconds to wait.
+        """
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = TokenBucket(self._rate, self._burst)
+            if len(self._buckets) > self._max_keys:
+                # The oldest key has been idle longest, so its bucket is full
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(key)
+        wait = bucket.take()
+        if wait:
+            self.rejected += 1
+        return wait
+
+
+class ConcurrencyLimiter:
+    """Admits ``limit`` holders at once with a bounded, time-limited queue."""
+
+    def __init__(self, limit: int, max_queue: int, max_wait: float) -> None:
+        self._semaphore = asyncio.Semaphore(limit)
+        self._max_queue = max_queue
+        self._max_wait = max_wait
+        self.waiting = 0
+        self.rejected = 0
+
+    async def acquire(self) -> bool:
+        """Wait for a slot.
+
+        Returns:
+            False, without waiting, if the queue is full, or once the wait
+            budget runs out.
+        """
+        if self._semaphore.locked() and self.waiting >= self._max_queue:
+            self.rejected += 1
+            return False
+        self.waiting += 1
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), self._max_wait)
+        except TimeoutError:
+            self.rejected += 1
+            return False
+        finally:
+            self.waiting -= 1
+        return True
+
+    def release(self) -> None:
+        """Free a slot."""
+        self._semaphore.release()
+
+
+def server_busy_response(_request: Request | None = None, _exc: Any = None) -> Response:
+    """503 response asking the client to retry once the queue has drained.
+
+    Also the exception handler for ``ServerBusyError`` and for pool timeouts.
+    """
+    retry_after = max(1, math.ceil(get_settings().admission_queue_timeout_seconds))
+    return JSONResponse(
+        {"detail": "Server is busy, please retry shortly"},
+        status_code=503,
+        headers={"Retry-After": str(retry_after)},
+    )
+
+
+class AdmissionControlRoute(APIRoute):
+    """API route that limits how many requests it handles at once.
+
+    Each route gets its own limiter, so a slow endpoint sheds its own load
+    without starving the others. A request holds its slot until the
+    response is ready to send, so streamed bodies such as media downloads
+    and event streams do not block other requests. Database sessions are
+    limited separately, process-wide, by ``get_session_limiter``.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+        settings = get_settings()
+        self.limiter = ConcurrencyLimiter(
+            settings.admission_route_concurrency,
+            settings.admission_queue_size,
+            settings.admission_queue_timeout_seconds,
+        )
+        limiter = self.limiter
+
+        async def admit(request: Request) -> Response:
+            if not await limiter.acquire():
+                return server_busy_response()
+            try:
+                return await handler(request)
+            finally:
+                limiter.release()
+
+        return admit
+
+
+@lru_cache
+def get_session_limiter() -> ConcurrencyLimiter:
+    """Get the process-wide limiter on request database sessions.
+
+    It has one slot per pooled connection, so admitted requests never queue
+    on the pool behind each other. A request holds its slot until its
+    session commits and closes, when the endpoint returns, so a streamed
+    response body holds no slot. Endpoints that read long request bodies
+    take no request session and open a short one once the body is in.
+    """
+    settings = get_settings()
+    return ConcurrencyLimiter(
+        settings.database_pool_size + settings.database_max_overflow,
+        settings.admission_queue_size,
+        settings.admission_queue_timeout_seconds,
+    )
+
+
+@lru_cache
+def get_user_rate_limiter() -> RateLimiter | None:
+    """Get the per-user rate limiter, or None if rate limiting is off."""
+    settings = get_settings()
+    if settings.rate_limit_per_second <= 0:
+        return None
+    return RateLimiter(settings.rate_limit_per_second, settings.rate_limit_burst)
@@ -0,0 +1,71 @@
+"""In-process caches.
+
+``GroupedCache`` keeps entries under a group key, such as a coach's ID, so
+that every cached result derived from one owner's data can be dropped at
+once when that data changes. Entries also expire after a TTL, which bounds
+staleness when a write lands on another worker process.
+"""
+
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+
+class GroupedCache:
+    """LRU cache with a TTL whose entries can be invalidated by group.
+
+    Not thread-safe; it is meant to be used from the event loop only.
+    """
+
+    def __init__(self, ttl: float, max_entries: int) -> None:
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._entries: OrderedDict[tuple[Hashable, Hashable], tuple[float, Any]] = (
+            OrderedDict()
+        )
+        self._groups: dict[Hashable, set[Hashable]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, group: Hashable, key: Hashable) -> Any | None:
+        """Get a cached value, or None if it is missing or expired."""
+        entry = self._entries.get((group, key))
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                self._remove((group, key))
+            self.misses += 1
+            return None
+        self._entries.move_to_end((group, key))
+        self.hits += 1
+        return entry[1]
+
+    def set(self, group: Hashable, key: Hashable, value: Any) -> None:
+        """Cache a value under a group."""
+        self._entries[(group, key)] = (time.monotonic() + self._ttl, value)
+        self._entries.move_to_end((group, key))
+        self._groups.setdefault(group, set()).add(key)
+        while len(self._entries) > self._max_entries:
+            self._remove(next(iter(self._entries)))
+
+    def invalidate(self, group: Hashable) -> None:
+        """Drop every entry in a group."""
+        for key in self._groups.pop(group, ()):
+            self._entries.pop((group, key), None)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
+        self._groups.clear()
+
+    def _remove(self, entry_key: tuple[Hashable, Hashable]) -> None:
+        group, key = entry_key
+        self._entries.pop(entry_key, None)
+        keys = self._groups.get(group)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._groups[group]
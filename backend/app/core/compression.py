@@ -0,0 +1,223 @@
+"""Negotiated response compression with a cache of compressed bodies.
+
+Buffered responses above a size threshold are compressed with brotli or
+gzip, whichever the client prefers (brotli only when the optional
+``brotli`` package is installed). Each buffered ``GET`` response gets a
+strong ETag derived from its body, so:
+
+- clients that send a matching ``If-None-Match`` get ``304 Not Modified``;
+- the compressed body is cached under its ETag and encoding, so a popular
+  payload that has not changed is compressed once, not on every request.
+
+Streamed responses (media, event streams) pass through untouched.
+"""
+
+import asyncio
+import gzip
+import hashlib
+from collections import OrderedDict
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+# Bodies this large are compressed in a worker thread
+_THREAD_THRESHOLD = 64 * 1024
+
+_COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+    "text/",
+)
+
+
+def _accepted_encodings(accept_encoding: str) -> dict[str, float]:
+    encodings = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if name:
+            encodings[name.strip().lower()] = quality
+    return encodings
+
+
+class CompressedBodyCache:
+    """LRU of compressed bodies keyed by (ETag, encoding), bounded in bytes."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[tuple[str, str], bytes] = OrderedDict()
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, etag: str, encoding: str) -> bytes | None:
+        """Get a compressed body, or None if it is not cached."""
+        body = self._entries.get((etag, encoding))
+        if body is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end((etag, encoding))
+        self.hits += 1
+        return body
+
+    def set(self, etag: str, encoding: str, body: bytes) -> None:
+        """Cache a compressed body, evicting the least recently used."""
+        if len(body) > self._max_bytes:
+            return
+        previous = self._entries.pop((etag, encoding), None)
+        if previous is not None:
+            self._size -= len(previous)
+        self._entries[(etag, encoding)] = body
+        self._size += len(body)
+        while self._size > self._max_bytes:
+            _key, evicted = self._entries.popitem(last=False)
+            self._size -= len(evicted)
+
+
+class CompressionMiddleware:
+    """Compresses, tags and caches buffered responses."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 5,
+        cache_max_bytes: int = 32 * 1024 * 1024,
+    ) -> None:
+        self.app = app
+        self._minimum_size = minimum_size
+        self._gzip_level = gzip_level
+        self._brotli_quality = brotli_quality
+        self.cache = CompressedBodyCache(cache_max_bytes)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = Headers(scope=scope)
+        is_get = scope["method"] == "GET"
+        encoding = self._choose_encoding(request_headers.get("accept-encoding", ""))
+        start: Message | None = None
+        passthrough = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start, passthrough
+            if message["type"] == "http.response.start":
+                start = message
+                return
+            if passthrough:
+                await send(message)
+                return
+            if message["type"] != "http.response.body" or message.get(
+                "more_body", False
+            ):
+                # Streaming response, or a file handed to the server with
+                # pathsend or zerocopysend: send it as is, after its start
+                passthrough = True
+                await send(start)
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            headers = MutableHeaders(raw=list(start["headers"]))
+            etag = None
+            if is_get and start["status"] == 200 and "etag" not in headers:
+                etag = hashlib.blake2b(body, digest_size=16).hexdigest()
+                if self._not_modified(request_headers, etag):
+                    await self._send_not_modified(send, headers, etag)
+                    return
+            compressible = (
+                len(body) >= self._minimum_size
+                and "content-encoding" not in headers
+                and headers.get("content-type", "").startswith(_COMPRESSIBLE_TYPES)
+            )
+            if compressible:
+                headers.add_vary_header("Accept-Encoding")
+            if not compressible or encoding is None:
+                if etag is not None:
+                    headers["ETag"] = f'"{etag}"'
+                await send({**start, "headers": headers.raw})
+                await send(message)
+                return
+
+            compressed = self.cache.get(etag, encoding) if etag else None
+            if compressed is None:
+                compressed = await self._compress(body, encoding)
+                if etag is not None:
+                    self.cache.set(etag, encoding, compressed)
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(compressed))
+            if etag is not None:
+                headers["ETag"] = f'"{etag}-{encoding}"'
+            await send({**start, "headers": headers.raw})
+            await send({"type": "http.response.body", "body": compressed})
+
+        await self.app(scope, receive, send_wrapper)
+
+    @staticmethod
+    def _choose_encoding(accept_encoding: str) -> str | None:
+        accepted = _accepted_encodings(accept_encoding)
+        candidates = ["br", "gzip"] if brotli is not None else ["gzip"]
+        best = None
+        best_quality = 0.0
+        for name in candidates:
+            quality = accepted.get(name, accepted.get("*", 0.0))
+            if quality > best_quality:
+                best, best_quality = name, quality
+        return best
+
+    @staticmethod
+    def _not_modified(request_headers: Headers, etag: str) -> bool:
+        if_none_match = request_headers.get("if-none-match")
+        if not if_none_match:
+            return False
+        for tag in if_none_match.split(","):
+            # Any encoding of the same body matches (weak comparison)
+            tag = tag.strip().removeprefix("W/").strip('"')
+            if tag == "*" or tag.split("-", 1)[0] == etag:
+                return True
+        return False
+
+    @staticmethod
+    async def _send_not_modified(
+        send: Send, headers: MutableHeaders, etag: str
+    ) -> None:
+        not_modified = MutableHeaders()
+        for name in ("cache-control", "vary", "content-location"):
+            if name in headers:
+                not_modified[name] = headers[name]
+        not_modified.add_vary_header("Accept-Encoding")
+        not_modified["ETag"] = f'"{etag}"'
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 304,
+                "headers": not_modified.raw,
+            }
+        )
+        await send({"type": "http.response.body", "body": b""})
+
+    async def _compress(self, body: bytes, encoding: str) -> bytes:
+        if len(body) >= _THREAD_THRESHOLD:
+            return await asyncio.to_thread(self._compress_sync, body, encoding)
+        return self._compress_sync(body, encoding)
+
+    def _compress_sync(self, body: bytes, encoding: str) -> bytes:
+        if encoding == "br":
+            return brotli.compress(body, quality=self._brotli_quality)
+        return gzip.compress(body, compresslevel=self._gzip_level, mtime=0)
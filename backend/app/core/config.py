@@ -1,5 +1,6 @@
 from functools import lru_cache
 from pathlib import Path
+from typing import Literal
 
 from pydantic import Field, PostgresDsn, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -25,7 +26,6 @@ class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
 
     model_config = SettingsConfigDict(
-        env_file=_find_env_file(),
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="ignore",
@@ -42,6 +42,26 @@ class Settings(BaseSettings):
         ...,
         description="PostgreSQL connection URL",
     )
+    database_pool_size: int = Field(
+        default=5,
+        description="Connections each worker keeps in its pool",
+    )
+    database_max_overflow: int = Field(
+        default=10,
+        description="Extra connections a worker may open above the pool size",
+    )
+    database_pool_timeout_seconds: float = Field(
+        default=2.0,
+        description="Longest a checkout waits for a pooled connection before failing",
+    )
+    partition_range_ahead: int = Field(
+        default=3,
+        description="Intervals ahead to create range partitions for",
+    )
+    partition_maintain_interval_seconds: float = Field(
+        default=3600.0,
+        description="Seconds between runs of the partitions.maintain job",
+    )
 
     # Firebase Authentication
     # These are required for Firebase Admin SDK initialization
@@ -82,6 +102,16 @@ class Settings(BaseSettings):
         description="Number of days before session cookie expires",
     )
 
+    # Bundle credits
+    credit_snapshot_min_tail: int = Field(
+        default=50,
+        description="Ledger entries since the last snapshot before a new one is taken",
+    )
+    credit_snapshot_interval_seconds: float = Field(
+        default=3600.0,
+        description="Seconds between runs of the credits.snapshot job",
+    )
+
     @field_validator("database_url", mode="before")
     @classmethod
     def validate_database_url(cls, v: str) -> str:
@@ -102,14 +132,264 @@ class Settings(BaseSettings):
         """Get CORS origins as a list."""
         if not self.cors_origins_str:
             return ["http://localhost:3000"]
-        return [origin.strip() for origin in self.cors_origins_str.split(",") if origin.strip()]
+        return [
+            origin.strip()
+            for origin in self.cors_origins_str.split(",")
+            if origin.strip()
+        ]
+
+    # Media storage
+    media_root: str = Field(
+        default="media",
+        description="Directory where uploaded media files are stored",
+    )
+    media_max_upload_bytes: int = Field(
+        default=5 * 1024 * 1024 * 1024,
+        description="Maximum size of a single uploaded file in bytes",
+    )
+    media_max_chunk_bytes: int = Field(
+        default=64 * 1024 * 1024,
+        description="Maximum size of a single upload chunk in bytes",
+    )
+
+    # Item import
+    item_import_max_bytes: int = Field(
+        default=512 * 1024 * 1024,
+        description="Maximum size of an item import upload in bytes",
+    )
+    item_import_chunk_rows: int = Field(
+        default=1000,
+        description="Rows validated per batch before yielding to other requests",
+    )
+    item_import_max_errors: int = Field(
+        default=100,
+        description="Invalid rows reported individually per import",
+    )
+
+    # Background jobs
+    job_worker_in_process: bool = Field(
+        default=False,
+        description="Run a job worker inside the API process",
+    )
+    job_batch_size: int = Field(
+        default=4,
+        description="Maximum jobs a worker claims per poll",
+    )
+    job_poll_interval_seconds: float = Field(
+        default=1.0,
+        description="Seconds a worker waits between polls when the queue is empty",
+    )
+    job_max_attempts: int = Field(
+        default=5,
+        description="Default attempts before a job is marked failed",
+    )
+    job_retry_backoff_seconds: float = Field(
+        default=5.0,
+        description="Base delay for exponential retry backoff",
+    )
+    job_retry_backoff_max_seconds: float = Field(
+        default=3600.0,
+        description="Upper bound on the retry backoff delay",
+    )
+    job_lock_timeout_seconds: int = Field(
+        default=300,
+        description="Seconds after which a running job is assumed abandoned",
+    )
+    job_metrics_interval_seconds: float = Field(
+        default=60.0,
+        description="Seconds between worker throughput log lines",
+    )
+
+    # Admission control
+    admission_route_concurrency: int = Field(
+        default=8,
+        description="Requests each route handles at once before queueing",
+    )
+    admission_queue_size: int = Field(
+        default=32,
+        description="Requests that may queue per route before being rejected",
+    )
+    admission_queue_timeout_seconds: float = Field(
+        default=0.5,
+        description="Longest a request queues before it is rejected with 503",
+    )
+    rate_limit_per_second: float = Field(
+        default=10.0,
+        description="Sustained requests per second per user (0 disables)",
+    )
+    rate_limit_burst: int = Field(
+        default=40,
+        description="Requests a user may burst above the sustained rate",
+    )
+
+    # Response compression
+    compression_minimum_size: int = Field(
+        default=1024,
+        description="Smallest response body in bytes worth compressing",
+    )
+    compression_gzip_level: int = Field(
+        default=6,
+        ge=1,
+        le=9,
+        description="gzip compression level (1 fastest, 9 smallest)",
+    )
+    compression_brotli_quality: int = Field(
+        default=5,
+        ge=0,
+        le=11,
+        description="Brotli quality when the brotli package is installed",
+    )
+    compression_cache_max_bytes: int = Field(
+        default=32 * 1024 * 1024,
+        description="Memory for compressed bodies cached by ETag",
+    )
+
+    # Request coalescing
+    coalesce_timeout_seconds: float = Field(
+        default=10.0,
+        description="Longest a caller waits on a shared in-flight read",
+    )
+
+    # Cache invalidation
+    cache_invalidation_backend: Literal["postgres", "memory"] = Field(
+        default="postgres",
+        description="Transport for cross-worker cache invalidation (memory for tests)",
+    )
+    cache_invalidation_max_keys: int = Field(
+        default=500,
+        description="Keys per namespace in one commit before the namespace is flushed",
+    )
+
+    # Content library
+    content_facet_cache_ttl_seconds: float = Field(
+        default=60.0,
+        description="Seconds a coach's cached tag facet counts stay valid",
+    )
+    content_facet_cache_max_entries: int = Field(
+        default=10_000,
+        description="Maximum cached tag facet results across all coaches",
+    )
+
+    # Real-time events
+    events_queue_size: int = Field(
+        default=100,
+        description="Events buffered per subscriber before it is told to resync",
+    )
+    events_heartbeat_seconds: float = Field(
+        default=15.0,
+        description="Seconds between keep-alive comments on idle event streams",
+    )
+
+    # Programs
+    program_assignment_batch_size: int = Field(
+        default=1000,
+        description="Students assigned per INSERT when assigning a program",
+    )
+
+    # Event loop monitoring
+    loop_monitor_enabled: bool = Field(
+        default=True,
+        description="Measure event-loop lag and capture blocking calls",
+    )
+    loop_monitor_interval_seconds: float = Field(
+        default=0.1,
+        gt=0,
+        description="Seconds between event-loop lag samples",
+    )
+    loop_monitor_block_threshold_seconds: float = Field(
+        default=0.1,
+        gt=0,
+        description="Stall after which the blocking call's stack is captured",
+    )
+    loop_monitor_strict: bool = Field(
+        default=False,
+        description="Raise BlockingCallError from requests that block the loop (tests)",
+    )
+    loop_monitor_max_blocked: int = Field(
+        default=50,
+        description="Recent blocking calls kept for the metrics endpoint",
+    )
+
+    # Query instrumentation
+    query_stats_enabled: bool = Field(
+        default=True,
+        description="Count SQL statements per request and check query budgets",
+    )
+    query_repeat_threshold: int = Field(
+        default=5,
+        description="Runs of one statement shape in a request logged as a likely N+1",
+    )
+    query_budget_strict: bool = Field(
+        default=False,
+        description="Raise QueryBudgetExceeded from routes over budget (tests)",
+    )
+
+    # Readiness
+    readiness_interval_seconds: float = Field(
+        default=5.0,
+        gt=0,
+        description="Seconds between background readiness checks",
+    )
+    readiness_check_timeout_seconds: float = Field(
+        default=2.0,
+        description="Longest a single readiness check may take before it fails",
+    )
+    readiness_max_pool_utilization: float = Field(
+        default=0.9,
+        description="Share of pool connections in use above which a worker is not ready",
+    )
+    readiness_max_loop_lag_seconds: float = Field(
+        default=0.5,
+        description="Event-loop lag between checks above which a worker is not ready",
+    )
+
+    # Recommendations
+    recommendation_refresh_seconds: float = Field(
+        default=300.0,
+        gt=0,
+        description="Seconds between rebuilds of the coach recommendation index",
+    )
+
+    # Autocomplete
+    autocomplete_cache_max_prefixes: int = Field(
+        default=10000,
+        description="Search prefixes whose best suggestions each worker keeps cached",
+    )
 
     # Server
     host: str = "0.0.0.0"
     port: int = 8000
+    server_workers: int = Field(
+        default=0,
+        description="Worker processes for python -m app.server (0 = one per CPU)",
+    )
+    server_backlog: int = Field(
+        default=2048,
+        description="Pending connections the listening socket queues",
+    )
+    server_max_requests: int = Field(
+        default=0,
+        description="Requests a worker serves before it is replaced (0 = never)",
+    )
+    server_max_requests_jitter: int = Field(
+        default=0,
+        description="Random extra requests so workers do not restart together",
+    )
+    server_graceful_timeout: float = Field(
+        default=30.0,
+        description="Seconds workers get to finish in-flight requests on shutdown",
+    )
+    server_preload: bool = Field(
+        default=False,
+        description="Import the app once in the supervisor before forking workers",
+    )
 
 
 @lru_cache
 def get_settings() -> Settings:
-    """Get cached settings instance."""
-    return Settings()
+    """Get cached settings instance.
+
+    The .env file is looked up here, on first use, rather than when the
+    module is imported.
+    """
+    return Settings(_env_file=_find_env_file())
@@ -3,13 +3,27 @@
 This module handles the initialization of Firebase Admin SDK with credentials
 loaded from environment variables. The initialization is idempotent - if the
 SDK is already initialized, it will return the existing app instance.
+
+The SDK takes a noticeable share of startup time to import, so it is only
+imported the first time a token or cookie is handled.
 """
 
-import firebase_admin
-from firebase_admin import auth, credentials
+import re
+import time
+from collections.abc import Iterator, Mapping
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING
 
 from app.core.config import get_settings
 
+if TYPE_CHECKING:
+    import firebase_admin
+
+# Public keys Firebase signs session cookies with
+SESSION_COOKIE_KEYS_URL = (
+    "https://www.googleapis.com/identitytoolkit/v3/relyingparty/publicKeys"
+)
+
 
 class FirebaseNotConfiguredError(Exception):
     """Raised when Firebase credentials are not configured."""
@@ -21,7 +35,7 @@ class FirebaseNotConfiguredError(Exception):
         )
 
 
-def get_firebase_app() -> firebase_admin.App:
+def get_firebase_app() -> "firebase_admin.App":
     """Get or initialize the Firebase Admin app.
 
     Returns the existing Firebase app if already initialized,
@@ -33,6 +47,9 @@ def get_firebase_app() -> firebase_admin.App:
     Raises:
         FirebaseNotConfiguredError: If Firebase credentials are not set.
     """
+    import firebase_admin
+    from firebase_admin import credentials
+
     # Check if Firebase is already initialized
     try:
         return firebase_admin.get_app()
@@ -81,6 +98,8 @@ def verify_id_token(id_token: str) -> dict:
         firebase_admin.auth.ExpiredIdTokenError: If the token has expired.
         firebase_admin.auth.RevokedIdTokenError: If the token has been revoked.
     """
+    from firebase_admin import auth
+
     # Ensure Firebase is initialized
     get_firebase_app()
     return auth.verify_id_token(id_token)
@@ -102,6 +121,8 @@ def create_session_cookie(id_token: str, expires_in_seconds: int) -> str:
     Raises:
         firebase_admin.auth.InvalidIdTokenError: If the ID token is invalid.
     """
+    from firebase_admin import auth
+
     # Ensure Firebase is initialized
     get_firebase_app()
     return auth.create_session_cookie(id_token, expires_in=expires_in_seconds)
@@ -122,6 +143,80 @@ def verify_session_cookie(session_cookie: str, check_revoked: bool = True) -> di
         firebase_admin.auth.ExpiredSessionCookieError: If the cookie has expired.
         firebase_admin.auth.RevokedSessionCookieError: If the cookie was revoked.
     """
+    from firebase_admin import auth
+
     # Ensure Firebase is initialized
     get_firebase_app()
     return auth.verify_session_cookie(session_cookie, check_revoked=check_revoked)
+
+
+def list_user_pages(
+    page_size: int = 1000,
+) -> Iterator[list[tuple[str, str, str | None]]]:
+    """Page through every enabled user of the Firebase project.
+
+    Each page is fetched with a blocking HTTP call when the iterator is
+    advanced, so advance it from a thread.
+
+    Args:
+        page_size: Users per page (at most 1000).
+
+    Yields:
+        The (uid, email, display name) of each enabled user on a page.
+        Users without an email get an empty one, as on sign-in.
+
+    Raises:
+        FirebaseNotConfiguredError: If Firebase credentials are not set.
+    """
+    from firebase_admin import auth
+
+    app = get_firebase_app()
+    page = auth.list_users(max_results=page_size, app=app)
+    while page is not None:
+        yield [
+            (user.uid, user.email or "", user.display_name)
+            for user in page.users
+            if not user.disabled
+        ]
+        page = page.get_next_page()
+
+
+def fetch_session_cookie_keys(timeout: float | None = None) -> float:
+    """Fetch the public keys that sign session cookies.
+
+    Checks that Google serves the keys session cookies are verified with.
+    The SDK keeps its own cached copy, which this neither reads nor fills.
+    This makes a blocking HTTP call, so call it from a thread.
+
+    Args:
+        timeout: Seconds to wait for Google.
+
+    Returns:
+        float: Seconds until the fetched keys expire.
+
+    Raises:
+        FirebaseNotConfiguredError: If Firebase credentials are not set.
+        google.auth.exceptions.TransportError: If the keys cannot be fetched.
+        RuntimeError: If Google answers with an error status.
+    """
+    import requests
+    from google.auth.transport.requests import Request
+
+    if not get_settings().firebase_configured:
+        raise FirebaseNotConfiguredError()
+    with requests.Session() as session:
+        response = Request(session)(SESSION_COOKIE_KEYS_URL, timeout=timeout)
+    if response.status != 200:
+        raise RuntimeError(f"Fetching session cookie keys returned {response.status}")
+    return _seconds_until_expiry(response.headers)
+
+
+def _seconds_until_expiry(headers: Mapping[str, str]) -> float:
+    match = re.search(r"max-age=(\d+)", headers.get("cache-control", ""))
+    if match is None:
+        return 0.0
+    try:
+        fetched_at = parsedate_to_datetime(headers["date"]).timestamp()
+    except (KeyError, TypeError, ValueError):
+        fetched_at = time.time()
+    return max(0.0, fetched_at + int(match.group(1)) - time.time())
@@ -0,0 +1,271 @@
+"""Cross-worker cache invalidation.
+
+Each uvicorn worker keeps its own in-process caches, so a write served by
+one worker must evict the matching entries in every other worker too.
+
+Writers call ``invalidate(session, namespace, key)`` while their
+transaction is open. Keys are collected on the session, deduplicated per
+namespace, and sent as one batch when the transaction commits; nothing is
+sent on rollback. The local worker evicts right after commit, and other
+workers evict as soon as the batch reaches them.
+
+With the Postgres backend the batch is a ``pg_notify`` issued just before
+COMMIT, so Postgres itself guarantees it is delivered if, and only if, the
+write lands. The in-memory backend delivers between buses in one process
+and is meant for tests.
+"""
+
+import asyncio
+import json
+import logging
+from collections.abc import Callable, Iterator
+from functools import lru_cache
+from typing import Any
+from uuid import uuid4
+
+import asyncpg
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.db.session import asyncpg_connect_args
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "velo_invalidate"
+
+# Key meaning "every entry in the namespace"
+ALL = "*"
+
+# Postgres rejects NOTIFY payloads of 8000 bytes or more
+_CHUNK_BYTES = 7800
+
+_PENDING = "pending_invalidations"
+_COMMITTING = "committing_invalidations"
+
+Handler = Callable[[frozenset[str]], None]
+Batch = dict[str, list[str]]
+
+
+class InvalidationBackend:
+    """Transport that carries invalidation batches between workers."""
+
+    def send(self, session: Session, payloads: list[str]) -> None:
+        """Send payloads from inside the committing transaction."""
+
+    def sent(self, payloads: list[str]) -> None:
+        """Send payloads after the transaction has committed."""
+
+    async def start(self, receive: Callable[[str], None]) -> None:
+        """Start delivering payloads from other workers to ``receive``."""
+
+    async def close(self) -> None:
+        """Stop receiving."""
+
+
+class MemoryInvalidationBackend(InvalidationBackend):
+    """Delivers batches to every other backend sharing the same channel."""
+
+    def __init__(self, channel: list[Callable[[str], None]] | None = None) -> None:
+        self._channel = channel if channel is not None else []
+        self._receive: Callable[[str], None] | None = None
+
+    def sent(self, payloads: list[str]) -> None:
+        for receive in list(self._channel):
+            for payload in payloads:
+                receive(payload)
+
+    async def start(self, receive: Callable[[str], None]) -> None:
+        self._receive = receive
+        self._channel.append(receive)
+
+    async def close(self) -> None:
+        if self._receive in self._channel:
+            self._channel.remove(self._receive)
+        self._receive = None
+
+
+class PostgresInvalidationBackend(InvalidationBackend):
+    """Sends batches with NOTIFY and receives them on one LISTEN connection."""
+
+    def __init__(self, connect_args: dict[str, Any]) -> None:
+        self._connect_args = connect_args
+        self._connection: asyncpg.Connection | None = None
+        self._receive: Callable[[str], None] | None = None
+        self._reconnect_task: asyncio.Task | None = None
+        self._closed = False
+
+    def send(self, session: Session, payloads: list[str]) -> None:
+        # Runs in a sync session event; the asyncio extension lets it do I/O
+        for payload in payloads:
+            session.execute(select(func.pg_notify(CHANNEL, payload)))
+
+    async def start(self, receive: Callable[[str], None]) -> None:
+        self._receive = receive
+        self._closed = False
+        connection = await asyncpg.connect(**self._connect_args)
+        await connection.add_listener(
+            CHANNEL, lambda _conn, _pid, _channel, payload: receive(payload)
+        )
+        connection.add_termination_listener(self._on_terminated)
+        self._connection = connection
+
+    async def close(self) -> None:
+        self._closed = True
+        if self._connection is not None and not self._connection.is_closed():
+            await self._connection.close()
+        self._connection = None
+
+    def _on_terminated(self, _conn: Any) -> None:
+        if self._closed:
+            return
+        logger.warning("Cache invalidation listener lost; reconnecting")
+        self._reconnect_task = asyncio.get_running_loop().create_task(self._reconnect())
+
+    async def _reconnect(self) -> None:
+        delay = 0.5
+        while not self._closed and self._receive is not None:
+            try:
+                await self.start(self._receive)
+            except (OSError, asyncpg.PostgresError):
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 30.0)
+                continue
+            # Anything sent while disconnected was missed
+            self._receive(json.dumps({"origin": None, "keys": {ALL: [ALL]}}))
+            return
+
+
+class InvalidationBus:
+    """Routes invalidated keys to the caches subscribed to their namespace."""
+
+    def __init__(self, backend: InvalidationBackend, max_keys: int = 500) -> None:
+        self.backend = backend
+        self._max_keys = max_keys
+        self._origin = uuid4().hex
+        self._handlers: dict[str, list[Handler]] = {}
+        self.sent = 0
+        self.received = 0
+
+    def subscribe(self, namespace: str, handler: Handler) -> None:
+        """Call ``handler`` with the keys invalidated in a namespace.
+
+        The keys may contain ``ALL``, meaning the whole namespace is stale.
+        """
+        self._handlers.setdefault(namespace, []).append(handler)
+
+    def invalidate(self, session: AsyncSession, namespace: str, *keys: Any) -> None:
+        """Queue keys for eviction everywhere once the session commits."""
+        pending = session.sync_session.info.setdefault(_PENDING, {})
+        pending.setdefault(namespace, set()).update(str(key) for key in keys)
+
+    async def start(self) -> None:
+        """Start receiving invalidations from other workers."""
+        await self.backend.start(self._receive)
+
+    async def close(self) -> None:
+        """Stop receiving invalidations."""
+        await self.backend.close()
+
+    def dispatch(self, batch: Batch) -> None:
+        """Evict the keys of a batch from local caches."""
+        if ALL in batch:
+            batch = {namespace: [ALL] for namespace in self._handlers}
+        for namespace, keys in batch.items():
+            frozen = frozenset(keys)
+            for handler in self._handlers.get(namespace, ()):
+                try:
+                    handler(frozen)
+                except Exception:
+                    logger.exception("Cache invalidation handler failed")
+
+    def _prepare(self, pending: dict[str, set[str]]) -> tuple[Batch, list[str]]:
+        # Bulk writes collapse into one namespace-wide flush per namespace
+        batch = {
+            namespace: [ALL] if len(keys) > self._max_keys else sorted(keys)
+            for namespace, keys in pending.items()
+        }
+        payloads = [
+            json.dumps({"origin": self._origin, "keys": chunk})
+            for chunk in _chunks(batch)
+        ]
+        self.sent += len(payloads)
+        return batch, payloads
+
+    def _receive(self, payload: str) -> None:
+        try:
+            message = json.loads(payload)
+            origin, batch = message["origin"], message["keys"]
+        except (TypeError, ValueError, KeyError):
+            logger.warning("Ignoring malformed invalidation payload: %r", payload)
+            return
+        if origin == self._origin:
+            return
+        self.received += 1
+        self.dispatch(batch)
+
+
+def _chunks(batch: Batch) -> Iterator[Batch]:
+    """Split a batch into pieces that each fit in one NOTIFY payload."""
+    chunk: Batch = {}
+    size = 0
+    for namespace, keys in batch.items():
+        for key in keys:
+            cost = len(json.dumps(key)) + 2
+            if namespace not in chunk:
+                cost += len(json.dumps(namespace)) + 6
+            if chunk and size + cost > _CHUNK_BYTES:
+                yield chunk
+                chunk = {}
+                size = 0
+                cost = len(json.dumps(key)) + len(json.dumps(namespace)) + 8
+            chunk.setdefault(namespace, []).append(key)
+            size += cost
+    if chunk:
+        yield chunk
+
+
+@event.listens_for(Session, "before_commit")
+def _send_pending(session: Session) -> None:
+    pending = session.info.pop(_PENDING, None)
+    if not pending:
+        return
+    bus = get_invalidation_bus()
+    batch, payloads = bus._prepare(pending)
+    session.info[_COMMITTING] = (batch, payloads)
+    bus.backend.send(session, payloads)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_committed(session: Session) -> None:
+    committed = session.info.pop(_COMMITTING, None)
+    if committed is None:
+        return
+    batch, payloads = committed
+    bus = get_invalidation_bus()
+    bus.dispatch(batch)
+    bus.backend.sent(payloads)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_pending(session: Session, _previous_transaction: Any) -> None:
+    session.info.pop(_PENDING, None)
+    session.info.pop(_COMMITTING, None)
+
+
+@lru_cache
+def get_invalidation_bus() -> InvalidationBus:
+    """Get this process's cache invalidation bus."""
+    settings = get_settings()
+    backend: InvalidationBackend
+    if settings.cache_invalidation_backend == "memory":
+        backend = MemoryInvalidationBackend()
+    else:
+        backend = PostgresInvalidationBackend(asyncpg_connect_args())
+    return InvalidationBus(backend, max_keys=settings.cache_invalidation_max_keys)
+
+
+def invalidate(session: AsyncSession, namespace: str, *keys: Any) -> None:
+    """Queue cache keys for eviction on every worker after ``session`` commits."""
+    get_invalidation_bus().invalidate(session, namespace, *keys)
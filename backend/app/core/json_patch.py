@@ -0,0 +1,130 @@
+"""Minimal RFC 6902 JSON Patch implementation.
+
+Supports all six operations (add, remove, replace, move, copy, test) over
+plain dicts and lists, addressed with RFC 6901 JSON Pointers.
+"""
+
+import copy
+from typing import Any
+
+
+class JsonPatchError(ValueError):
+    """Raised when a patch operation cannot be applied."""
+
+
+def _parse_pointer(pointer: str) -> list[str]:
+    if pointer == "":
+        return []
+    if not pointer.startswith("/"):
+        raise JsonPatchError(f"Invalid JSON pointer: {pointer!r}")
+    return [
+        token.replace("~1", "/").replace("~0", "~") for token in pointer[1:].split("/")
+    ]
+
+
+def _list_index(container: list, token: str, allow_end: bool = False) -> int:
+    if allow_end and token == "-":
+        return len(container)
+    if not token.isdigit() or (len(token) > 1 and token.startswith("0")):
+        raise JsonPatchError(f"Invalid array index: {token!r}")
+    index = int(token)
+    limit = len(container) if allow_end else len(container) - 1
+    if index > limit:
+        raise JsonPatchError(f"Array index out of range: {index}")
+    return index
+
+
+def _resolve_parent(doc: Any, tokens: list[str]) -> tuple[Any, str]:
+    if not tokens:
+        raise JsonPatchError("Operation on the document root is not supported")
+    node = doc
+    for token in tokens[:-1]:
+        if isinstance(node, dict):
+            if token not in node:
+                raise JsonPatchError(f"Path not found: {token!r}")
+            node = node[token]
+        elif isinstance(node, list):
+            node = node[_list_index(node, token)]
+        else:
+            raise JsonPatchError(f"Cannot traverse into scalar at {token!r}")
+    return node, tokens[-1]
+
+
+def _get(doc: Any, pointer: str) -> Any:
+    parent, token = _resolve_parent(doc, _parse_pointer(pointer))
+    if isinstance(parent, dict):
+        if token not in parent:
+            raise JsonPatchError(f"Path not found: {pointer!r}")
+        return parent[token]
+    if isinstance(parent, list):
+        return parent[_list_index(parent, token)]
+    raise JsonPatchError(f"Path not found: {pointer!r}")
+
+
+def _add(doc: Any, pointer: str, value: Any) -> None:
+    parent, token = _resolve_parent(doc, _parse_pointer(pointer))
+    if isinstance(parent, dict):
+        parent[token] = value
+    elif isinstance(parent, list):
+        parent.insert(_list_index(parent, token, allow_end=True), value)
+    else:
+        raise JsonPatchError(f"Cannot add to scalar at {pointer!r}")
+
+
+def _remove(doc: Any, pointer: str) -> Any:
+    parent, token = _resolve_parent(doc, _parse_pointer(pointer))
+    if isinstance(parent, dict):
+        if token not in parent:
+            raise JsonPatchError(f"Path not found: {pointer!r}")
+        return parent.pop(token)
+    if isinstance(parent, list):
+        return parent.pop(_list_index(parent, token))
+    raise JsonPatchError(f"Cannot remove from scalar at {pointer!r}")
+
+
+def apply_patch(doc: Any, operations: list[dict]) -> Any:
+    """Apply a JSON Patch to a copy of ``doc``.
+
+    The patch is atomic: if any operation fails, ``JsonPatchError`` is raised
+    and the original document is left untouched.
+
+    Args:
+        doc: The document to patch.
+        operations: Operations as dicts with ``op``, ``path`` and, depending
+            on the operation, ``value`` or ``from``.
+
+    Returns:
+        The patched document.
+    """
+    result = copy.deepcopy(doc)
+    for operation in operations:
+        op = operation.get("op")
+        path = operation.get("path")
+        if not isinstance(path, str):
+            raise JsonPatchError("Operation is missing a path")
+
+        if op == "add":
+            _add(result, path, copy.deepcopy(operation.get("value")))
+        elif op == "remove":
+            _remove(result, path)
+        elif op == "replace":
+            _remove(result, path)
+            _add(result, path, copy.deepcopy(operation.get("value")))
+        elif op == "move":
+            source = operation.get("from")
+            if not isinstance(source, str):
+                raise JsonPatchError("move operation is missing 'from'")
+            if path.startswith(source + "/"):
+                raise JsonPatchError("Cannot move a node into one of its children")
+            _add(result, path, _remove(result, source))
+        elif op == "copy":
+            source = operation.get("from")
+            if not isinstance(source, str):
+                raise JsonPatchError("copy operation is missing 'from'")
+            _add(result, path, copy.deepcopy(_get(result, source)))
+        elif op == "test":
+            if _get(result, path) != operation.get("value"):
+                raise JsonPatchError(f"Test failed at {path!r}")
+        else:
+            raise JsonPatchError(f"Unsupported operation: {op!r}")
+    return result
@@ -0,0 +1,267 @@
+"""Event-loop lag monitoring and blocking-call detection.
+
+A coroutine that blocks (a synchronous network call, heavy CPU work, file
+I/O) stalls every other request on the worker for as long as it runs, and
+nothing in the request's own timing shows it. The monitor makes stalls
+visible:
+
+- a sampler task sleeps for a fixed interval and records how late it woke
+  up in a lag histogram;
+- a watchdog thread notices when the loop is overdue by more than the
+  blocking threshold and captures the loop thread's stack while the
+  offending call is still running;
+- ``LoopMonitorMiddleware`` ties each stall to the request that was running
+  when it was captured. In strict mode that request raises
+  ``BlockingCallError``, so tests that drive the app fail.
+"""
+
+import asyncio
+import itertools
+import logging
+import sys
+import threading
+import time
+import traceback
+from bisect import bisect_left
+from collections import deque
+from contextlib import suppress
+from dataclasses import dataclass, field
+from functools import lru_cache
+from types import FrameType
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds of the lag histogram buckets, in milliseconds
+BUCKETS_MS = (1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class BlockingCallError(RuntimeError):
+    """Raised in strict mode when a request blocked the event loop."""
+
+    def __init__(self, blocked: "BlockedCall") -> None:
+        self.blocked = blocked
+        super().__init__(
+            f"{blocked.route or 'A request'} blocked the event loop for at least "
+            f"{blocked.duration * 1000:.0f} ms:\n{''.join(blocked.stack)}"
+        )
+
+
+@dataclass
+class BlockedCall:
+    """One stall of the event loop longer than the blocking threshold."""
+
+    # Seconds the loop was stalled; a lower bound until the loop resumes
+    duration: float
+    # Stack of the loop thread when the stall was seen; empty if the loop
+    # resumed before the watchdog could capture it
+    stack: list[str]
+    # "METHOD /path" of the request that was running, if any
+    route: str | None = None
+    request: int | None = field(default=None, repr=False)
+
+
+class LagHistogram:
+    """Histogram of loop lag samples, in milliseconds."""
+
+    def __init__(self, bounds: tuple[float, ...] = BUCKETS_MS) -> None:
+        self.bounds = bounds
+        # One count per bound plus an overflow bucket
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record one sample."""
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the ``q`` quantile."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts, strict=False):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+
+class LoopMonitor:
+    """Measures lag and catches blocking calls on one event loop."""
+
+    def __init__(
+        self,
+        interval: float,
+        threshold: float,
+        strict: bool = False,
+        max_blocked: int = 50,
+    ) -> None:
+        self.interval = interval
+        self.threshold = threshold
+        self.strict = strict
+        self.histogram = LagHistogram()
+        self.blocked: deque[BlockedCall] = deque(maxlen=max_blocked)
+        self.blocked_total = 0
+        self._max_lag = 0.0
+        self._lock = threading.Lock()
+        self._heartbeat = time.monotonic()
+        self._stall: BlockedCall | None = None
+        # (route, request number) of middleware calls in flight, by frame id
+        self._requests: dict[int, tuple[str, int]] = {}
+        self._request_numbers = itertools.count(1)
+        self._loop_thread: int | None = None
+        self._task: asyncio.Task | None = None
+        self._thread: threading.Thread | None = None
+        self._stopped = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        """Whether the monitor is watching a loop."""
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start monitoring the running event loop."""
+        if self.running:
+            return
+        self._loop_thread = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._stopped.clear()
+        self._task = asyncio.get_running_loop().create_task(self._sample())
+        self._thread = threading.Thread(
+            target=self._watch, name="loop-monitor", daemon=True
+        )
+        self._thread.start()
+
+    async def stop(self) -> None:
+        """Stop monitoring."""
+        self._stopped.set()
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def pop_max_lag(self) -> float:
+        """Longest lag in seconds since the previous call."""
+        max_lag, self._max_lag = self._max_lag, 0.0
+        return max_lag
+
+    def blocked_by(self, request: int) -> BlockedCall | None:
+        """The first stall captured while ``request`` was running, if any."""
+        with self._lock:
+            for blocked in self.blocked:
+                if blocked.request == request:
+                    return blocked
+        return None
+
+    async def _sample(self) -> None:
+        while True:
+            expected = time.monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            lag = max(0.0, now - expected)
+            with self._lock:
+                self._heartbeat = now
+                stall, self._stall = self._stall, None
+                if stall is None and lag >= self.threshold:
+                    # The loop resumed before the watchdog looked
+                    stall = BlockedCall(duration=lag, stack=[])
+                    self._record(stall)
+            self.histogram.observe(lag * 1000)
+            self._max_lag = max(self._max_lag, lag)
+            if stall is not None:
+                stall.duration = max(stall.duration, lag)
+                logger.warning(
+                    "Event loop blocked for %.0f ms%s\n%s",
+                    stall.duration * 1000,
+                    f" during {stall.route}" if stall.route else "",
+                    "".join(stall.stack) or "(stack not captured)",
+                )
+
+    def _watch(self) -> None:
+        poll = min(self.interval, self.threshold) / 4
+        while not self._stopped.wait(poll):
+            overdue = time.monotonic() - self._heartbeat - self.interval
+            if overdue < self.threshold:
+                continue
+            with self._lock:
+                if self._stall is not None or self._loop_thread is None:
+                    continue
+                frame = sys._current_frames().get(self._loop_thread)
+                if frame is None:
+                    continue
+                route, request = self._find_request(frame)
+                self._stall = BlockedCall(
+                    duration=overdue,
+                    stack=traceback.format_stack(frame),
+                    route=route,
+                    request=request,
+                )
+                self._record(self._stall)
+
+    def _record(self, stall: BlockedCall) -> None:
+        self.blocked.append(stall)
+        self.blocked_total += 1
+
+    def _find_request(self, frame: FrameType | None) -> tuple[str | None, int | None]:
+        # Awaiting coroutines are chained through f_back while they run, so
+        # the middleware frame of the current request is on the stack
+        while frame is not None:
+            request = self._requests.get(id(frame))
+            if request is not None:
+                return request
+            frame = frame.f_back
+        return None, None
+
+
+class LoopMonitorMiddleware:
+    """Attributes event-loop stalls to the requests that caused them."""
+
+    def __init__(self, app: ASGIApp, monitor: LoopMonitor) -> None:
+        self.app = app
+        self.monitor = monitor
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        monitor = self.monitor
+        if not monitor.running:
+            # The lifespan normally starts it; test clients may skip that
+            monitor.start()
+        frame = id(sys._getframe())
+        request = next(monitor._request_numbers)
+        monitor._requests[frame] = (f"{scope['method']} {scope['path']}", request)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            del monitor._requests[frame]
+        if monitor.strict:
+            blocked = monitor.blocked_by(request)
+            if blocked is not None:
+                raise BlockingCallError(blocked)
+
+
+@lru_cache
+def get_loop_monitor() -> LoopMonitor:
+    """Get this process's event-loop monitor."""
+    settings = get_settings()
+    return LoopMonitor(
+        interval=settings.loop_monitor_interval_seconds,
+        threshold=settings.loop_monitor_block_threshold_seconds,
+        strict=settings.loop_monitor_strict,
+        max_blocked=settings.loop_monitor_max_blocked,
+    )
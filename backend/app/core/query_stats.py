@@ -0,0 +1,200 @@
+"""Per-request SQL statement counting, query budgets and N+1 detection.
+
+SQLAlchemy cursor events count every statement run while a request is
+being handled, and how long the database took. ``QueryStatsMiddleware``
+then:
+
+- adds ``Server-Timing`` and ``X-DB-Queries`` headers in debug mode;
+- logs statements that ran repeatedly with the same shape (same SQL,
+  different parameters), the usual sign of an N+1 loop;
+- checks the count against the budget declared on the route with
+  ``@query_budget(n)``. Over budget is logged, or raises
+  ``QueryBudgetExceeded`` in strict mode so tests fail.
+
+Tests can also declare budgets on routes they exercise, since the
+decorator only tags the endpoint function::
+
+    query_budget(2)(items.get_item)
+
+Statements run by tasks that a request starts count towards that request.
+"""
+
+import logging
+import time
+from collections import Counter
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.engine.interfaces import ExecuteStyle
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_BUDGET_ATTRIBUTE = "query_budget"
+_STARTED = "query_stats_started"
+
+_current: ContextVar["QueryStats | None"] = ContextVar("query_stats", default=None)
+
+
+@dataclass
+class QueryStats:
+    """Statements run in one tracked context."""
+
+    count: int = 0
+    # Seconds spent waiting on the database
+    duration: float = 0.0
+    # Statement text, whitespace collapsed, to number of executions
+    shapes: Counter[str] = field(default_factory=Counter)
+    parent: "QueryStats | None" = field(default=None, repr=False)
+
+    def record(self, shape: str | None, duration: float) -> None:
+        """Count one statement here and in every enclosing context."""
+        stats: QueryStats | None = self
+        while stats is not None:
+            stats.count += 1
+            stats.duration += duration
+            if shape is not None:
+                stats.shapes[shape] += 1
+            stats = stats.parent
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """Statement shapes that ran at least ``threshold`` times."""
+        return [(shape, n) for shape, n in self.shapes.most_common() if n >= threshold]
+
+
+class QueryBudgetExceeded(RuntimeError):
+    """Raised in strict mode when a route runs more statements than budgeted."""
+
+    def __init__(self, route: str, stats: QueryStats, budget: int) -> None:
+        self.route = route
+        self.stats = stats
+        self.budget = budget
+        statements = "\n".join(
+            f"  {n} x {shape}" for shape, n in stats.shapes.most_common()
+        )
+        super().__init__(
+            f"{route} ran {stats.count} statements, over its budget of "
+            f"{budget}:\n{statements}"
+        )
+
+
+def query_budget(limit: int) -> Callable[[F], F]:
+    """Declare the most statements a route may run per request."""
+
+    def decorator(endpoint: F) -> F:
+        setattr(endpoint, _BUDGET_ATTRIBUTE, limit)
+        return endpoint
+
+    return decorator
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Count the statements run in this context and the tasks it starts."""
+    stats = QueryStats(parent=_current.get())
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(
+    conn: Any,
+    _cursor: Any,
+    _statement: str,
+    _parameters: Any,
+    _context: Any,
+    _many: bool,
+) -> None:
+    if _current.get() is not None:
+        conn.info.setdefault(_STARTED, []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(
+    conn: Any, _cursor: Any, statement: str, _parameters: Any, context: Any, many: bool
+) -> None:
+    stats = _current.get()
+    started = conn.info.get(_STARTED)
+    if stats is None or not started:
+        return
+    duration = time.perf_counter() - started.pop()
+    # Batches of one bulk statement repeat by design; they are not N+1
+    bulk = many or (
+        context is not None and context.execute_style is ExecuteStyle.INSERTMANYVALUES
+    )
+    stats.record(None if bulk else " ".join(statement.split()), duration)
+
+
+@event.listens_for(Engine, "handle_error")
+def _handle_error(exception_context: Any) -> None:
+    connection = exception_context.connection
+    if connection is not None and connection.info.get(_STARTED):
+        connection.info[_STARTED].pop()
+
+
+class QueryStatsMiddleware:
+    """Tracks the statements each request runs."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        headers: bool = False,
+        repeat_threshold: int = 5,
+        strict: bool = False,
+    ) -> None:
+        self.app = app
+        self._headers = headers
+        self._repeat_threshold = repeat_threshold
+        self._strict = strict
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries() as stats:
+
+            async def send_wrapper(message: Message) -> None:
+                if message["type"] == "http.response.start" and self._headers:
+                    headers = MutableHeaders(scope=message)
+                    headers.append(
+                        "Server-Timing",
+                        f'db;dur={stats.duration * 1000:.1f};desc="{stats.count} queries"',
+                    )
+                    headers["X-DB-Queries"] = str(stats.count)
+                await send(message)
+
+            await self.app(scope, receive, send_wrapper)
+        self._check(scope, stats)
+
+    def _check(self, scope: Scope, stats: QueryStats) -> None:
+        route = f"{scope['method']} {scope['path']}"
+        for shape, n in stats.repeated(self._repeat_threshold):
+            logger.warning(
+                "Possible N+1 query in %s: statement ran %d times: %.300s",
+                route,
+                n,
+                shape,
+            )
+        budget = getattr(scope.get("endpoint"), _BUDGET_ATTRIBUTE, None)
+        if budget is None or stats.count <= budget:
+            return
+        if self._strict:
+            raise QueryBudgetExceeded(route, stats, budget)
+        logger.warning(
+            "%s ran %d statements, over its budget of %d",
+            route,
+            stats.count,
+            budget,
+        )
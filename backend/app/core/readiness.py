@@ -0,0 +1,177 @@
+"""Readiness checks, refreshed in the background.
+
+``/health`` says the process is alive; ``/ready`` says whether it should be
+sent traffic right now. The checks run on a fixed interval in the
+background and ``/ready`` only reads their latest results, so probing is
+free: a probe never touches the database or Firebase itself, and frequent
+probes cannot add to the load that made a worker unready.
+
+Critical checks decide readiness:
+
+- ``database``: a ``SELECT 1`` over a pooled connection;
+- ``pool``: share of the worker's pool connections checked out;
+- ``event_loop``: longest event-loop lag since the previous refresh.
+
+``firebase_keys`` is reported but not critical: when Google cannot be
+reached every worker is affected alike, and taking them all out of
+rotation would turn an auth outage into a full outage. It fetches the
+session cookie keys from Google again only once the last copy has expired.
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import suppress
+from dataclasses import dataclass
+from functools import lru_cache
+
+from app.core.config import get_settings
+from app.core.firebase import FirebaseNotConfiguredError, fetch_session_cookie_keys
+from app.core.loop_monitor import get_loop_monitor
+from app.db.init import check_db_connection
+from app.db.session import get_engine
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CheckResult:
+    """Latest outcome of one readiness check."""
+
+    ok: bool
+    detail: str
+    critical: bool = True
+    checked_at: float = 0.0
+
+
+class ReadinessProbe:
+    """Runs readiness checks on an interval and keeps their results."""
+
+    def __init__(
+        self,
+        interval: float,
+        check_timeout: float,
+        max_pool_utilization: float,
+        max_loop_lag: float,
+    ) -> None:
+        self._interval = interval
+        self._check_timeout = check_timeout
+        self._max_pool_utilization = max_pool_utilization
+        self._max_loop_lag = max_loop_lag
+        self.results: dict[str, CheckResult] = {}
+        self._firebase_keys_expire_at = 0.0
+        self._task: asyncio.Task | None = None
+
+    @property
+    def ready(self) -> bool:
+        """Whether every critical check passed in a recent refresh.
+
+        Results older than three intervals count as failed, so a stuck
+        refresher does not leave a worker reporting ready forever.
+        """
+        if not self.results:
+            return False
+        stale_before = time.monotonic() - 3 * self._interval
+        return all(
+            result.ok and result.checked_at >= stale_before
+            for result in self.results.values()
+            if result.critical
+        )
+
+    def start(self) -> None:
+        """Start refreshing in the background."""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop refreshing."""
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def refresh(self) -> None:
+        """Run every check once and store the results."""
+        # Pool usage first, before the database check borrows a connection
+        results = {
+            "pool": self._check_pool(),
+            "event_loop": self._check_event_loop(),
+        }
+        database, firebase_keys = await asyncio.gather(
+            self._check_database(), self._check_firebase_keys()
+        )
+        results["database"] = database
+        results["firebase_keys"] = firebase_keys
+        now = time.monotonic()
+        for result in results.values():
+            result.checked_at = now
+        self.results = results
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except Exception:
+                logger.exception("Readiness refresh failed")
+            await asyncio.sleep(self._interval)
+
+    def _check_pool(self) -> CheckResult:
+        settings = get_settings()
+        capacity = settings.database_pool_size + settings.database_max_overflow
+        in_use = get_engine().pool.checkedout()
+        utilization = in_use / capacity if capacity else 1.0
+        return CheckResult(
+            ok=utilization < self._max_pool_utilization,
+            detail=f"{in_use}/{capacity} connections in use",
+        )
+
+    def _check_event_loop(self) -> CheckResult:
+        monitor = get_loop_monitor()
+        if not monitor.running:
+            return CheckResult(ok=True, detail="loop monitor not running")
+        lag = monitor.pop_max_lag()
+        return CheckResult(
+            ok=lag < self._max_loop_lag,
+            detail=f"max lag {lag * 1000:.0f} ms",
+        )
+
+    async def _check_database(self) -> CheckResult:
+        try:
+            ok = await asyncio.wait_for(check_db_connection(), self._check_timeout)
+        except TimeoutError:
+            return CheckResult(ok=False, detail="timed out")
+        return CheckResult(ok=ok, detail="reachable" if ok else "unreachable")
+
+    async def _check_firebase_keys(self) -> CheckResult:
+        fresh_for = self._firebase_keys_expire_at - time.monotonic()
+        if fresh_for <= 0:
+            try:
+                fresh_for = await asyncio.wait_for(
+                    asyncio.to_thread(fetch_session_cookie_keys, self._check_timeout),
+                    self._check_timeout,
+                )
+            except FirebaseNotConfiguredError:
+                return CheckResult(ok=True, detail="not configured", critical=False)
+            except Exception as exc:
+                return CheckResult(
+                    ok=False, detail=f"fetch failed: {exc!r}", critical=False
+                )
+            self._firebase_keys_expire_at = time.monotonic() + fresh_for
+        return CheckResult(
+            ok=fresh_for > 0,
+            detail=f"keys valid for {fresh_for:.0f} s",
+            critical=False,
+        )
+
+
+@lru_cache
+def get_readiness_probe() -> ReadinessProbe:
+    """Get this process's readiness probe."""
+    settings = get_settings()
+    return ReadinessProbe(
+        interval=settings.readiness_interval_seconds,
+        check_timeout=settings.readiness_check_timeout_seconds,
+        max_pool_utilization=settings.readiness_max_pool_utilization,
+        max_loop_lag=settings.readiness_max_loop_lag_seconds,
+    )
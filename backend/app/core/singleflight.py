@@ -0,0 +1,92 @@
+"""Single-flight coalescing of identical concurrent reads.
+
+When many requests ask for the same thing at once, only the first runs
+the query; the rest wait for it and share its result, or its exception.
+Nothing is cached: as soon as the call finishes, the next caller starts a
+fresh one.
+"""
+
+import asyncio
+import functools
+import inspect
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Shares one in-flight call among concurrent callers with the same key.
+
+    The call runs as its own task, so a caller that is cancelled or gives
+    up does not cancel it for the others.
+    """
+
+    def __init__(self, timeout: float) -> None:
+        self._timeout = timeout
+        self._flights: dict[Hashable, asyncio.Task] = {}
+        self.calls = 0
+        self.executions = 0
+
+    @property
+    def coalescing_ratio(self) -> float:
+        """Share of calls answered by another caller's query."""
+        if not self.calls:
+            return 0.0
+        return 1 - self.executions / self.calls
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run ``fn``, or join the call already running under ``key``.
+
+        Raises:
+            TimeoutError: If the result takes longer than the timeout. The
+                call keeps running for callers that are still waiting.
+            Exception: Whatever ``fn`` raised, in every caller.
+        """
+        self.calls += 1
+        task = self._flights.get(key)
+        if task is None:
+            self.executions += 1
+            task = asyncio.ensure_future(fn())
+            self._flights[key] = task
+            task.add_done_callback(functools.partial(self._finished, key))
+        return await asyncio.wait_for(asyncio.shield(task), self._timeout)
+
+    def forget(self) -> None:
+        """Make later callers start fresh calls instead of joining running ones.
+
+        Call after a write, so reads that began before it are not shared
+        with readers that expect to see it.
+        """
+        self._flights.clear()
+
+    def _finished(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._flights.get(key) is task:
+            del self._flights[key]
+        if not task.cancelled():
+            # Mark the exception retrieved when every caller timed out
+            task.exception()
+
+
+def coalesced(
+    method: Callable[..., Awaitable[T]],
+) -> Callable[..., Awaitable[T]]:
+    """Coalesce concurrent calls to a method with equal arguments.
+
+    The key is the method name plus its bound arguments, which must be
+    hashable. The instance provides the group as ``self._flights``.
+    """
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    async def wrapper(self: Any, *args: Any, **kwargs: Any) -> T:
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        arguments = tuple(bound.arguments.items())[1:]
+        flights: SingleFlight = self._flights
+        return await flights.do(
+            (method.__qualname__, arguments),
+            lambda: method(self, *args, **kwargs),
+        )
+
+    return wrapper
@@ -0,0 +1,217 @@
+"""Local disk storage for uploaded media.
+
+Uploads are written in two stages. While an upload is in progress its bytes
+live in ``<media_root>/uploads/<id>.part`` next to a small JSON sidecar with
+the declared size, checksum and owner. The current upload offset is simply
+the size of the ``.part`` file, so resuming after a dropped connection needs
+no database round-trip. Once every byte has arrived and the SHA-256 matches,
+the file is renamed into ``<media_root>/files/<id>``.
+
+All blocking filesystem calls run in the threadpool, and request bodies are
+written chunk by chunk as they arrive, so memory use per upload is bounded
+by the ASGI server's receive buffer rather than the file size.
+"""
+
+import fcntl
+import hashlib
+import json
+import os
+from collections.abc import AsyncIterator
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from uuid import UUID
+
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import get_settings
+
+# Read buffer used when hashing completed files
+_HASH_BUFFER_SIZE = 1024 * 1024
+
+
+class UploadNotFoundError(Exception):
+    """Raised when an upload has no in-progress state on disk."""
+
+
+class UploadConflictError(Exception):
+    """Raised when a chunk does not start at the current upload offset."""
+
+    def __init__(self, offset: int) -> None:
+        super().__init__(f"Upload offset mismatch, current offset is {offset}")
+        self.offset = offset
+
+
+class UploadChecksumError(Exception):
+    """Raised when a chunk or the completed file fails checksum verification."""
+
+
+class UploadTooLargeError(Exception):
+    """Raised when a chunk would exceed the chunk limit or declared size."""
+
+
+@dataclass
+class UploadInfo:
+    """Sidecar metadata for an in-progress upload."""
+
+    owner: str
+    size: int
+    sha256: str
+
+
+class LocalMediaStorage:
+    """Media storage backed by a directory on the local filesystem."""
+
+    def __init__(self, root: str | Path) -> None:
+        self._root = Path(root)
+        self._uploads = self._root / "uploads"
+        self._files = self._root / "files"
+
+    def file_path(self, media_id: UUID) -> Path:
+        """Path of a completed media file."""
+        return self._files / str(media_id)
+
+    def _part_path(self, media_id: UUID) -> Path:
+        return self._uploads / f"{media_id}.part"
+
+    def _info_path(self, media_id: UUID) -> Path:
+        return self._uploads / f"{media_id}.json"
+
+    async def create_upload(self, media_id: UUID, info: UploadInfo) -> None:
+        """Create the empty part file and sidecar for a new upload."""
+
+        def _create() -> None:
+            self._uploads.mkdir(parents=True, exist_ok=True)
+            self._files.mkdir(parents=True, exist_ok=True)
+            self._part_path(media_id).touch(exist_ok=False)
+            self._info_path(media_id).write_text(json.dumps(asdict(info)))
+
+        await run_in_threadpool(_create)
+
+    async def get_upload(self, media_id: UUID) -> tuple[UploadInfo, int]:
+        """Get an upload's sidecar metadata and current offset.
+
+        Raises:
+            UploadNotFoundError: If the upload does not exist or has completed.
+        """
+
+        def _read() -> tuple[UploadInfo, int]:
+            try:
+                info = UploadInfo(**json.loads(self._info_path(media_id).read_text()))
+                offset = self._part_path(media_id).stat().st_size
+            except FileNotFoundError:
+                raise UploadNotFoundError(str(media_id))
+            return info, offset
+
+        return await run_in_threadpool(_read)
+
+    async def write_chunk(
+        self,
+        media_id: UUID,
+        offset: int,
+        chunks: AsyncIterator[bytes],
+        max_bytes: int,
+        expected_sha256: str | None = None,
+    ) -> int:
+        """Append a chunk to an in-progress upload.
+
+        The part file is locked for the duration of the write so two
+        clients resuming the same upload cannot interleave. If the chunk
+        fails verification or the body is cut short, the file is truncated
+        back to ``offset`` and the client can retry from there.
+
+        Args:
+            media_id: The upload to write to.
+            offset: Byte offset the client believes it is resuming from.
+            chunks: Request body stream.
+            max_bytes: Maximum number of bytes this chunk may contain.
+            expected_sha256: Optional hex SHA-256 of this chunk.
+
+        Returns:
+            The new upload offset.
+
+        Raises:
+            UploadNotFoundError: If the upload does not exist.
+            UploadConflictError: If ``offset`` is not the current offset or
+                another request is writing to the same upload.
+            UploadTooLargeError: If the chunk exceeds ``max_bytes``.
+            UploadChecksumError: If the chunk does not match its checksum.
+        """
+        try:
+            fd = await run_in_threadpool(
+                os.open, self._part_path(media_id), os.O_WRONLY
+            )
+        except FileNotFoundError:
+            raise UploadNotFoundError(str(media_id))
+
+        try:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                raise UploadConflictError(offset)
+
+            current = os.fstat(fd).st_size
+            if offset != current:
+                raise UploadConflictError(current)
+
+            digest = hashlib.sha256()
+            position = offset
+            try:
+                async for chunk in chunks:
+                    if not chunk:
+                        continue
+                    if position - offset + len(chunk) > max_bytes:
+                        raise UploadTooLargeError(media_id)
+                    digest.update(chunk)
+                    await run_in_threadpool(os.pwrite, fd, chunk, position)
+                    position += len(chunk)
+                if expected_sha256 and digest.hexdigest() != expected_sha256.lower():
+                    raise UploadChecksumError("Chunk checksum mismatch")
+            except BaseException:
+                # Drop the partial chunk so the next attempt resumes cleanly
+                await run_in_threadpool(os.ftruncate, fd, offset)
+                raise
+
+            await run_in_threadpool(os.fsync, fd)
+            return position
+        finally:
+            os.close(fd)
+
+    async def complete_upload(self, media_id: UUID, info: UploadInfo) -> None:
+        """Verify a fully received upload and move it into place.
+
+        Raises:
+            UploadChecksumError: If the file does not match the declared
+                SHA-256. The part file is reset so the client can start over.
+        """
+
+        def _complete() -> None:
+            part = self._part_path(media_id)
+            digest = hashlib.sha256()
+            with part.open("rb") as f:
+                while block := f.read(_HASH_BUFFER_SIZE):
+                    digest.update(block)
+            if digest.hexdigest() != info.sha256.lower():
+                os.truncate(part, 0)
+                raise UploadChecksumError("File checksum mismatch")
+            part.replace(self.file_path(media_id))
+            self._info_path(media_id).unlink(missing_ok=True)
+
+        await run_in_threadpool(_complete)
+
+    async def delete(self, media_id: UUID) -> None:
+        """Delete a media file and any in-progress upload state."""
+
+        def _delete() -> None:
+            for path in (
+                self.file_path(media_id),
+                self._part_path(media_id),
+                self._info_path(media_id),
+            ):
+                path.unlink(missing_ok=True)
+
+        await run_in_threadpool(_delete)
+
+
+def get_media_storage() -> LocalMediaStorage:
+    """Get the configured media storage backend."""
+    return LocalMediaStorage(get_settings().media_root)
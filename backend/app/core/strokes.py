@@ -0,0 +1,225 @@
+"""Compact binary encoding for video annotation shapes.
+
+Annotations drawn over a video are mostly freehand strokes: long runs of
+points that each move a tiny distance from the last. Stored as JSON, every
+point costs ~25 bytes. This codec quantizes coordinates to hundredths of a
+percent, stores each stroke point as a zigzag varint delta from the previous
+one, and packs the rest of each shape into a few bytes, so a typical stroke
+point takes 2 bytes.
+
+Layout (all integers are unsigned LEB128 varints unless noted)::
+
+    version:u8  shape_count
+    per shape:
+        type:u8  color:u8  id_len id:utf8  stroke_width:z
+        circle     center.x:z center.y:z radius:z
+        arrow/line start.x:z start.y:z (end - start).x:z (end - start).y:z
+        rectangle  top_left.x:z top_left.y:z width:z height:z
+        freehand   n p0.x:z p0.y:z (p1 - p0).x:z (p1 - p0).y:z ...
+        text       position.x:z position.y:z font_size:z text_len text:utf8
+
+``:z`` marks a zigzag-encoded signed value of ``round(value * 100)``.
+"""
+
+FORMAT_VERSION = 1
+SCALE = 100
+
+SHAPE_TYPES = ("circle", "arrow", "line", "rectangle", "freehand", "text")
+COLORS = ("red", "yellow", "green", "blue", "white")
+
+_TYPE_CODES = {name: code for code, name in enumerate(SHAPE_TYPES)}
+_COLOR_CODES = {name: code for code, name in enumerate(COLORS)}
+
+
+class StrokeCodecError(ValueError):
+    """Raised when shapes cannot be encoded or a blob cannot be decoded."""
+
+
+class _Writer:
+    def __init__(self) -> None:
+        self._buf = bytearray()
+
+    def byte(self, value: int) -> None:
+        self._buf.append(value)
+
+    def uint(self, value: int) -> None:
+        while value > 0x7F:
+            self._buf.append((value & 0x7F) | 0x80)
+            value >>= 7
+        self._buf.append(value)
+
+    def sint(self, value: int) -> None:
+        self.uint(-2 * value - 1 if value < 0 else 2 * value)
+
+    def num(self, value: float) -> int:
+        quantized = round(value * SCALE)
+        self.sint(quantized)
+        return quantized
+
+    def text(self, value: str) -> None:
+        data = value.encode()
+        self.uint(len(data))
+        self._buf += data
+
+    def getvalue(self) -> bytes:
+        return bytes(self._buf)
+
+
+class _Reader:
+    def __init__(self, data: bytes) -> None:
+        self._data = data
+        self._pos = 0
+
+    def byte(self) -> int:
+        if self._pos >= len(self._data):
+            raise StrokeCodecError("Unexpected end of annotation data")
+        value = self._data[self._pos]
+        self._pos += 1
+        return value
+
+    def uint(self) -> int:
+        result = shift = 0
+        while True:
+            value = self.byte()
+            result |= (value & 0x7F) << shift
+            if not value & 0x80:
+                return result
+            shift += 7
+
+    def sint(self) -> int:
+        value = self.uint()
+        return (value >> 1) ^ -(value & 1)
+
+    def num(self) -> float:
+        return self.sint() / SCALE
+
+    def text(self) -> str:
+        length = self.uint()
+        end = self._pos + length
+        if end > len(self._data):
+            raise StrokeCodecError("Unexpected end of annotation data")
+        value = self._data[self._pos : end].decode()
+        self._pos = end
+        return value
+
+    @property
+    def done(self) -> bool:
+        return self._pos == len(self._data)
+
+
+def _write_point(writer: _Writer, point: dict) -> tuple[int, int]:
+    return writer.num(point["x"]), writer.num(point["y"])
+
+
+def _write_delta(writer: _Writer, point: dict, origin: tuple[int, int]) -> None:
+    x, y = round(point["x"] * SCALE), round(point["y"] * SCALE)
+    writer.sint(x - origin[0])
+    writer.sint(y - origin[1])
+
+
+def _read_point(reader: _Reader) -> tuple[int, int]:
+    return reader.sint(), reader.sint()
+
+
+def _point(x: int, y: int) -> dict:
+    return {"x": x / SCALE, "y": y / SCALE}
+
+
+def encode_shapes(shapes: list[dict]) -> bytes:
+    """Encode shapes (as produced by the annotation schemas) to bytes.
+
+    Numbers are rounded to two decimal places.
+
+    Raises:
+        StrokeCodecError: If a shape has an unknown type or color.
+    """
+    writer = _Writer()
+    writer.byte(FORMAT_VERSION)
+    writer.uint(len(shapes))
+    for shape in shapes:
+        try:
+            writer.byte(_TYPE_CODES[shape["type"]])
+            writer.byte(_COLOR_CODES[shape["color"]])
+        except KeyError as exc:
+            raise StrokeCodecError(f"Unsupported shape value {exc}") from exc
+        writer.text(shape["id"])
+        writer.num(shape["stroke_width"])
+
+        kind = shape["type"]
+        if kind == "circle":
+            _write_point(writer, shape["center"])
+            writer.num(shape["radius"])
+        elif kind in ("arrow", "line"):
+            start = _write_point(writer, shape["start"])
+            _write_delta(writer, shape["end"], start)
+        elif kind == "rectangle":
+            _write_point(writer, shape["top_left"])
+            writer.num(shape["width"])
+            writer.num(shape["height"])
+        elif kind == "freehand":
+            points = shape["points"]
+            writer.uint(len(points))
+            previous = (0, 0)
+            for point in points:
+                _write_delta(writer, point, previous)
+                previous = (round(point["x"] * SCALE), round(point["y"] * SCALE))
+        else:
+            _write_point(writer, shape["position"])
+            writer.num(shape["font_size"])
+            writer.text(shape["content"])
+    return writer.getvalue()
+
+
+def decode_shapes(data: bytes) -> list[dict]:
+    """Decode bytes produced by ``encode_shapes`` back into shape dicts.
+
+    Raises:
+        StrokeCodecError: If the data is truncated or of an unknown version.
+    """
+    reader = _Reader(data)
+    version = reader.byte()
+    if version != FORMAT_VERSION:
+        raise StrokeCodecError(f"Unsupported annotation format version {version}")
+
+    shapes = []
+    for _ in range(reader.uint()):
+        type_code, color_code = reader.byte(), reader.byte()
+        if type_code >= len(SHAPE_TYPES) or color_code >= len(COLORS):
+            raise StrokeCodecError("Corrupt annotation data")
+        kind = SHAPE_TYPES[type_code]
+        shape = {
+            "type": kind,
+            "color": COLORS[color_code],
+            "id": reader.text(),
+            "stroke_width": reader.num(),
+        }
+
+        if kind == "circle":
+            shape["center"] = _point(*_read_point(reader))
+            shape["radius"] = reader.num()
+        elif kind in ("arrow", "line"):
+            x, y = _read_point(reader)
+            dx, dy = _read_point(reader)
+            shape["start"] = _point(x, y)
+            shape["end"] = _point(x + dx, y + dy)
+        elif kind == "rectangle":
+            shape["top_left"] = _point(*_read_point(reader))
+            shape["width"] = reader.num()
+            shape["height"] = reader.num()
+        elif kind == "freehand":
+            x = y = 0
+            points = []
+            for _ in range(reader.uint()):
+                dx, dy = _read_point(reader)
+                x, y = x + dx, y + dy
+                points.append(_point(x, y))
+            shape["points"] = points
+        else:
+            shape["position"] = _point(*_read_point(reader))
+            shape["font_size"] = reader.num()
+            shape["content"] = reader.text()
+        shapes.append(shape)
+
+    if not reader.done:
+        raise StrokeCodecError("Trailing bytes in annotation data")
+    return shapes
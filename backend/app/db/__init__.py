@@ -1,3 +1,3 @@
-from app.db.session import async_session_factory, engine, get_session
+from app.db.session import get_engine, get_session, get_session_factory
 
-__all__ = ["async_session_factory", "engine", "get_session"]
+__all__ = ["get_engine", "get_session", "get_session_factory"]
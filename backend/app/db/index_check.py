@@ -0,0 +1,712 @@
+"""Index coverage check: EXPLAIN every repository query on seeded data.
+
+Run with ``python -m app.db.index_check`` against a local Postgres. It
+builds the schema in a scratch ``index_check`` schema of the configured
+database, fills every table with ``--rows`` generated rows, calls each
+repository method once and EXPLAINs every statement the call issued.
+Sequential scans of tables holding at least ``--threshold`` rows are
+reported, as are plain indexes whose columns lead another index or unique
+constraint, and the command exits with status 1, so a query added without
+a supporting index, or an index that only adds write cost, fails CI.
+
+A sequential scan directly under a LIMIT that applies no filter only reads
+the rows it returns, and is allowed. A statement that reads more than one
+partition of a partitioned table is reported too: it is missing the
+partition key the planner needs to prune. The scratch schema is dropped
+afterwards unless ``--keep`` is given.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import uuid
+from collections.abc import Awaitable, Callable, Iterator
+from dataclasses import dataclass, field
+from datetime import UTC, date, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import (
+    ARRAY,
+    JSON,
+    Boolean,
+    Date,
+    DateTime,
+    Float,
+    Index,
+    Integer,
+    LargeBinary,
+    PrimaryKeyConstraint,
+    String,
+    Table,
+    UniqueConstraint,
+    Uuid,
+    event,
+    select,
+    text,
+)
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.core.config import get_settings
+from app.db import init  # noqa: F401 - registers every model
+from app.db.models.activity_log import ActivityLogWeekly
+from app.db.models.annotation import VideoAnnotation
+from app.db.models.base import Base
+from app.db.models.content import ContentFolder, ContentItem
+from app.db.models.credit import CreditAccount
+from app.db.models.item import Item
+from app.db.models.job import Job
+from app.db.models.media import MediaFile
+from app.db.models.program import Program
+from app.db.models.user import User
+from app.db.partitions import create_partitions
+from app.db.repositories.activity_log import ActivityLogRepository
+from app.db.repositories.annotation import AnnotationRepository
+from app.db.repositories.coach import CoachRepository
+from app.db.repositories.content import ROOT_PATH, ContentRepository, folder_path
+from app.db.repositories.credit import CreditRepository
+from app.db.repositories.item import ItemRepository
+from app.db.repositories.job import JobRepository
+from app.db.repositories.media import MediaRepository
+from app.db.repositories.program import ProgramRepository
+from app.db.repositories.user import UserRepository
+from app.schemas.item import ItemCreate, ItemUpdate
+from app.schemas.user import UserCreate, UserUpdate
+
+SCHEMA = "index_check"
+
+# Plan nodes that pass a LIMIT through to the scan beneath them
+_LIMIT_TRANSPARENT = {"Result", "Subquery Scan"}
+
+
+@dataclass
+class Samples:
+    """One seeded row of each table, for scenarios to pass as arguments."""
+
+    user: User
+    item: Item
+    folder: ContentFolder
+    content_item: ContentItem
+    account: CreditAccount
+    job: Job
+    media: MediaFile
+    annotation: VideoAnnotation
+    program: Program
+
+
+@dataclass
+class Finding:
+    """A sequential scan of a large table, or a query that did not prune."""
+
+    scenario: str
+    # "Seq Scan", or how many partitions were read
+    issue: str
+    relation: str
+    rows: int
+    filter: str | None
+    statement: str
+
+
+@dataclass
+class _Captured:
+    statements: list[tuple[str, Any]] = field(default_factory=list)
+
+
+Scenario = Callable[[AsyncSession, Samples], Awaitable[Any]]
+
+
+def _content_folder(s: Samples) -> ContentFolder:
+    folder_id = uuid.uuid4()
+    return ContentFolder(
+        id=folder_id,
+        coach_id=s.folder.coach_id,
+        name="New",
+        color="bg-gray-500",
+        path=folder_path(ROOT_PATH, folder_id),
+    )
+
+
+async def _loaded_folder(db: AsyncSession, s: Samples) -> ContentFolder:
+    return await ContentRepository(db).get_folder(s.folder.id, s.folder.coach_id)
+
+
+async def _loaded_content_item(db: AsyncSession, s: Samples) -> ContentItem:
+    item = s.content_item
+    return await ContentRepository(db).get_item(item.id, item.coach_id)
+
+
+async def _tree_edit(db: AsyncSession, s: Samples) -> tuple[dict, dict]:
+    tree = await ProgramRepository(db).get_tree(s.program.id)
+    week = {"name": "Week", "days": [{"name": "Day", "activities": []}]}
+    return tree, {**tree, "name": "Edited", "weeks": [*tree["weeks"], week]}
+
+
+async def _save_tree(db: AsyncSession, s: Samples) -> None:
+    old, new = await _tree_edit(db, s)
+    await ProgramRepository(db).save_tree(old, new)
+
+
+async def _create_program(db: AsyncSession, s: Samples) -> None:
+    _old, new = await _tree_edit(db, s)
+    await ProgramRepository(db).create(s.program.coach_id, new)
+
+
+async def _update_annotation(db: AsyncSession, s: Samples) -> None:
+    repo = AnnotationRepository(db)
+    await repo.update(await repo.get_by_id(s.annotation.id), {"label": "Edited"})
+
+
+async def _delete_annotation(db: AsyncSession, s: Samples) -> None:
+    repo = AnnotationRepository(db)
+    await repo.delete(await repo.get_by_id(s.annotation.id))
+
+
+async def _delete_media(db: AsyncSession, s: Samples) -> None:
+    repo = MediaRepository(db)
+    await repo.delete(await repo.get_by_id(s.media.id))
+
+
+async def _update_user(db: AsyncSession, s: Samples) -> None:
+    repo = UserRepository(db)
+    user = await repo.get_by_auth_subject(s.user.auth_provider, s.user.auth_subject)
+    await repo.update(user, UserUpdate(display_name="Edited"))
+
+
+# One call of every repository method, by name
+SCENARIOS: dict[str, Scenario] = {
+    "ActivityLogRepository.append": lambda db, s: ActivityLogRepository(db).append(
+        [
+            {
+                "student_id": s.user.id,
+                "activity_id": uuid.uuid4(),
+                "performed_at": datetime.now(UTC),
+                "performed_on": date.today(),
+                "reps": 10,
+            }
+        ]
+    ),
+    "ActivityLogRepository.get_rollups": lambda db, s: ActivityLogRepository(
+        db
+    ).get_rollups(ActivityLogWeekly, s.user.id, date.today(), date.today()),
+    "AnnotationRepository.get_by_id": lambda db, s: AnnotationRepository(db).get_by_id(
+        s.annotation.id
+    ),
+    "AnnotationRepository.get_in_window": lambda db, s: AnnotationRepository(
+        db
+    ).get_in_window(s.annotation.media_id, 0, 60_000),
+    "AnnotationRepository.create_many": lambda db, s: AnnotationRepository(
+        db
+    ).create_many(
+        [
+            {
+                "media_id": s.annotation.media_id,
+                "author_id": s.annotation.author_id,
+                "start_ms": 0,
+                "shapes": b"",
+            }
+        ]
+    ),
+    "AnnotationRepository.update": _update_annotation,
+    "AnnotationRepository.delete": _delete_annotation,
+    "CoachRepository.get_profile": lambda db, s: CoachRepository(db).get_profile(
+        s.user.id
+    ),
+    "CoachRepository.list_profiles": lambda db, _s: CoachRepository(db).list_profiles(),
+    "CoachRepository.list_profiles(user_ids)": lambda db, s: CoachRepository(
+        db
+    ).list_profiles([s.user.id]),
+    "CoachRepository.upsert_profile": lambda db, s: CoachRepository(db).upsert_profile(
+        s.user.id, {"bio": "Edited", "specialties": ["Tennis"]}
+    ),
+    "CoachRepository.list_coaching_pairs": lambda db, _s: CoachRepository(
+        db
+    ).list_coaching_pairs(),
+    "ContentRepository.get_folder": _loaded_folder,
+    "ContentRepository.get_folder_counts": lambda db, s: ContentRepository(
+        db
+    ).get_folder_counts(s.folder.coach_id, root=s.folder),
+    "ContentRepository.create_folder": lambda db, s: ContentRepository(
+        db
+    ).create_folder(_content_folder(s)),
+    "ContentRepository.move_folder": lambda db, s: _then(
+        _loaded_folder(db, s),
+        lambda folder: ContentRepository(db).move_folder(folder, None),
+    ),
+    "ContentRepository.get_subtree_path_length": lambda db, s: _then(
+        _loaded_folder(db, s),
+        lambda folder: ContentRepository(db).get_subtree_path_length(folder),
+    ),
+    "ContentRepository.update_folder": lambda db, s: _then(
+        _loaded_folder(db, s),
+        lambda folder: ContentRepository(db).update_folder(folder, {"name": "Edited"}),
+    ),
+    "ContentRepository.delete_folder": lambda db, s: ContentRepository(
+        db
+    ).delete_folder(s.folder),
+    "ContentRepository.get_item": _loaded_content_item,
+    "ContentRepository.list_items": lambda db, s: ContentRepository(db).list_items(
+        s.folder.coach_id, folder=s.folder, recursive=True
+    ),
+    "ContentRepository.create_item": lambda db, s: ContentRepository(db).create_item(
+        ContentItem(
+            coach_id=s.content_item.coach_id, title="New", type="video", tags=["new"]
+        )
+    ),
+    "ContentRepository.update_item": lambda db, s: _then(
+        _loaded_content_item(db, s),
+        lambda item: ContentRepository(db).update_item(item, {"title": "Edited"}),
+    ),
+    "ContentRepository.delete_item": lambda db, s: _then(
+        _loaded_content_item(db, s),
+        lambda item: ContentRepository(db).delete_item(item),
+    ),
+    "ContentRepository.search_items": lambda db, s: ContentRepository(db).search_items(
+        s.content_item.coach_id, s.content_item.tags, match_all=False
+    ),
+    "ContentRepository.get_tag_facets": lambda db, s: ContentRepository(
+        db
+    ).get_tag_facets(s.content_item.coach_id, s.content_item.tags),
+    "ContentRepository.list_titles": lambda db, _s: ContentRepository(db).list_titles(),
+    "ContentRepository.list_titles(coach_ids)": lambda db, s: ContentRepository(
+        db
+    ).list_titles([s.content_item.coach_id]),
+    "CreditRepository.get_accounts_for_student": lambda db, s: CreditRepository(
+        db
+    ).get_accounts_for_student(s.account.student_id),
+    "CreditRepository.get_account": lambda db, s: CreditRepository(db).get_account(
+        s.account.student_id, s.account.coach_id, s.account.service_id
+    ),
+    "CreditRepository.credit": lambda db, s: CreditRepository(db).credit(
+        s.account.student_id, s.account.coach_id, s.account.service_id, 5
+    ),
+    "CreditRepository.debit": lambda db, s: CreditRepository(db).debit(
+        s.account.student_id, s.account.coach_id, s.account.service_id, 1
+    ),
+    "CreditRepository.get_ledger": lambda db, s: CreditRepository(db).get_ledger(
+        s.account.id
+    ),
+    "CreditRepository.get_ledger_balance": lambda db, s: CreditRepository(
+        db
+    ).get_ledger_balance(s.account.id),
+    "CreditRepository.create_snapshots": lambda db, _s: CreditRepository(
+        db
+    ).create_snapshots(min_tail=1),
+    "ItemRepository.get_by_id": lambda db, s: ItemRepository(db).get_by_id(s.item.id),
+    "ItemRepository.get_all": lambda db, _s: ItemRepository(db).get_all(),
+    "ItemRepository.get_active": lambda db, _s: ItemRepository(db).get_active(),
+    "ItemRepository.get_by_name": lambda db, s: ItemRepository(db).get_by_name(
+        s.item.name
+    ),
+    "ItemRepository.create": lambda db, _s: ItemRepository(db).create(
+        ItemCreate(name="New")
+    ),
+    "ItemRepository.update": lambda db, s: ItemRepository(db).update(
+        s.item.id, ItemUpdate(description="Edited")
+    ),
+    "ItemRepository.delete": lambda db, s: ItemRepository(db).delete(s.item.id),
+    "JobRepository.enqueue": lambda db, _s: JobRepository(db).enqueue(
+        "index_check", {}, priority=0, max_attempts=3
+    ),
+    "JobRepository.enqueue(dedupe_key)": lambda db, _s: JobRepository(db).enqueue(
+        "index_check", {}, priority=0, max_attempts=3, dedupe_key="key"
+    ),
+    "JobRepository.claim_batch": lambda db, _s: JobRepository(db).claim_batch(
+        "index-check", 10
+    ),
+    "JobRepository.complete": lambda db, s: JobRepository(db).complete(s.job.id),
+    "JobRepository.retry": lambda db, s: JobRepository(db).retry(
+        s.job.id, "error", timedelta(seconds=1)
+    ),
+    "JobRepository.fail": lambda db, s: JobRepository(db).fail(s.job.id, "error"),
+    "JobRepository.requeue_stale": lambda db, _s: JobRepository(db).requeue_stale(
+        timedelta(minutes=5)
+    ),
+    "JobRepository.count_by_status": lambda db, _s: JobRepository(db).count_by_status(),
+    "MediaRepository.get_by_id": lambda db, s: MediaRepository(db).get_by_id(
+        s.media.id
+    ),
+    "MediaRepository.create": lambda db, s: MediaRepository(db).create(
+        MediaFile(
+            owner_id=s.media.owner_id,
+            filename="new.mp4",
+            content_type="video/mp4",
+            size=1,
+            sha256="0" * 64,
+        )
+    ),
+    "MediaRepository.get_viewable": lambda db, s: MediaRepository(db).get_viewable(
+        s.media.id, s.user.id
+    ),
+    "MediaRepository.mark_complete": lambda db, s: MediaRepository(db).mark_complete(
+        s.media.id
+    ),
+    "MediaRepository.delete": _delete_media,
+    "ProgramRepository.get_tree": lambda db, s: ProgramRepository(db).get_tree(
+        s.program.id
+    ),
+    "ProgramRepository.get_by_id": lambda db, s: ProgramRepository(db).get_by_id(
+        s.program.id
+    ),
+    "ProgramRepository.list_for_coach": lambda db, s: ProgramRepository(
+        db
+    ).list_for_coach(s.program.coach_id),
+    "ProgramRepository.lock_for_update": lambda db, s: ProgramRepository(
+        db
+    ).lock_for_update(s.program.id, s.program.coach_id),
+    "ProgramRepository.create": _create_program,
+    "ProgramRepository.save_tree": _save_tree,
+    "ProgramRepository.delete": lambda db, s: ProgramRepository(db).delete(
+        s.program.id, s.program.coach_id
+    ),
+    "ProgramRepository.assign_students": lambda db, s: ProgramRepository(
+        db
+    ).assign_students(s.program.id, s.program.coach_id, [s.user.id]),
+    "ProgramRepository.unassign_student": lambda db, s: ProgramRepository(
+        db
+    ).unassign_student(s.program.id, s.user.id),
+    "ProgramRepository.list_assignments": lambda db, s: ProgramRepository(
+        db
+    ).list_assignments(s.program.id),
+    "UserRepository.get_by_auth_subject": lambda db, s: UserRepository(
+        db
+    ).get_by_auth_subject(s.user.auth_provider, s.user.auth_subject),
+    "UserRepository.upsert_from_firebase": lambda db, s: UserRepository(
+        db
+    ).upsert_from_firebase({"uid": s.user.auth_subject, "email": "a@b.c"}),
+    "UserRepository.create": lambda db, _s: UserRepository(db).create(
+        UserCreate(
+            email="new@example.com", auth_provider="firebase", auth_subject="new"
+        )
+    ),
+    "UserRepository.update": _update_user,
+}
+
+# Scenarios that read a whole table on purpose, with the reason
+FULL_SCANS = {
+    "CoachRepository.list_profiles": "recommendation index rebuild",
+    "CoachRepository.list_coaching_pairs": "recommendation index rebuild",
+    "ContentRepository.list_titles": "autocomplete index rebuild",
+    "CreditRepository.create_snapshots": "periodic batch over every account",
+    "JobRepository.count_by_status": "metrics histogram over every job",
+}
+
+
+async def _then(first: Awaitable[Any], then: Callable[[Any], Awaitable[Any]]) -> Any:
+    return await then(await first)
+
+
+def _value(column: Any, g: str, parents: dict[str, str]) -> str | None:
+    """SQL expression producing row ``g``'s value for a column."""
+    foreign_keys = list(column.foreign_keys)
+    if foreign_keys:
+        target = foreign_keys[0].column.table
+        if target is column.table:
+            return None  # self-references stay NULL
+        ids = parents[target.name]
+        return f"{ids}[1 + {g} % cardinality({ids})]"
+    default = column.default
+    if default is not None and default.is_scalar:
+        return text_literal(default.arg)
+    kind = column.type
+    if isinstance(kind, Uuid):
+        return "gen_random_uuid()"
+    if isinstance(kind, Boolean):
+        return f"{g} % 2 = 0"
+    if isinstance(kind, Integer):
+        return g
+    if isinstance(kind, Float):
+        return f"{g} * 0.5"
+    if isinstance(kind, DateTime):
+        return f"now() - {g} * interval '1 minute'"
+    if isinstance(kind, Date):
+        return "current_date"
+    if isinstance(kind, ARRAY):
+        return f"ARRAY['tag-' || {g} % 50, 'tag-' || {g} % 7]"
+    if isinstance(kind, JSON):
+        empty = default.arg(None) if default is not None else {}
+        return text_literal(json.dumps(empty))
+    if isinstance(kind, LargeBinary):
+        return "'\\x00'::bytea"
+    if isinstance(kind, String):
+        value = f"'{column.name}-' || {g}"
+        return f"left({value}, {kind.length})" if kind.length else value
+    raise TypeError(f"No seed value for {column.table.name}.{column.name}")
+
+
+def text_literal(value: Any) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int | float):
+        return str(value)
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def _seed_statement(table: Table, rows: int) -> str:
+    parents = {
+        fk.column.table.name: f"p{i}.ids"
+        for i, fk in enumerate(table.foreign_keys)
+        if fk.column.table is not table
+    }
+    columns, values = [], []
+    for column in table.columns:
+        if column.primary_key and isinstance(column.type, Integer):
+            continue  # identity
+        value = _value(column, "g", parents)
+        if value is not None:
+            columns.append(column.name)
+            values.append(value)
+    sources = ["generate_series(1, :rows) AS g"] + [
+        f"(SELECT array_agg({fk.column.name}) AS ids FROM {fk.column.table.name}) AS p{i}"
+        for i, fk in enumerate(table.foreign_keys)
+        if fk.column.table is not table
+    ]
+    return (
+        f"INSERT INTO {table.name} ({', '.join(columns)}) "
+        f"SELECT {', '.join(values)} FROM {', '.join(sources)}"
+    ).replace(":rows", str(rows))
+
+
+def _seq_scans(plan: dict, under_limit: bool = False) -> Iterator[tuple[dict, bool]]:
+    node = plan["Node Type"]
+    if node == "Seq Scan":
+        yield plan, under_limit
+    limited = node == "Limit" or (under_limit and node in _LIMIT_TRANSPARENT)
+    for child in plan.get("Plans", ()):
+        yield from _seq_scans(child, limited)
+
+
+def _relations(plan: dict) -> Iterator[str]:
+    if "Relation Name" in plan:
+        yield plan["Relation Name"]
+    for child in plan.get("Plans", ()):
+        yield from _relations(child)
+
+
+async def _explain(
+    conn: AsyncConnection,
+    scenario: str,
+    statements: list[tuple[str, Any]],
+    table_rows: dict[str, int],
+    parents: dict[str, str],
+    threshold: int,
+) -> list[Finding]:
+    findings = []
+    seen = set()
+    for statement, parameters in statements:
+        verb = statement.lstrip().split(None, 1)[0].upper()
+        if statement in seen or verb not in {
+            "SELECT",
+            "INSERT",
+            "UPDATE",
+            "DELETE",
+            "WITH",
+        }:
+            continue
+        seen.add(statement)
+        result = await conn.exec_driver_sql(
+            f"EXPLAIN (FORMAT JSON) {statement}", parameters
+        )
+        plan = result.scalar_one()[0]["Plan"]
+        statement = " ".join(statement.split())
+        read: dict[str, set[str]] = {}
+        for relation in _relations(plan):
+            if relation in parents:
+                read.setdefault(parents[relation], set()).add(relation)
+        for parent, partitions in read.items():
+            if len(partitions) > 1:
+                findings.append(
+                    Finding(
+                        scenario,
+                        f"Read {len(partitions)} partitions",
+                        parent,
+                        sum(table_rows.get(partition, 0) for partition in partitions),
+                        None,
+                        statement,
+                    )
+                )
+        for scan, under_limit in _seq_scans(plan):
+            relation = scan["Relation Name"]
+            rows = table_rows.get(relation, 0)
+            filtered = scan.get("Filter")
+            if scenario in FULL_SCANS:
+                continue
+            if rows >= threshold and (filtered or not under_limit):
+                findings.append(
+                    Finding(scenario, "Seq Scan", relation, rows, filtered, statement)
+                )
+    return findings
+
+
+def redundant_indexes() -> list[str]:
+    """Plain indexes whose columns lead another index or unique constraint.
+
+    Every query such an index serves, the wider one serves as well, so it
+    only costs writes and memory.
+    """
+    redundant = []
+    for table in Base.metadata.sorted_tables:
+        wider = [
+            tuple(column.name for column in constraint.columns)
+            for constraint in table.constraints
+            if isinstance(constraint, PrimaryKeyConstraint | UniqueConstraint)
+        ] + [
+            tuple(column.name for column in index.columns)
+            for index in table.indexes
+            if _is_plain(index)
+        ]
+        for index in table.indexes:
+            if index.unique or not _is_plain(index):
+                continue
+            columns = tuple(column.name for column in index.columns)
+            if any(
+                len(other) > len(columns) and other[: len(columns)] == columns
+                for other in wider
+            ):
+                redundant.append(f"{index.name} on {table.name} {columns}")
+    return redundant
+
+
+def _is_plain(index: Index) -> bool:
+    options = index.dialect_options["postgresql"]
+    return options["where"] is None and options["using"] in (False, "btree")
+
+
+async def _samples(conn: AsyncConnection, rows: int) -> Samples:
+    models = {
+        "user": User,
+        "item": Item,
+        "folder": ContentFolder,
+        "content_item": ContentItem,
+        "account": CreditAccount,
+        "job": Job,
+        "media": MediaFile,
+        "annotation": VideoAnnotation,
+        "program": Program,
+    }
+    session = AsyncSession(bind=conn, expire_on_commit=False)
+    picked = {}
+    for name, model in models.items():
+        picked[name] = await session.scalar(select(model).offset(rows // 2).limit(1))
+    session.expunge_all()
+    return Samples(**picked)
+
+
+async def check(rows: int, threshold: int, keep: bool = False) -> list[Finding]:
+    """Seed a scratch schema, run every scenario and collect bad scans."""
+    engine = create_async_engine(
+        str(get_settings().database_url),
+        poolclass=NullPool,
+        connect_args={"server_settings": {"search_path": SCHEMA}},
+    )
+    findings: list[Finding] = []
+    try:
+        async with engine.begin() as conn:
+            await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+            await conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+            await conn.run_sync(Base.metadata.create_all)
+            # Seeded timestamps go back one minute per row
+            await conn.run_sync(
+                create_partitions, date.today() - timedelta(minutes=rows), 1
+            )
+            for table in Base.metadata.sorted_tables:
+                await conn.execute(text(_seed_statement(table, rows)))
+            await conn.execute(text("ANALYZE"))
+
+        async with engine.connect() as conn:
+            result = await conn.execute(
+                text(
+                    "SELECT relname, reltuples::bigint FROM pg_class "
+                    "WHERE relnamespace = CAST(:schema AS regnamespace)"
+                ),
+                {"schema": SCHEMA},
+            )
+            table_rows = dict(result.all())
+            result = await conn.execute(
+                text(
+                    "SELECT inhrelid::regclass::text, inhparent::regclass::text "
+                    "FROM pg_inherits"
+                )
+            )
+            parents = dict(result.all())
+            samples = await _samples(conn, rows)
+            await conn.rollback()
+
+            for name, scenario in SCENARIOS.items():
+                captured = _Captured()
+
+                def capture(
+                    _conn: Any,
+                    _cursor: Any,
+                    statement: str,
+                    parameters: Any,
+                    _context: Any,
+                    many: bool,
+                    captured: _Captured = captured,
+                ) -> None:
+                    if not many:
+                        captured.statements.append((statement, parameters))
+
+                transaction = await conn.begin()
+                event.listen(conn.sync_connection, "before_cursor_execute", capture)
+                try:
+                    async with AsyncSession(bind=conn) as session:
+                        await scenario(session, samples)
+                finally:
+                    event.remove(conn.sync_connection, "before_cursor_execute", capture)
+                findings += await _explain(
+                    conn, name, captured.statements, table_rows, parents, threshold
+                )
+                await transaction.rollback()
+    finally:
+        if not keep:
+            async with engine.begin() as conn:
+                await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        await engine.dispose()
+    return findings
+
+
+def main() -> None:
+    """Run the index coverage check and report what it finds."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--rows", type=int, default=5000, help="rows to seed in every table"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=int,
+        default=1000,
+        help="report sequential scans of tables with at least this many rows",
+    )
+    parser.add_argument(
+        "--keep", action="store_true", help=f"keep the {SCHEMA} schema afterwards"
+    )
+    args = parser.parse_args()
+
+    redundant = redundant_indexes()
+    for index in redundant:
+        print(f"Redundant index {index}")
+    findings = asyncio.run(check(args.rows, args.threshold, args.keep))
+    for finding in findings:
+        print(
+            f"[{finding.scenario}] {finding.issue} of {finding.relation} "
+            f"({finding.rows} rows)"
+        )
+        if finding.filter:
+            print(f"    Filter: {finding.filter}")
+        print(f"    {finding.statement[:300]}")
+    if findings or redundant:
+        print(
+            f"{len(findings)} large sequential scans or unpruned reads, "
+            f"{len(redundant)} redundant indexes",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+    print(
+        f"No sequential scans over {args.threshold} rows, unpruned reads "
+        "or redundant indexes"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -5,23 +5,44 @@ This is useful for development and initial deployments.
 For production, consider using Alembic migrations for more control.
 """
 
-from sqlalchemy import text
+from sqlalchemy import Connection, text
 
 from app.db.models.base import Base
-from app.db.session import engine
+from app.db.partitions import create_partitions
+from app.db.session import get_engine
 
 # Import all models to ensure they're registered with Base.metadata
-from app.db.models import item, user  # noqa: F401
+from app.db.models import activity_log, annotation, coach, content, credit, item, job, media, program, user  # noqa: F401
+
+# Indexes removed from the models; create_all never drops anything, so
+# databases created before their removal drop them on startup
+_DROPPED_INDEXES = (
+    "ix_users_auth_provider",
+    "ix_users_auth_subject",
+    "ix_items_name",
+)
 
 
 async def init_db() -> None:
     """Create all database tables if they don't exist.
 
     Uses SQLAlchemy's create_all which is idempotent - it only creates
-    tables that don't already exist.
+    tables that don't already exist. Indexes added or removed are then
+    created or dropped, and partitioned tables get any partitions they are
+    missing.
     """
-    async with engine.begin() as conn:
+    async with get_engine().begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(_sync_indexes)
+        await conn.run_sync(create_partitions)
+
+
+def _sync_indexes(conn: Connection) -> None:
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(conn, checkfirst=True)
+    for name in _DROPPED_INDEXES:
+        conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
 
 
 async def check_db_connection() -> bool:
@@ -31,7 +52,7 @@ async def check_db_connection() -> bool:
         True if connection successful, False otherwise.
     """
     try:
-        async with engine.connect() as conn:
+        async with get_engine().connect() as conn:
             await conn.execute(text("SELECT 1"))
         return True
     except Exception:
@@ -1,5 +1,72 @@
-from app.db.models.base import Base, TimestampMixin
+from app.db.models.activity_log import (
+    ActivityLog,
+    ActivityLogDaily,
+    ActivityLogWeekly,
+    ActivityRollupMixin,
+)
+from app.db.models.annotation import VideoAnnotation
+from app.db.models.base import (
+    Base,
+    Partitioning,
+    PartitionMethod,
+    TimestampMixin,
+    get_partitioning,
+    hash_partitioned,
+    range_partitioned,
+)
+from app.db.models.coach import CoachProfile
+from app.db.models.content import ContentFolder, ContentItem, ContentType
+from app.db.models.credit import (
+    CreditAccount,
+    CreditBalanceSnapshot,
+    CreditEntryKind,
+    CreditLedgerEntry,
+)
 from app.db.models.item import Item
+from app.db.models.job import Job, JobStatus
+from app.db.models.media import MediaFile, MediaStatus
+from app.db.models.program import (
+    Program,
+    ProgramActivity,
+    ProgramAssignment,
+    ProgramDay,
+    ProgramStatus,
+    ProgramWeek,
+)
 from app.db.models.user import User, UserMode
 
-__all__ = ["Base", "Item", "TimestampMixin", "User", "UserMode"]
+__all__ = [
+    "ActivityLog",
+    "ActivityLogDaily",
+    "ActivityLogWeekly",
+    "ActivityRollupMixin",
+    "Base",
+    "CoachProfile",
+    "ContentFolder",
+    "ContentItem",
+    "ContentType",
+    "CreditAccount",
+    "CreditBalanceSnapshot",
+    "CreditEntryKind",
+    "CreditLedgerEntry",
+    "Item",
+    "Job",
+    "JobStatus",
+    "MediaFile",
+    "MediaStatus",
+    "PartitionMethod",
+    "Partitioning",
+    "Program",
+    "ProgramActivity",
+    "ProgramAssignment",
+    "ProgramDay",
+    "ProgramStatus",
+    "ProgramWeek",
+    "TimestampMixin",
+    "User",
+    "UserMode",
+    "VideoAnnotation",
+    "get_partitioning",
+    "hash_partitioned",
+    "range_partitioned",
+]
@@ -0,0 +1,116 @@
+"""Workout activity log models.
+
+Students log what they actually did for a program activity after every
+session, so ``activity_logs`` is an append-only time series. It is range
+partitioned by month of ``performed_at``, so old months can be detached or
+dropped whole, and each month's partition stays small. Rows arrive roughly
+in ``performed_at`` order, which keeps a BRIN index on it tiny and cheap to
+maintain next to a B-tree that would grow with every insert.
+
+Progress charts never scan the log. Each batch of entries also adds its
+totals to ``activity_log_daily`` and ``activity_log_weekly`` in the same
+transaction, so the rollups always match the log and a chart reads one
+narrow row per day or week.
+"""
+
+import uuid
+from datetime import date, datetime
+
+from sqlalchemy import (
+    BigInteger,
+    Date,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    func,
+)
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.models.base import Base, range_partitioned
+
+
+class ActivityLog(Base):
+    """One logged performance of a program activity."""
+
+    __tablename__ = "activity_logs"
+
+    __table_args__ = (
+        Index(
+            "ix_activity_logs_performed_at",
+            "performed_at",
+            postgresql_using="brin",
+        ),
+        range_partitioned("performed_at", "month"),
+    )
+
+    id: Mapped[int] = mapped_column(
+        BigInteger,
+        primary_key=True,
+        autoincrement=True,
+    )
+    student_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    # Not a foreign key: history outlives edits to the program tree
+    activity_id: Mapped[uuid.UUID] = mapped_column(
+        nullable=False,
+    )
+    # Part of the primary key because it is the partition key
+    performed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        primary_key=True,
+    )
+    # The student's local date at performed_at, which rollups group by
+    performed_on: Mapped[date] = mapped_column(
+        Date,
+        nullable=False,
+    )
+    sets: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    reps: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    duration_seconds: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    distance_meters: Mapped[float | None] = mapped_column(Float, nullable=True)
+    count: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    logged_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+
+
+class ActivityRollupMixin:
+    """Totals of a student's logs of one activity over one period."""
+
+    student_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    # First day of the period, so charts over a date range read one
+    # contiguous slice of the primary key
+    period_start: Mapped[date] = mapped_column(
+        Date,
+        primary_key=True,
+    )
+    activity_id: Mapped[uuid.UUID] = mapped_column(
+        primary_key=True,
+    )
+    entries: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    sets: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    reps: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    duration_seconds: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    distance_meters: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    count: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+
+
+class ActivityLogDaily(Base, ActivityRollupMixin):
+    """Per-day totals of a student's activity logs."""
+
+    __tablename__ = "activity_log_daily"
+
+
+class ActivityLogWeekly(Base, ActivityRollupMixin):
+    """Per-week totals of a student's activity logs; weeks start on Monday."""
+
+    __tablename__ = "activity_log_weekly"
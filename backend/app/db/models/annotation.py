@@ -0,0 +1,66 @@
+"""Video annotation model."""
+
+import uuid
+
+from sqlalchemy import ForeignKey, Index, Integer, LargeBinary, String, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.models.base import Base, TimestampMixin
+
+
+class VideoAnnotation(Base, TimestampMixin):
+    """A set of shapes drawn over a span of a video.
+
+    Shapes are stored in the compact binary format from ``app.core.strokes``
+    rather than as JSON. Times are whole milliseconds, indexed per video so
+    the player can load just the window it is showing. Annotations with an
+    end time last at most ``MAX_ANNOTATION_SECONDS``, so a window only scans
+    the ones that start shortly before it; open-ended annotations have an
+    index of their own.
+    """
+
+    __tablename__ = "video_annotations"
+
+    __table_args__ = (
+        Index("ix_video_annotations_media_start", "media_id", "start_ms"),
+        Index(
+            "ix_video_annotations_media_open_start",
+            "media_id",
+            "start_ms",
+            postgresql_where=text("end_ms IS NULL"),
+        ),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        primary_key=True,
+        default=uuid.uuid4,
+    )
+    media_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("media_files.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    author_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    label: Mapped[str | None] = mapped_column(
+        String(255),
+        nullable=True,
+    )
+    start_ms: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+    )
+    # None keeps the annotation on screen until the end of the video
+    end_ms: Mapped[int | None] = mapped_column(
+        Integer,
+        nullable=True,
+    )
+    shapes: Mapped[bytes] = mapped_column(
+        LargeBinary,
+        nullable=False,
+    )
+
+    def __repr__(self) -> str:
+        return f"<VideoAnnotation(id={self.id}, media_id={self.media_id})>"
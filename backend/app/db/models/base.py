@@ -1,6 +1,9 @@
+from dataclasses import dataclass
 from datetime import datetime
+from enum import Enum
+from typing import Any
 
-from sqlalchemy import DateTime, func
+from sqlalchemy import DateTime, Table, func
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
@@ -24,3 +27,70 @@ class TimestampMixin:
         onupdate=func.now(),
         nullable=False,
     )
+
+
+class PartitionMethod(str, Enum):
+    """How a partitioned table assigns rows to partitions."""
+
+    HASH = "hash"
+    RANGE = "range"
+
+
+# Periods a range-partitioned table can give each partition
+RANGE_INTERVALS = ("day", "week", "month")
+
+
+@dataclass(frozen=True)
+class Partitioning:
+    """How a partitioned table splits its rows.
+
+    Hash partitioning spreads rows evenly over ``partitions`` tables by the
+    hash of ``key``. Range partitioning gives each ``interval`` of the date
+    or timestamp column ``key`` a table of its own.
+    """
+
+    method: PartitionMethod
+    key: str
+    partitions: int = 0
+    interval: str = ""
+
+
+def hash_partitioned(key: str, partitions: int) -> dict[str, Any]:
+    """Table arguments that hash-partition a model's table by ``key``.
+
+    Postgres requires every unique constraint of a partitioned table to
+    include the partition key, so ``key`` must be part of the primary key::
+
+        __table_args__ = hash_partitioned("coach_id", partitions=16)
+
+    Combine with other table arguments by putting the dict last in a tuple.
+    """
+    if partitions < 2:
+        raise ValueError("A hash-partitioned table needs at least 2 partitions")
+    return _partitioned(Partitioning(PartitionMethod.HASH, key, partitions=partitions))
+
+
+def range_partitioned(key: str, interval: str) -> dict[str, Any]:
+    """Table arguments that range-partition a model's table by ``key``.
+
+    Each ``interval`` ("day", "week" or "month") of ``key`` gets its own
+    partition. As with hash partitioning, ``key`` must be part of the
+    primary key.
+    """
+    if interval not in RANGE_INTERVALS:
+        raise ValueError(f"interval must be one of {', '.join(RANGE_INTERVALS)}")
+    return _partitioned(Partitioning(PartitionMethod.RANGE, key, interval=interval))
+
+
+def _partitioned(partitioning: Partitioning) -> dict[str, Any]:
+    return {
+        "postgresql_partition_by": (
+            f"{partitioning.method.value.upper()} ({partitioning.key})"
+        ),
+        "info": {"partitioning": partitioning},
+    }
+
+
+def get_partitioning(table: Table) -> Partitioning | None:
+    """How ``table`` is partitioned, or None if it is a plain table."""
+    return table.info.get("partitioning")
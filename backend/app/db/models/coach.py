@@ -0,0 +1,57 @@
+"""Coach profile model for discovery and recommendations."""
+
+import uuid
+
+from sqlalchemy import Float, ForeignKey, Integer, String, Text
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.models.base import Base, TimestampMixin
+
+
+class CoachProfile(Base, TimestampMixin):
+    """The public profile a coach is discovered and recommended by."""
+
+    __tablename__ = "coach_profiles"
+
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    bio: Mapped[str | None] = mapped_column(
+        Text,
+        nullable=True,
+    )
+    specialties: Mapped[list[str]] = mapped_column(
+        ARRAY(String(50)),
+        nullable=False,
+        default=list,
+    )
+    # Display name of the area, e.g. "Santa Monica, CA"
+    location: Mapped[str | None] = mapped_column(
+        String(255),
+        nullable=True,
+    )
+    latitude: Mapped[float | None] = mapped_column(
+        Float,
+        nullable=True,
+    )
+    longitude: Mapped[float | None] = mapped_column(
+        Float,
+        nullable=True,
+    )
+    # Whole currency units
+    hourly_rate: Mapped[int | None] = mapped_column(
+        Integer,
+        nullable=True,
+    )
+    # Aggregates of student reviews, never set by the coach
+    rating: Mapped[float | None] = mapped_column(
+        Float,
+        nullable=True,
+    )
+    review_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+    )
@@ -0,0 +1,141 @@
+"""Content library models: folders and the videos, images and documents in them.
+
+Folders nest without limit. Besides the ``parent_id`` adjacency link, each
+folder stores its materialized path, e.g. ``/<root id>/<child id>/``, built
+from folder IDs. A whole subtree is then the contiguous range of paths
+starting with the folder's own path, which a single B-tree range scan on
+``(coach_id, path)`` returns without a recursive CTE.
+"""
+
+import uuid
+from enum import Enum
+
+from sqlalchemy import BigInteger, ForeignKey, Index, Integer, String, Text
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.models.base import Base, TimestampMixin
+
+
+class ContentType(str, Enum):
+    """Enum for the kind of content item."""
+
+    VIDEO = "video"
+    IMAGE = "image"
+    DOCUMENT = "document"
+    LINK = "link"
+
+
+# Longest folder path. Each level adds 33 characters, so this allows 62
+# levels, well past any real library. Paths are also B-tree index keys,
+# whose size Postgres caps at about 2.7kB, so nesting cannot be unbounded.
+MAX_FOLDER_PATH_LENGTH = 2048
+
+
+class ContentFolder(Base, TimestampMixin):
+    """A folder in a coach's content library."""
+
+    __tablename__ = "content_folders"
+
+    __table_args__ = (Index("ix_content_folders_coach_path", "coach_id", "path"),)
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        primary_key=True,
+        default=uuid.uuid4,
+    )
+    coach_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    parent_id: Mapped[uuid.UUID | None] = mapped_column(
+        ForeignKey("content_folders.id", ondelete="CASCADE"),
+        nullable=True,
+        index=True,
+    )
+    name: Mapped[str] = mapped_column(
+        String(255),
+        nullable=False,
+    )
+    # Tailwind color class used by the studio UI
+    color: Mapped[str] = mapped_column(
+        String(50),
+        nullable=False,
+    )
+    # Slash-separated folder IDs from the root down to this folder. The "C"
+    # collation keeps comparisons bytewise so subtree range scans are exact.
+    path: Mapped[str] = mapped_column(
+        String(MAX_FOLDER_PATH_LENGTH, collation="C"),
+        nullable=False,
+    )
+
+    @property
+    def depth(self) -> int:
+        """Nesting depth, 0 for a top-level folder."""
+        return self.path.count("/") - 2
+
+    def __repr__(self) -> str:
+        return f"<ContentFolder(id={self.id}, name={self.name!r})>"
+
+
+class ContentItem(Base, TimestampMixin):
+    """A video, image, document or link in a coach's content library."""
+
+    __tablename__ = "content_items"
+
+    __table_args__ = (
+        Index("ix_content_items_coach_folder", "coach_id", "folder_id"),
+        # Serves tag containment (@>) and overlap (&&) filters
+        Index("ix_content_items_tags", "tags", postgresql_using="gin"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        primary_key=True,
+        default=uuid.uuid4,
+    )
+    coach_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    # None means the item sits at the root of the library, uncategorized
+    folder_id: Mapped[uuid.UUID | None] = mapped_column(
+        ForeignKey("content_folders.id", ondelete="SET NULL"),
+        nullable=True,
+        index=True,
+    )
+    title: Mapped[str] = mapped_column(
+        String(255),
+        nullable=False,
+    )
+    description: Mapped[str | None] = mapped_column(
+        Text,
+        nullable=True,
+    )
+    type: Mapped[str] = mapped_column(
+        String(20),
+        nullable=False,
+    )
+    tags: Mapped[list[str]] = mapped_column(
+        ARRAY(String(50)),
+        nullable=False,
+        default=list,
+    )
+    thumbnail_url: Mapped[str | None] = mapped_column(
+        String(2048),
+        nullable=True,
+    )
+    file_url: Mapped[str | None] = mapped_column(
+        String(2048),
+        nullable=True,
+    )
+    # Length in seconds, for videos
+    duration: Mapped[int | None] = mapped_column(
+        Integer,
+        nullable=True,
+    )
+    file_size: Mapped[int | None] = mapped_column(
+        BigInteger,
+        nullable=True,
+    )
+
+    def __repr__(self) -> str:
+        return f"<ContentItem(id={self.id}, title={self.title!r})>"
@@ -0,0 +1,162 @@
+"""Bundle credit models.
+
+Credits are tracked per (student, coach, service) account. The account row
+holds the running balance that redemptions decrement atomically, while
+``credit_ledger`` is the append-only history of every change. Periodic
+balance snapshots let a balance be recomputed from the latest snapshot plus
+a short tail of ledger entries instead of the full history.
+"""
+
+import uuid
+from datetime import datetime
+from enum import Enum
+
+from sqlalchemy import (
+    BigInteger,
+    CheckConstraint,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    UniqueConstraint,
+    func,
+)
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.models.base import Base, TimestampMixin
+
+
+class CreditEntryKind(str, Enum):
+    """Enum for the reason a ledger entry was written."""
+
+    GRANT = "grant"
+    REDEEM = "redeem"
+    REFUND = "refund"
+    ADJUST = "adjust"
+
+
+class CreditAccount(Base, TimestampMixin):
+    """Credit balance a student holds for one coach service bundle."""
+
+    __tablename__ = "credit_accounts"
+
+    # The CHECK constraint is the last line of defence: even a buggy caller
+    # cannot drive a balance below zero.
+    __table_args__ = (
+        UniqueConstraint(
+            "student_id", "coach_id", "service_id", name="uq_credit_account_owner"
+        ),
+        CheckConstraint("balance >= 0", name="ck_credit_account_balance_nonnegative"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        primary_key=True,
+        default=uuid.uuid4,
+    )
+    student_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    coach_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    # Services are not persisted yet, so this is the client-side service ID
+    service_id: Mapped[str] = mapped_column(
+        String(64),
+        nullable=False,
+    )
+    balance: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+    )
+
+    def __repr__(self) -> str:
+        return f"<CreditAccount(id={self.id}, balance={self.balance})>"
+
+
+class CreditLedgerEntry(Base):
+    """Append-only record of a single credit balance change.
+
+    The identity primary key doubles as a global sequence number, so
+    "entries after snapshot X" is a simple range scan on the index.
+    """
+
+    __tablename__ = "credit_ledger"
+
+    __table_args__ = (Index("ix_credit_ledger_account_id_id", "account_id", "id"),)
+
+    id: Mapped[int] = mapped_column(
+        BigInteger,
+        primary_key=True,
+        autoincrement=True,
+    )
+    account_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("credit_accounts.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    kind: Mapped[str] = mapped_column(
+        String(20),
+        nullable=False,
+    )
+    delta: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+    )
+    balance_after: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+    )
+    # External reference such as a cart, order or booking ID
+    reference: Mapped[str | None] = mapped_column(
+        String(255),
+        nullable=True,
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+
+    def __repr__(self) -> str:
+        return f"<CreditLedgerEntry(id={self.id}, delta={self.delta})>"
+
+
+class CreditBalanceSnapshot(Base):
+    """Balance of an account as of a given ledger entry."""
+
+    __tablename__ = "credit_balance_snapshots"
+
+    __table_args__ = (
+        Index(
+            "ix_credit_balance_snapshots_account_id_as_of",
+            "account_id",
+            "as_of_entry_id",
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(
+        BigInteger,
+        primary_key=True,
+        autoincrement=True,
+    )
+    account_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("credit_accounts.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    balance: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+    )
+    # Last ledger entry included in this balance
+    as_of_entry_id: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
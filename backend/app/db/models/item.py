@@ -1,6 +1,6 @@
 from uuid import UUID, uuid4
 
-from sqlalchemy import String, Text
+from sqlalchemy import Index, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.models.base import Base, TimestampMixin
@@ -11,6 +11,18 @@ class Item(Base, TimestampMixin):
 
     __tablename__ = "items"
 
+    __table_args__ = (
+        # Names identify items, and imports merge on them
+        Index("uq_items_name", "name", unique=True),
+        # Active items are listed by name; inactive ones are never listed
+        Index(
+            "ix_items_active_name",
+            "name",
+            "id",
+            postgresql_where="is_active",
+        ),
+    )
+
     id: Mapped[UUID] = mapped_column(
         primary_key=True,
         default=uuid4,
@@ -18,7 +30,6 @@ class Item(Base, TimestampMixin):
     name: Mapped[str] = mapped_column(
         String(255),
         nullable=False,
-        index=True,
     )
     description: Mapped[str | None] = mapped_column(
         Text,
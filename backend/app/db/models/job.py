@@ -0,0 +1,126 @@
+"""Background job model for the Postgres-backed job queue."""
+
+from datetime import datetime
+from enum import Enum
+
+from sqlalchemy import (
+    JSON,
+    BigInteger,
+    DateTime,
+    Index,
+    Integer,
+    String,
+    Text,
+    func,
+    text,
+)
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.models.base import Base, TimestampMixin
+
+
+class JobStatus(str, Enum):
+    """Enum for job lifecycle status.
+
+    Jobs that succeed are deleted in the same transaction as their side
+    effects, so there is no "done" status and the table stays small.
+    """
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    FAILED = "failed"
+
+
+# Jobs that have not finished yet, as an index predicate
+PENDING = text("status IN ('queued', 'running')")
+
+
+class Job(Base, TimestampMixin):
+    """A unit of deferred work claimed by queue workers."""
+
+    __tablename__ = "jobs"
+
+    # Partial index matching the claim query, so workers only ever scan
+    # runnable jobs regardless of how many have permanently failed.
+    __table_args__ = (
+        Index(
+            "ix_jobs_claim",
+            "priority",
+            "run_at",
+            postgresql_where="status = 'queued'",
+        ),
+        Index(
+            "ix_jobs_running_locked_at",
+            "locked_at",
+            postgresql_where="status = 'running'",
+        ),
+        # At most one pending job per dedupe key, so repeated enqueues of the
+        # same work collapse into the job already waiting or running
+        Index(
+            "uq_jobs_pending_dedupe_key",
+            "name",
+            "dedupe_key",
+            unique=True,
+            postgresql_where=PENDING,
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(
+        BigInteger,
+        primary_key=True,
+        autoincrement=True,
+    )
+    name: Mapped[str] = mapped_column(
+        String(100),
+        nullable=False,
+    )
+    # Jobs with the same name and key are the same work; see JobQueue.enqueue
+    dedupe_key: Mapped[str | None] = mapped_column(
+        String(255),
+        nullable=True,
+    )
+    payload: Mapped[dict] = mapped_column(
+        JSON,
+        nullable=False,
+        default=dict,
+    )
+    # Lower values run first
+    priority: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+    )
+    status: Mapped[str] = mapped_column(
+        String(20),
+        nullable=False,
+        default=JobStatus.QUEUED.value,
+    )
+    attempts: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+    )
+    max_attempts: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+    )
+    run_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+    locked_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+    locked_by: Mapped[str | None] = mapped_column(
+        String(255),
+        nullable=True,
+    )
+    last_error: Mapped[str | None] = mapped_column(
+        Text,
+        nullable=True,
+    )
+
+    def __repr__(self) -> str:
+        return f"<Job(id={self.id}, name={self.name!r}, status={self.status!r})>"
@@ -0,0 +1,61 @@
+"""Media file model for uploaded videos, photos and documents."""
+
+import uuid
+from enum import Enum
+
+from sqlalchemy import BigInteger, ForeignKey, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.models.base import Base, TimestampMixin
+
+
+class MediaStatus(str, Enum):
+    """Enum for media upload status."""
+
+    UPLOADING = "uploading"
+    COMPLETE = "complete"
+
+
+class MediaFile(Base, TimestampMixin):
+    """A file uploaded by a user and stored by the media storage backend.
+
+    The bytes themselves live on disk; this row records ownership, the
+    declared size and checksum, and whether the upload has completed.
+    """
+
+    __tablename__ = "media_files"
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        primary_key=True,
+        default=uuid.uuid4,
+    )
+    owner_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    filename: Mapped[str] = mapped_column(
+        String(255),
+        nullable=False,
+    )
+    content_type: Mapped[str] = mapped_column(
+        String(127),
+        nullable=False,
+    )
+    size: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+    )
+    # Hex-encoded SHA-256 declared by the client, verified on completion
+    sha256: Mapped[str] = mapped_column(
+        String(64),
+        nullable=False,
+    )
+    status: Mapped[str] = mapped_column(
+        String(20),
+        nullable=False,
+        default=MediaStatus.UPLOADING.value,
+    )
+
+    def __repr__(self) -> str:
+        return f"<MediaFile(id={self.id}, filename={self.filename!r})>"
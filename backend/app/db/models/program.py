@@ -0,0 +1,220 @@
+"""Training program models.
+
+A program is a tree: Program -> ProgramWeek -> ProgramDay -> ProgramActivity.
+Each level is its own table with an indexed foreign key to its parent, so a
+single node can be updated without rewriting the rest of the program.
+"""
+
+import uuid
+from datetime import date, datetime
+from enum import Enum
+
+from sqlalchemy import (
+    JSON,
+    Date,
+    DateTime,
+    ForeignKey,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+    func,
+)
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.models.base import Base, TimestampMixin
+
+
+class ProgramStatus(str, Enum):
+    """Enum for program publication status."""
+
+    DRAFT = "draft"
+    PUBLISHED = "published"
+    ARCHIVED = "archived"
+
+
+class Program(Base, TimestampMixin):
+    """A multi-week training program authored by a coach."""
+
+    __tablename__ = "programs"
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        primary_key=True,
+        default=uuid.uuid4,
+    )
+    coach_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    name: Mapped[str] = mapped_column(
+        String(255),
+        nullable=False,
+    )
+    description: Mapped[str | None] = mapped_column(
+        Text,
+        nullable=True,
+    )
+    sport: Mapped[str | None] = mapped_column(
+        String(100),
+        nullable=True,
+    )
+    duration_weeks: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=1,
+    )
+    days_per_week: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=1,
+    )
+    status: Mapped[str] = mapped_column(
+        String(20),
+        nullable=False,
+        default=ProgramStatus.DRAFT.value,
+    )
+    # Number of students the program is assigned to
+    assigned_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+    )
+
+    def __repr__(self) -> str:
+        return f"<Program(id={self.id}, name={self.name!r})>"
+
+
+class ProgramWeek(Base):
+    """A week within a program."""
+
+    __tablename__ = "program_weeks"
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        primary_key=True,
+        default=uuid.uuid4,
+    )
+    program_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("programs.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    week_number: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+    )
+    name: Mapped[str | None] = mapped_column(
+        String(255),
+        nullable=True,
+    )
+
+
+class ProgramDay(Base):
+    """A training day within a program week."""
+
+    __tablename__ = "program_days"
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        primary_key=True,
+        default=uuid.uuid4,
+    )
+    week_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("program_weeks.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    day_number: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+    )
+    name: Mapped[str | None] = mapped_column(
+        String(255),
+        nullable=True,
+    )
+    notes: Mapped[str | None] = mapped_column(
+        Text,
+        nullable=True,
+    )
+
+
+class ProgramActivity(Base):
+    """A single exercise or drill within a program day."""
+
+    __tablename__ = "program_activities"
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        primary_key=True,
+        default=uuid.uuid4,
+    )
+    day_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("program_days.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    name: Mapped[str] = mapped_column(
+        String(255),
+        nullable=False,
+    )
+    description: Mapped[str | None] = mapped_column(
+        Text,
+        nullable=True,
+    )
+    # Sets/reps, duration, distance, etc. Shape is validated by the schema.
+    metrics: Mapped[dict] = mapped_column(
+        JSON,
+        nullable=False,
+        default=dict,
+    )
+    notes: Mapped[str | None] = mapped_column(
+        Text,
+        nullable=True,
+    )
+    # Linked video or other content item
+    content_id: Mapped[str | None] = mapped_column(
+        String(64),
+        nullable=True,
+        index=True,
+    )
+    position: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+    )
+
+
+class ProgramAssignment(Base):
+    """A program assigned to a student.
+
+    Assignments reference the coach's program rather than copying its tree,
+    so assigning to a whole team is one narrow row per student.
+    """
+
+    __tablename__ = "program_assignments"
+
+    __table_args__ = (
+        UniqueConstraint(
+            "program_id", "student_id", name="uq_program_assignment_student"
+        ),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        primary_key=True,
+        default=uuid.uuid4,
+    )
+    program_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("programs.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    student_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    start_date: Mapped[date | None] = mapped_column(
+        Date,
+        nullable=True,
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
@@ -16,6 +16,10 @@ class UserMode(str, Enum):
     COACH = "coach"
 
 
+# Role that lets a user publish programs and assign them to their students
+COACH_ROLE = "coach"
+
+
 class User(Base, TimestampMixin):
     """User model representing authenticated users.
 
@@ -26,7 +30,9 @@ class User(Base, TimestampMixin):
     __tablename__ = "users"
 
     # Composite unique constraint on auth_provider + auth_subject
-    # ensures no duplicate users from the same provider
+    # ensures no duplicate users from the same provider. Its index also
+    # serves every lookup by provider and subject, so neither column has
+    # an index of its own.
     __table_args__ = (
         UniqueConstraint(
             "auth_provider", "auth_subject", name="uq_auth_provider_subject"
@@ -44,12 +50,10 @@ class User(Base, TimestampMixin):
     auth_provider: Mapped[str] = mapped_column(
         String(50),
         nullable=False,
-        index=True,
     )
     auth_subject: Mapped[str] = mapped_column(
         String(255),
         nullable=False,
-        index=True,
     )
 
     # User profile fields
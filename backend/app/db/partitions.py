@@ -0,0 +1,220 @@
+"""Partition management for partitioned tables.
+
+``create_all`` creates the parent of a partitioned table but none of its
+partitions, and a row with no partition to go to cannot be inserted. This
+module creates them:
+
+- a hash-partitioned table gets all of its partitions at once;
+- a range-partitioned table gets one partition per interval, from the
+  interval holding ``since`` (by default the interval before the current
+  one, so rows for the recent past have somewhere to go) up to ``ahead``
+  intervals past the current one. New intervals keep arriving, so job
+  workers run the ``partitions.maintain`` job every
+  ``partition_maintain_interval_seconds``. ``covered_days`` is the window
+  that is always partitioned, which writers check rows against.
+
+``init_db`` runs it on startup. Run ``python -m app.db.partitions`` to
+create partitions by hand, for example ``--since 2024-01-01`` before a
+backfill, or ``--dry-run`` to print the DDL. Partitions that already exist
+are left alone, so every entry point can run at any time.
+"""
+
+import argparse
+import asyncio
+from datetime import date, timedelta
+
+from sqlalchemy import Connection, Date, Table, text
+
+from app.core.config import get_settings
+from app.db.models import Base, Partitioning, PartitionMethod, get_partitioning
+from app.db.session import get_engine
+
+
+def planned_partitions(
+    since: date | None = None,
+    ahead: int | None = None,
+    today: date | None = None,
+) -> dict[str, dict[str, str]]:
+    """The partitions every partitioned table should have.
+
+    Args:
+        since: Earliest day range-partitioned tables must accept rows for.
+            Defaults to the first day of ``covered_days``.
+        ahead: Intervals past the current one to create range partitions
+            for. Defaults to ``partition_range_ahead``.
+        today: The current day, for tests.
+
+    Returns:
+        By table name, the CREATE TABLE statement of each partition the
+        table should have, by partition name.
+    """
+    planned = {}
+    for table in Base.metadata.sorted_tables:
+        partitioning = get_partitioning(table)
+        if partitioning is None:
+            continue
+        if partitioning.method is PartitionMethod.HASH:
+            bounds = _hash_bounds(partitioning)
+        else:
+            first, end = covered_days(partitioning, today, ahead)
+            bounds = _range_bounds(table, partitioning, since or first, end)
+        planned[table.name] = {
+            f"{table.name}_p{suffix}": (
+                f"CREATE TABLE {table.name}_p{suffix} "
+                f"PARTITION OF {table.name} FOR VALUES {bound}"
+            )
+            for suffix, bound in bounds
+        }
+    return planned
+
+
+def _hash_bounds(partitioning: Partitioning) -> list[tuple[str, str]]:
+    return [
+        (
+            str(remainder),
+            f"WITH (MODULUS {partitioning.partitions}, REMAINDER {remainder})",
+        )
+        for remainder in range(partitioning.partitions)
+    ]
+
+
+def covered_days(
+    partitioning: Partitioning,
+    today: date | None = None,
+    ahead: int | None = None,
+) -> tuple[date, date]:
+    """The days a range-partitioned table always has partitions for.
+
+    ``init_db`` and the ``partitions.maintain`` job keep partitions from the
+    interval before the current one through ``ahead`` intervals past it, so
+    a row whose key falls in ``[first, end)`` (UTC) can always be inserted.
+
+    Returns:
+        The first day covered and the day after the last one.
+    """
+    today = today or date.today()
+    if ahead is None:
+        ahead = get_settings().partition_range_ahead
+    interval = partitioning.interval
+    current = period_start(today, interval)
+    first = period_start(current - timedelta(days=1), interval)
+    end = next_period(current, interval)
+    for _ in range(ahead):
+        end = next_period(end, interval)
+    return first, end
+
+
+def _range_bounds(
+    table: Table,
+    partitioning: Partitioning,
+    since: date,
+    end: date,
+) -> list[tuple[str, str]]:
+    interval = partitioning.interval
+    is_date = isinstance(table.columns[partitioning.key].type, Date)
+    start = period_start(since, interval)
+    bounds = []
+    while start < end:
+        stop = next_period(start, interval)
+        bounds.append(
+            (
+                f"{start:%Y%m%d}",
+                f"FROM ({_literal(start, is_date)}) TO ({_literal(stop, is_date)})",
+            )
+        )
+        start = stop
+    return bounds
+
+
+def period_start(day: date, interval: str) -> date:
+    """First day of the ``interval`` holding ``day``; weeks start on Monday."""
+    if interval == "month":
+        return day.replace(day=1)
+    if interval == "week":
+        return day - timedelta(days=day.weekday())
+    return day
+
+
+def next_period(start: date, interval: str) -> date:
+    """First day of the ``interval`` after the one starting on ``start``."""
+    if interval == "month":
+        return (start.replace(day=28) + timedelta(days=4)).replace(day=1)
+    if interval == "week":
+        return start + timedelta(weeks=1)
+    return start + timedelta(days=1)
+
+
+def _literal(day: date, is_date: bool) -> str:
+    # Timestamps split at midnight UTC whatever the session time zone is
+    return f"'{day.isoformat()}'" if is_date else f"'{day.isoformat()} 00:00+00'"
+
+
+def create_partitions(
+    conn: Connection,
+    since: date | None = None,
+    ahead: int | None = None,
+) -> int:
+    """Create the planned partitions that do not exist yet.
+
+    Takes a sync connection in an open transaction; call it through
+    ``run_sync`` from async code. See ``planned_partitions`` for the
+    arguments.
+
+    Returns:
+        Number of partitions created.
+    """
+    created = 0
+    for table, partitions in planned_partitions(since, ahead).items():
+        existing = set(
+            conn.execute(
+                text(
+                    "SELECT inhrelid::regclass::text FROM pg_inherits "
+                    "WHERE inhparent = CAST(:table AS regclass)"
+                ),
+                {"table": table},
+            ).scalars()
+        )
+        for name, statement in partitions.items():
+            if name not in existing:
+                conn.execute(text(statement))
+                created += 1
+    return created
+
+
+async def _create(since: date | None, ahead: int | None) -> int:
+    try:
+        async with get_engine().begin() as conn:
+            return await conn.run_sync(create_partitions, since, ahead)
+    finally:
+        await get_engine().dispose()
+
+
+def main() -> None:
+    """Create missing partitions, or print the DDL of every partition."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--since",
+        type=date.fromisoformat,
+        help="earliest day (YYYY-MM-DD) range-partitioned tables must accept",
+    )
+    parser.add_argument(
+        "--ahead",
+        type=int,
+        help="intervals past the current one to create range partitions for",
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true", help="print the DDL instead of running it"
+    )
+    args = parser.parse_args()
+
+    if args.dry_run:
+        for partitions in planned_partitions(args.since, args.ahead).values():
+            for statement in partitions.values():
+                print(f"{statement};")
+        return
+    created = asyncio.run(_create(args.since, args.ahead))
+    print(f"Created {created} partitions")
+
+
+if __name__ == "__main__":
+    main()
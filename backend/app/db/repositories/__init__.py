@@ -1,5 +1,22 @@
+from app.db.repositories.annotation import AnnotationRepository
 from app.db.repositories.base import IRepository, SQLAlchemyRepository
+from app.db.repositories.content import ContentRepository
+from app.db.repositories.credit import CreditRepository
 from app.db.repositories.item import ItemRepository
+from app.db.repositories.job import JobRepository
+from app.db.repositories.media import MediaRepository
+from app.db.repositories.program import ProgramRepository
 from app.db.repositories.user import UserRepository
 
-__all__ = ["IRepository", "ItemRepository", "SQLAlchemyRepository", "UserRepository"]
+__all__ = [
+    "AnnotationRepository",
+    "ContentRepository",
+    "CreditRepository",
+    "IRepository",
+    "ItemRepository",
+    "JobRepository",
+    "MediaRepository",
+    "ProgramRepository",
+    "SQLAlchemyRepository",
+    "UserRepository",
+]
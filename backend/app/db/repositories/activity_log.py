@@ -0,0 +1,112 @@
+"""Activity log repository: append-only writes and rollup reads."""
+
+import uuid
+from collections import defaultdict
+from collections.abc import Callable
+from datetime import date, timedelta
+
+from sqlalchemy import insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.activity_log import (
+    ActivityLog,
+    ActivityLogDaily,
+    ActivityLogWeekly,
+    ActivityRollupMixin,
+)
+
+# Metric columns summed into the rollups
+_METRICS = ("sets", "reps", "duration_seconds", "distance_meters", "count")
+
+
+class ActivityLogRepository:
+    """Repository for activity logs and their daily and weekly rollups."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def append(self, rows: list[dict]) -> int:
+        """Insert log rows and add them to the rollups, in three statements.
+
+        The rows go in with one batched multi-row INSERT. Their totals are
+        grouped per student, activity and day or week here, then upserted
+        into each rollup table with one INSERT ... ON CONFLICT that adds to
+        the stored totals. Rollup keys are written in sorted order, so
+        concurrent batches for the same student lock rows in the same order
+        and cannot deadlock.
+
+        Args:
+            rows: ``ActivityLog`` column values, ``performed_on`` included.
+
+        Returns:
+            Number of log rows inserted.
+        """
+        await self._session.execute(insert(ActivityLog), rows)
+        await self._add_to_rollup(ActivityLogDaily, rows, lambda day: day)
+        await self._add_to_rollup(
+            ActivityLogWeekly, rows, lambda day: day - timedelta(days=day.weekday())
+        )
+        return len(rows)
+
+    async def _add_to_rollup(
+        self,
+        model: type[ActivityLogDaily] | type[ActivityLogWeekly],
+        rows: list[dict],
+        period_start: Callable[[date], date],
+    ) -> None:
+        totals: dict[tuple[uuid.UUID, date, uuid.UUID], dict] = defaultdict(
+            lambda: dict.fromkeys(("entries", *_METRICS), 0)
+        )
+        for row in rows:
+            key = (
+                row["student_id"],
+                period_start(row["performed_on"]),
+                row["activity_id"],
+            )
+            total = totals[key]
+            total["entries"] += 1
+            for metric in _METRICS:
+                total[metric] += row.get(metric) or 0
+
+        values = [
+            {
+                "student_id": student_id,
+                "period_start": start,
+                "activity_id": activity_id,
+                **total,
+            }
+            for (student_id, start, activity_id), total in sorted(totals.items())
+        ]
+        stmt = pg_insert(model).values(values)
+        await self._session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["student_id", "period_start", "activity_id"],
+                set_={
+                    column: getattr(model, column) + getattr(stmt.excluded, column)
+                    for column in ("entries", *_METRICS)
+                },
+            )
+        )
+
+    async def get_rollups(
+        self,
+        model: type[ActivityLogDaily] | type[ActivityLogWeekly],
+        student_id: uuid.UUID,
+        start: date,
+        end: date,
+        activity_id: uuid.UUID | None = None,
+    ) -> list[ActivityRollupMixin]:
+        """Get a student's rollup rows for periods starting in [start, end]."""
+        stmt = (
+            select(model)
+            .where(
+                model.student_id == student_id,
+                model.period_start.between(start, end),
+            )
+            .order_by(model.period_start, model.activity_id)
+        )
+        if activity_id is not None:
+            stmt = stmt.where(model.activity_id == activity_id)
+        result = await self._session.execute(stmt)
+        return list(result.scalars().all())
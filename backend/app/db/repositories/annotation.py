@@ -0,0 +1,77 @@
+"""Annotation repository for database operations."""
+
+from uuid import UUID
+
+from sqlalchemy import and_, insert, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.annotation import VideoAnnotation
+from app.schemas.annotation import MAX_ANNOTATION_SECONDS
+
+
+class AnnotationRepository:
+    """Repository for VideoAnnotation model operations."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def get_by_id(self, annotation_id: UUID) -> VideoAnnotation | None:
+        """Get an annotation by ID."""
+        return await self._session.get(VideoAnnotation, annotation_id)
+
+    async def get_in_window(
+        self,
+        media_id: UUID,
+        start_ms: int,
+        end_ms: int | None = None,
+    ) -> list[VideoAnnotation]:
+        """Get a video's annotations that are on screen during a time window.
+
+        Annotations with an end time last at most ``MAX_ANNOTATION_SECONDS``,
+        so only those starting that long before the window can reach it,
+        and the (media_id, start_ms) index reads just that range. Open-ended
+        annotations stay on screen once they start and are read from their
+        own partial index.
+
+        Args:
+            media_id: The annotated video.
+            start_ms: Window start in milliseconds.
+            end_ms: Window end in milliseconds, or None for the rest of the video.
+        """
+        earliest_start_ms = start_ms - MAX_ANNOTATION_SECONDS * 1000
+        stmt = select(VideoAnnotation).where(
+            VideoAnnotation.media_id == media_id,
+            or_(
+                VideoAnnotation.end_ms.is_(None),
+                and_(
+                    VideoAnnotation.start_ms >= earliest_start_ms,
+                    VideoAnnotation.end_ms >= start_ms,
+                ),
+            ),
+        )
+        if end_ms is not None:
+            stmt = stmt.where(VideoAnnotation.start_ms <= end_ms)
+        stmt = stmt.order_by(VideoAnnotation.start_ms, VideoAnnotation.id)
+        result = await self._session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def create_many(self, rows: list[dict]) -> list[VideoAnnotation]:
+        """Insert annotations in one batched multi-row INSERT."""
+        stmt = insert(VideoAnnotation).returning(VideoAnnotation)
+        result = await self._session.execute(stmt, rows)
+        return list(result.scalars().all())
+
+    async def update(
+        self, annotation: VideoAnnotation, values: dict
+    ) -> VideoAnnotation:
+        """Update an annotation."""
+        for field, value in values.items():
+            setattr(annotation, field, value)
+        await self._session.flush()
+        await self._session.refresh(annotation)
+        return annotation
+
+    async def delete(self, annotation: VideoAnnotation) -> None:
+        """Delete an annotation."""
+        await self._session.delete(annotation)
+        await self._session.flush()
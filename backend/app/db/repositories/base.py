@@ -1,12 +1,14 @@
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar
+from collections.abc import AsyncIterable, Iterable
+from typing import Any, Generic, TypeVar
 from uuid import UUID
 
 from pydantic import BaseModel
-from sqlalchemy import select
+from sqlalchemy import Column, MetaData, Select, Table, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.models.base import Base
+from app.core.invalidation import invalidate
+from app.db.models.base import Base, get_partitioning
 
 ModelType = TypeVar("ModelType", bound=Base)
 CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
@@ -60,17 +62,38 @@ class SQLAlchemyRepository(
 ):
     """Base SQLAlchemy repository implementation.
 
-    Provides common CRUD operations for SQLAlchemy models.
+    Provides common CRUD operations for SQLAlchemy models. Every write
+    invalidates the entity's ID under the table name on all workers once
+    the transaction commits, so caches keyed by ID can subscribe to it.
+
+    A repository for a partitioned model is scoped to one value of the
+    partition key, passed as ``partition``: every query it runs filters on
+    that value, so Postgres prunes to one partition, and every entity it
+    creates gets it. Custom queries should start from ``_select()`` to
+    carry the key too.
     """
 
     model: type[ModelType]
 
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(self, session: AsyncSession, partition: Any = None) -> None:
         self._session = session
+        partitioning = get_partitioning(self.model.__table__)
+        self._partition_key = partitioning.key if partitioning else None
+        if self._partition_key is not None and partition is None:
+            raise ValueError(
+                f"{type(self).__name__} needs the {self._partition_key} "
+                "partition key to scope its queries to"
+            )
+        self._partition = partition
 
     async def get_by_id(self, id: UUID) -> ModelType | None:
         """Get a single entity by ID."""
-        return await self._session.get(self.model, id)
+        if self._partition_key is None:
+            return await self._session.get(self.model, id)
+        # The partition key is part of the primary key of partitioned tables
+        return await self._session.get(
+            self.model, {"id": id, self._partition_key: self._partition}
+        )
 
     async def get_all(
         self,
@@ -78,16 +101,20 @@ class SQLAlchemyRepository(
         limit: int = 100,
     ) -> list[ModelType]:
         """Get all entities with pagination."""
-        stmt = select(self.model).offset(skip).limit(limit)
+        stmt = self._select().offset(skip).limit(limit)
         result = await self._session.execute(stmt)
         return list(result.scalars().all())
 
     async def create(self, data: CreateSchemaType) -> ModelType:
         """Create a new entity."""
-        db_obj = self.model(**data.model_dump())
+        values = data.model_dump()
+        if self._partition_key is not None:
+            values[self._partition_key] = self._partition
+        db_obj = self.model(**values)
         self._session.add(db_obj)
         await self._session.flush()
         await self._session.refresh(db_obj)
+        self._invalidate(db_obj.id)
         return db_obj
 
     async def update(
@@ -106,6 +133,7 @@ class SQLAlchemyRepository(
 
         await self._session.flush()
         await self._session.refresh(db_obj)
+        self._invalidate(id)
         return db_obj
 
     async def delete(self, id: UUID) -> bool:
@@ -116,4 +144,61 @@ class SQLAlchemyRepository(
 
         await self._session.delete(db_obj)
         await self._session.flush()
+        self._invalidate(id)
         return True
+
+    def _select(self) -> Select[tuple[ModelType]]:
+        """Select the model, within the repository's partition if it has one."""
+        stmt = select(self.model)
+        if self._partition_key is not None:
+            stmt = stmt.where(
+                getattr(self.model, self._partition_key) == self._partition
+            )
+        return stmt
+
+    def _invalidate(self, *ids: UUID) -> None:
+        invalidate(self._session, self.model.__tablename__, *ids)
+
+
+def staging_table(name: str, *columns: Column) -> Table:
+    """Define a temporary table that is dropped when the transaction ends."""
+    return Table(
+        name,
+        MetaData(),
+        *columns,
+        prefixes=["TEMPORARY"],
+        postgresql_on_commit="DROP",
+    )
+
+
+async def copy_to_staging(
+    session: AsyncSession,
+    table: Table,
+    records: Iterable[tuple[Any, ...]] | AsyncIterable[tuple[Any, ...]],
+) -> int:
+    """Create a staging table and stream rows into it with COPY.
+
+    COPY loads rows far faster than INSERTs, so bulk loads stage them this
+    way and then merge them into the real table with one set-based
+    statement. Runs on the session's connection, inside its transaction.
+
+    Args:
+        session: The session whose transaction the staging table lives in.
+        table: A table defined with ``staging_table``.
+        records: Row tuples in the table's column order. ``records`` is
+            consumed while the COPY runs, so it can be a generator that
+            reads its source lazily.
+
+    Returns:
+        Number of rows copied.
+    """
+    connection = await session.connection()
+    await connection.run_sync(table.create)
+    raw = await connection.get_raw_connection()
+    status = await raw.driver_connection.copy_records_to_table(
+        table.name,
+        records=records,
+        columns=[column.name for column in table.columns],
+    )
+    # asyncpg returns the command tag, "COPY <rows>"
+    return int(status.split()[-1])
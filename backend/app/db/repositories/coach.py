@@ -0,0 +1,79 @@
+"""Coach repository for profiles and coaching relationships."""
+
+import uuid
+
+from sqlalchemy import Row, Select, func, select, union
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.invalidation import invalidate
+from app.db.models.coach import CoachProfile
+from app.db.models.credit import CreditAccount
+from app.db.models.program import Program, ProgramAssignment
+from app.db.models.user import User
+
+# A profile with its coach's display name
+ProfileRow = Row[tuple[CoachProfile, str | None]]
+
+
+class CoachRepository:
+    """Repository for coach profiles and who trains with whom."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    def _profiles(self) -> Select[tuple[CoachProfile, str | None]]:
+        return select(CoachProfile, User.display_name).join(
+            User, User.id == CoachProfile.user_id
+        )
+
+    async def get_profile(self, user_id: uuid.UUID) -> ProfileRow | None:
+        """Get a coach's profile with their display name."""
+        result = await self._session.execute(
+            self._profiles().where(CoachProfile.user_id == user_id)
+        )
+        return result.one_or_none()
+
+    async def list_profiles(
+        self,
+        user_ids: list[uuid.UUID] | None = None,
+    ) -> list[ProfileRow]:
+        """Get coach profiles with their coaches' display names.
+
+        Args:
+            user_ids: Only these coaches' profiles. Defaults to every profile.
+        """
+        stmt = self._profiles().order_by(CoachProfile.user_id)
+        if user_ids is not None:
+            stmt = stmt.where(CoachProfile.user_id.in_(user_ids))
+        result = await self._session.execute(stmt)
+        return list(result.all())
+
+    async def upsert_profile(self, user_id: uuid.UUID, values: dict) -> None:
+        """Create or replace a coach's profile fields in one statement."""
+        insert = pg_insert(CoachProfile).values(user_id=user_id, **values)
+        await self._session.execute(
+            insert.on_conflict_do_update(
+                index_elements=[CoachProfile.user_id],
+                set_={
+                    **{name: insert.excluded[name] for name in values},
+                    "updated_at": func.now(),
+                },
+            )
+        )
+        invalidate(self._session, CoachProfile.__tablename__, user_id)
+
+    async def list_coaching_pairs(self) -> list[tuple[uuid.UUID, uuid.UUID]]:
+        """Get every distinct (student, coach) pair that trains together.
+
+        A student trains with a coach when they hold credits for one of the
+        coach's bundles or are assigned one of the coach's programs.
+        """
+        stmt = union(
+            select(CreditAccount.student_id, CreditAccount.coach_id),
+            select(ProgramAssignment.student_id, Program.coach_id).join(
+                Program, Program.id == ProgramAssignment.program_id
+            ),
+        )
+        result = await self._session.execute(stmt)
+        return [tuple(row) for row in result.all()]
@@ -0,0 +1,314 @@
+"""Content repository for folders and content items."""
+
+from uuid import UUID
+
+from sqlalchemy import (
+    ColumnElement,
+    String,
+    Uuid,
+    case,
+    delete,
+    distinct,
+    func,
+    literal,
+    select,
+    true,
+    tuple_,
+    update,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.invalidation import invalidate
+from app.db.models.content import ContentFolder, ContentItem
+from app.db.models.program import ProgramActivity
+from app.db.models.user import User
+
+ROOT_PATH = "/"
+
+
+def folder_path(parent_path: str, folder_id: UUID) -> str:
+    """Build a folder's materialized path from its parent's path."""
+    return f"{parent_path}{folder_id.hex}/"
+
+
+def _in_subtree(path: str) -> ColumnElement[bool]:
+    """Match every folder whose path starts with ``path``.
+
+    Paths end with "/" and "0" is the next byte after it, so the subtree is
+    exactly the half-open range [path, path[:-1] + "0"). A range compares
+    cleanly against the (coach_id, path) index even as a bound parameter in
+    a cached prepared statement, which a ``LIKE 'prefix%'`` pattern does not.
+    """
+    return (ContentFolder.path >= path) & (ContentFolder.path < path[:-1] + "0")
+
+
+def _tag_filter(tags: list[str], match_all: bool) -> ColumnElement[bool]:
+    """Match items having all (``@>``) or any (``&&``) of ``tags``."""
+    if match_all:
+        return ContentItem.tags.contains(tags)
+    return ContentItem.tags.overlap(tags)
+
+
+class ContentRepository:
+    """Repository for ContentFolder and ContentItem operations.
+
+    Every query is scoped to a coach, and subtree queries are range scans
+    on the folders' materialized paths.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def get_folder(self, folder_id: UUID, coach_id: UUID) -> ContentFolder | None:
+        """Get one of a coach's folders."""
+        folder = await self._session.get(ContentFolder, folder_id)
+        if folder is None or folder.coach_id != coach_id:
+            return None
+        return folder
+
+    async def get_folder_counts(
+        self,
+        coach_id: UUID,
+        root: ContentFolder | None = None,
+    ) -> list[tuple[ContentFolder, int]]:
+        """Get folders with the number of items filed directly in each.
+
+        Args:
+            coach_id: Owner of the library.
+            root: Only return this folder and its descendants.
+
+        Returns:
+            (folder, item count) pairs ordered by path, so every folder
+            comes after its ancestors.
+        """
+        stmt = (
+            select(ContentFolder, func.count(ContentItem.id))
+            .outerjoin(ContentItem, ContentItem.folder_id == ContentFolder.id)
+            .where(ContentFolder.coach_id == coach_id)
+            .group_by(ContentFolder.id)
+            .order_by(ContentFolder.path)
+            # Paths may have been rewritten in bulk by move_folder
+            .execution_options(populate_existing=True)
+        )
+        if root is not None:
+            stmt = stmt.where(_in_subtree(root.path))
+        result = await self._session.execute(stmt)
+        return [(folder, count) for folder, count in result.all()]
+
+    async def create_folder(self, folder: ContentFolder) -> ContentFolder:
+        """Persist a new folder. Its ``path`` must already be set."""
+        self._session.add(folder)
+        await self._session.flush()
+        await self._session.refresh(folder)
+        return folder
+
+    async def move_folder(
+        self,
+        folder: ContentFolder,
+        parent: ContentFolder | None,
+    ) -> None:
+        """Move a folder, and with it its whole subtree, under a new parent.
+
+        One UPDATE rewrites the path prefix of every folder in the subtree
+        and re-links the moved folder itself. Items reference folders by ID,
+        so they move along without being touched.
+        """
+        old_path = folder.path
+        new_path = folder_path(parent.path if parent else ROOT_PATH, folder.id)
+        parent_id = parent.id if parent else None
+        stmt = (
+            update(ContentFolder)
+            .where(ContentFolder.coach_id == folder.coach_id, _in_subtree(old_path))
+            .values(
+                path=literal(new_path, String)
+                + func.substr(ContentFolder.path, len(old_path) + 1),
+                parent_id=case(
+                    (ContentFolder.id == folder.id, literal(parent_id, Uuid)),
+                    else_=ContentFolder.parent_id,
+                ),
+            )
+        )
+        await self._session.execute(stmt)
+        await self._session.refresh(folder)
+
+    async def get_subtree_path_length(self, folder: ContentFolder) -> int:
+        """Get the length of the longest path in a folder's subtree."""
+        stmt = select(func.max(func.length(ContentFolder.path))).where(
+            ContentFolder.coach_id == folder.coach_id, _in_subtree(folder.path)
+        )
+        result = await self._session.execute(stmt)
+        return result.scalar_one()
+
+    async def update_folder(self, folder: ContentFolder, values: dict) -> ContentFolder:
+        """Update a folder's name or color."""
+        for field, value in values.items():
+            setattr(folder, field, value)
+        await self._session.flush()
+        await self._session.refresh(folder)
+        return folder
+
+    async def delete_folder(self, folder: ContentFolder) -> int:
+        """Delete a folder and its whole subtree in one statement.
+
+        Items in the deleted folders move to the library root.
+
+        Returns:
+            Number of folders deleted.
+        """
+        stmt = delete(ContentFolder).where(
+            ContentFolder.coach_id == folder.coach_id,
+            _in_subtree(folder.path),
+        )
+        result = await self._session.execute(stmt)
+        return result.rowcount
+
+    async def get_item(self, item_id: UUID, coach_id: UUID) -> ContentItem | None:
+        """Get one of a coach's content items."""
+        item = await self._session.get(ContentItem, item_id)
+        if item is None or item.coach_id != coach_id:
+            return None
+        return item
+
+    async def list_items(
+        self,
+        coach_id: UUID,
+        folder: ContentFolder | None = None,
+        recursive: bool = False,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> list[ContentItem]:
+        """Get a coach's content items, newest first.
+
+        Args:
+            coach_id: Owner of the library.
+            folder: Only return items in this folder.
+            recursive: Also include items in the folder's descendants.
+        """
+        stmt = select(ContentItem).where(ContentItem.coach_id == coach_id)
+        if folder is not None and recursive:
+            stmt = stmt.join(
+                ContentFolder, ContentItem.folder_id == ContentFolder.id
+            ).where(ContentFolder.coach_id == coach_id, _in_subtree(folder.path))
+        elif folder is not None:
+            stmt = stmt.where(ContentItem.folder_id == folder.id)
+        stmt = (
+            stmt.order_by(ContentItem.created_at.desc(), ContentItem.id)
+            .offset(skip)
+            .limit(limit)
+        )
+        result = await self._session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def create_item(self, item: ContentItem) -> ContentItem:
+        """Persist a new content item."""
+        self._session.add(item)
+        await self._session.flush()
+        invalidate(self._session, ContentItem.__tablename__, item.coach_id)
+        await self._session.refresh(item)
+        return item
+
+    async def update_item(self, item: ContentItem, values: dict) -> ContentItem:
+        """Update a content item."""
+        for field, value in values.items():
+            setattr(item, field, value)
+        await self._session.flush()
+        await self._session.refresh(item)
+        invalidate(self._session, ContentItem.__tablename__, item.coach_id)
+        return item
+
+    async def delete_item(self, item: ContentItem) -> None:
+        """Delete a content item."""
+        await self._session.delete(item)
+        await self._session.flush()
+        invalidate(self._session, ContentItem.__tablename__, item.coach_id)
+
+    async def search_items(
+        self,
+        coach_id: UUID,
+        tags: list[str],
+        match_all: bool = True,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> list[ContentItem]:
+        """Get a coach's content items filtered by tags, newest first."""
+        stmt = select(ContentItem).where(ContentItem.coach_id == coach_id)
+        if tags:
+            stmt = stmt.where(_tag_filter(tags, match_all))
+        stmt = (
+            stmt.order_by(ContentItem.created_at.desc(), ContentItem.id)
+            .offset(skip)
+            .limit(limit)
+        )
+        result = await self._session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def get_tag_facets(
+        self,
+        coach_id: UUID,
+        tags: list[str],
+        match_all: bool = True,
+    ) -> tuple[int, list[tuple[str, int]]]:
+        """Count matching items overall and per tag in one query.
+
+        The matching items' tags are unnested and grouped with
+        ``GROUPING SETS ((tag), ())``, so the per-tag counts and the grand
+        total come back from a single scan.
+
+        Returns:
+            A tuple of (total matching items, [(tag, item count), ...]) with
+            tags ordered by descending count.
+        """
+        tag = func.unnest(ContentItem.tags).table_valued("tag").render_derived("t")
+        stmt = (
+            select(
+                tag.c.tag,
+                func.grouping(tag.c.tag),
+                func.count(distinct(ContentItem.id)),
+            )
+            .select_from(ContentItem)
+            .outerjoin(tag, true())
+            .where(ContentItem.coach_id == coach_id)
+            .group_by(func.grouping_sets(tag.c.tag, tuple_()))
+        )
+        if tags:
+            stmt = stmt.where(_tag_filter(tags, match_all))
+        result = await self._session.execute(stmt)
+
+        total = 0
+        facets = []
+        for name, is_total, count in result.all():
+            if is_total:
+                total = count
+            elif name is not None:
+                facets.append((name, count))
+        facets.sort(key=lambda facet: (-facet[1], facet[0]))
+        return total, facets
+
+    async def list_titles(
+        self,
+        coach_ids: list[UUID] | None = None,
+    ) -> list[tuple[UUID, str, UUID, str, int]]:
+        """Get content titles with how many program activities link each.
+
+        Args:
+            coach_ids: Only these coaches' items. Defaults to every item.
+
+        Returns:
+            (coach ID, coach auth subject, item ID, title, uses) per item.
+        """
+        uses = (
+            select(func.count())
+            .where(ProgramActivity.content_id == ContentItem.id.cast(String))
+            .scalar_subquery()
+        )
+        stmt = select(
+            ContentItem.coach_id,
+            User.auth_subject,
+            ContentItem.id,
+            ContentItem.title,
+            uses,
+        ).join(User, User.id == ContentItem.coach_id)
+        if coach_ids is not None:
+            stmt = stmt.where(ContentItem.coach_id.in_(coach_ids))
+        result = await self._session.execute(stmt)
+        return [tuple(row) for row in result.all()]
@@ -0,0 +1,254 @@
+"""Credit repository for bundle credit ledger operations."""
+
+import uuid
+
+from sqlalchemy import (
+    Insert,
+    Integer,
+    String,
+    Update,
+    func,
+    insert,
+    literal,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.credit import (
+    CreditAccount,
+    CreditBalanceSnapshot,
+    CreditEntryKind,
+    CreditLedgerEntry,
+)
+
+_LEDGER_COLUMNS = ["account_id", "kind", "delta", "balance_after", "reference"]
+
+
+class CreditRepository:
+    """Repository for credit accounts, ledger entries and snapshots.
+
+    Every balance change is a single statement: a data-modifying CTE updates
+    the account row and the outer INSERT appends the matching ledger entry,
+    so the two can never drift apart and no row lock is held across
+    round-trips.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def get_accounts_for_student(
+        self,
+        student_id: uuid.UUID,
+    ) -> list[CreditAccount]:
+        """Get all credit accounts owned by a student."""
+        stmt = (
+            select(CreditAccount)
+            .where(CreditAccount.student_id == student_id)
+            .order_by(CreditAccount.created_at)
+        )
+        result = await self._session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def get_account(
+        self,
+        student_id: uuid.UUID,
+        coach_id: uuid.UUID,
+        service_id: str,
+    ) -> CreditAccount | None:
+        """Get a credit account by its owner key."""
+        stmt = select(CreditAccount).where(
+            CreditAccount.student_id == student_id,
+            CreditAccount.coach_id == coach_id,
+            CreditAccount.service_id == service_id,
+        )
+        result = await self._session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def credit(
+        self,
+        student_id: uuid.UUID,
+        coach_id: uuid.UUID,
+        service_id: str,
+        amount: int,
+        kind: CreditEntryKind = CreditEntryKind.GRANT,
+        reference: str | None = None,
+    ) -> CreditLedgerEntry:
+        """Add credits to an account, creating the account if needed.
+
+        Args:
+            student_id: The student receiving the credits.
+            coach_id: The coach whose bundle the credits belong to.
+            service_id: The service the bundle was purchased for.
+            amount: Number of credits to add (must be positive).
+            kind: Ledger entry kind, GRANT for purchases or REFUND.
+            reference: Optional external reference (order, booking).
+
+        Returns:
+            The ledger entry that was appended.
+        """
+        upsert = pg_insert(CreditAccount).values(
+            id=uuid.uuid4(),
+            student_id=student_id,
+            coach_id=coach_id,
+            service_id=service_id,
+            balance=amount,
+        )
+        account = upsert.on_conflict_do_update(
+            constraint="uq_credit_account_owner",
+            set_={
+                "balance": CreditAccount.balance + upsert.excluded.balance,
+                "updated_at": func.now(),
+            },
+        ).returning(CreditAccount.id, CreditAccount.balance)
+        return await self._append_from(account, kind, amount, reference)
+
+    async def debit(
+        self,
+        student_id: uuid.UUID,
+        coach_id: uuid.UUID,
+        service_id: str,
+        amount: int,
+        reference: str | None = None,
+    ) -> CreditLedgerEntry | None:
+        """Atomically redeem credits if the balance covers the amount.
+
+        The ``balance >= amount`` predicate is evaluated under the row lock
+        taken by UPDATE, so concurrent checkouts serialize on the account
+        row and the loser simply matches zero rows.
+
+        Returns:
+            The ledger entry that was appended, or None if the account does
+            not exist or holds fewer than ``amount`` credits.
+        """
+        account = (
+            update(CreditAccount)
+            .where(
+                CreditAccount.student_id == student_id,
+                CreditAccount.coach_id == coach_id,
+                CreditAccount.service_id == service_id,
+                CreditAccount.balance >= amount,
+            )
+            .values(
+                balance=CreditAccount.balance - amount,
+                updated_at=func.now(),
+            )
+            .returning(CreditAccount.id, CreditAccount.balance)
+        )
+        return await self._append_from(
+            account, CreditEntryKind.REDEEM, -amount, reference
+        )
+
+    async def _append_from(
+        self,
+        account_stmt: Insert | Update,
+        kind: CreditEntryKind,
+        delta: int,
+        reference: str | None,
+    ) -> CreditLedgerEntry | None:
+        """Run an account mutation and append its ledger entry in one statement."""
+        changed = account_stmt.cte("changed")
+        stmt = (
+            insert(CreditLedgerEntry)
+            .from_select(
+                _LEDGER_COLUMNS,
+                select(
+                    changed.c.id,
+                    literal(kind.value, String),
+                    literal(delta, Integer),
+                    changed.c.balance,
+                    literal(reference, String),
+                ),
+            )
+            .add_cte(changed, nest_here=True)
+            .returning(CreditLedgerEntry)
+        )
+        result = await self._session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def get_ledger(
+        self,
+        account_id: uuid.UUID,
+        limit: int = 100,
+    ) -> list[CreditLedgerEntry]:
+        """Get the most recent ledger entries for an account, newest first."""
+        stmt = (
+            select(CreditLedgerEntry)
+            .where(CreditLedgerEntry.account_id == account_id)
+            .order_by(CreditLedgerEntry.id.desc())
+            .limit(limit)
+        )
+        result = await self._session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def get_ledger_balance(self, account_id: uuid.UUID) -> int:
+        """Recompute a balance from the latest snapshot plus the ledger tail.
+
+        This is the audit path: it never reads ``CreditAccount.balance`` and
+        only scans the entries written since the last snapshot.
+        """
+        latest = (
+            select(CreditBalanceSnapshot)
+            .where(CreditBalanceSnapshot.account_id == account_id)
+            .order_by(CreditBalanceSnapshot.as_of_entry_id.desc())
+            .limit(1)
+            .subquery()
+        )
+        tail = (
+            select(func.coalesce(func.sum(CreditLedgerEntry.delta), 0))
+            .where(
+                CreditLedgerEntry.account_id == account_id,
+                CreditLedgerEntry.id
+                > func.coalesce(select(latest.c.as_of_entry_id).scalar_subquery(), 0),
+            )
+            .scalar_subquery()
+        )
+        stmt = select(
+            func.coalesce(select(latest.c.balance).scalar_subquery(), 0) + tail
+        )
+        result = await self._session.execute(stmt)
+        return int(result.scalar_one())
+
+    async def create_snapshots(self, min_tail: int) -> int:
+        """Snapshot every account whose ledger tail has grown past ``min_tail``.
+
+        Runs as one set-based INSERT ... SELECT. Since each ledger entry
+        carries ``balance_after``, the snapshot balance is read straight from
+        the newest entry rather than summed.
+
+        Returns:
+            Number of snapshots written.
+        """
+        last_snapshot = (
+            select(
+                CreditBalanceSnapshot.account_id,
+                func.max(CreditBalanceSnapshot.as_of_entry_id).label("as_of"),
+            )
+            .group_by(CreditBalanceSnapshot.account_id)
+            .subquery()
+        )
+        tails = (
+            select(
+                CreditLedgerEntry.account_id,
+                func.max(CreditLedgerEntry.id).label("last_id"),
+            )
+            .outerjoin(
+                last_snapshot,
+                last_snapshot.c.account_id == CreditLedgerEntry.account_id,
+            )
+            .where(CreditLedgerEntry.id > func.coalesce(last_snapshot.c.as_of, 0))
+            .group_by(CreditLedgerEntry.account_id)
+            .having(func.count() >= min_tail)
+            .subquery()
+        )
+        stmt = insert(CreditBalanceSnapshot).from_select(
+            ["account_id", "balance", "as_of_entry_id"],
+            select(
+                tails.c.account_id,
+                CreditLedgerEntry.balance_after,
+                tails.c.last_id,
+            ).join(CreditLedgerEntry, CreditLedgerEntry.id == tails.c.last_id),
+        )
+        result = await self._session.execute(stmt)
+        return result.rowcount
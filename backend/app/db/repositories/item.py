@@ -1,10 +1,31 @@
-from sqlalchemy import select
+from collections.abc import Iterable
+
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    Column,
+    String,
+    Text,
+    func,
+    literal_column,
+    or_,
+    select,
+)
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.invalidation import ALL
 from app.db.models.item import Item
-from app.db.repositories.base import SQLAlchemyRepository
+from app.db.repositories.base import (
+    SQLAlchemyRepository,
+    copy_to_staging,
+    staging_table,
+)
 from app.schemas.item import ItemCreate, ItemUpdate
 
+# (row number in the upload, name, description, is_active) of an import row
+ItemRow = tuple[int, str, str | None, bool]
+
 
 class ItemRepository(SQLAlchemyRepository[Item, ItemCreate, ItemUpdate]):
     """Repository for Item model operations."""
@@ -19,8 +40,14 @@ class ItemRepository(SQLAlchemyRepository[Item, ItemCreate, ItemUpdate]):
         skip: int = 0,
         limit: int = 100,
     ) -> list[Item]:
-        """Get all active items."""
-        stmt = select(Item).where(Item.is_active.is_(True)).offset(skip).limit(limit)
+        """Get active items, ordered by name."""
+        stmt = (
+            select(Item)
+            .where(Item.is_active)
+            .order_by(Item.name, Item.id)
+            .offset(skip)
+            .limit(limit)
+        )
         result = await self._session.execute(stmt)
         return list(result.scalars().all())
 
@@ -29,3 +56,69 @@ class ItemRepository(SQLAlchemyRepository[Item, ItemCreate, ItemUpdate]):
         stmt = select(Item).where(Item.name == name)
         result = await self._session.execute(stmt)
         return result.scalar_one_or_none()
+
+    async def import_rows(self, rows: Iterable[ItemRow]) -> tuple[int, int]:
+        """Merge validated rows into items, matching existing items by name.
+
+        Rows are streamed into a staging table with COPY, then one
+        ``INSERT ... ON CONFLICT (name) DO UPDATE`` adds the names not seen
+        before and rewrites the items whose description or active flag
+        changed. When a name repeats, its last row wins.
+
+        Any change invalidates every cached item rather than each ID, as
+        the invalidation bus would for a write this size anyway.
+
+        Returns:
+            Number of items created and number of items updated.
+        """
+        staging = staging_table(
+            "item_import",
+            Column("row", BigInteger, nullable=False),
+            Column("name", String(255), nullable=False),
+            Column("description", Text),
+            Column("is_active", Boolean, nullable=False),
+        )
+        await copy_to_staging(self._session, staging, rows)
+
+        # ON CONFLICT may only touch each item once, so keep one row per name
+        latest = (
+            select(staging)
+            .distinct(staging.c.name)
+            .order_by(staging.c.name, staging.c.row.desc())
+            .subquery("latest")
+        )
+        merge = insert(Item).from_select(
+            ["id", "name", "description", "is_active"],
+            select(
+                func.gen_random_uuid(),
+                latest.c.name,
+                latest.c.description,
+                latest.c.is_active,
+            ),
+        )
+        merge = merge.on_conflict_do_update(
+            index_elements=[Item.name],
+            set_={
+                "description": merge.excluded.description,
+                "is_active": merge.excluded.is_active,
+                "updated_at": func.now(),
+            },
+            where=or_(
+                Item.description.is_distinct_from(merge.excluded.description),
+                Item.is_active.is_distinct_from(merge.excluded.is_active),
+            ),
+        )
+        # xmax is zero on rows the statement inserted and set on rows it
+        # updated, so one pass tells the two apart without fetching them
+        created_row = literal_column("xmax = 0", Boolean).label("created")
+        written = merge.returning(created_row).cte("written")
+        result = await self._session.execute(
+            select(
+                func.count().filter(written.c.created),
+                func.count().filter(~written.c.created),
+            )
+        )
+        created, updated = result.one()
+        if created or updated:
+            self._invalidate(ALL)
+        return created, updated
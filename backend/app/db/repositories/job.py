@@ -0,0 +1,180 @@
+"""Job repository for the Postgres-backed job queue."""
+
+from datetime import datetime, timedelta
+
+from sqlalchemy import case, delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.job import PENDING, Job, JobStatus
+
+_STALE_ERROR = "Worker stopped responding while running the job"
+
+
+class JobRepository:
+    """Repository for Job model operations."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def enqueue(
+        self,
+        name: str,
+        payload: dict,
+        priority: int,
+        max_attempts: int,
+        run_at: datetime | None = None,
+        dedupe_key: str | None = None,
+    ) -> Job | None:
+        """Add a job to the queue.
+
+        The job becomes visible to workers when the caller's transaction
+        commits, so work enqueued by a request that later fails is never run.
+
+        Returns:
+            The new job, or None when a job with the same name and
+            ``dedupe_key`` is already queued or running.
+        """
+        if dedupe_key is not None:
+            values = {
+                "name": name,
+                "dedupe_key": dedupe_key,
+                "payload": payload,
+                "priority": priority,
+                "max_attempts": max_attempts,
+                "status": JobStatus.QUEUED.value,
+            }
+            if run_at is not None:
+                values["run_at"] = run_at
+            stmt = (
+                pg_insert(Job)
+                .values(values)
+                .on_conflict_do_nothing(
+                    index_elements=[Job.name, Job.dedupe_key],
+                    index_where=PENDING,
+                )
+                .returning(Job)
+            )
+            result = await self._session.execute(stmt)
+            return result.scalar_one_or_none()
+
+        job = Job(
+            name=name,
+            payload=payload,
+            priority=priority,
+            max_attempts=max_attempts,
+            status=JobStatus.QUEUED.value,
+        )
+        if run_at is not None:
+            job.run_at = run_at
+        self._session.add(job)
+        await self._session.flush()
+        return job
+
+    async def claim_batch(self, worker_id: str, limit: int) -> list[Job]:
+        """Claim up to ``limit`` runnable jobs for a worker.
+
+        ``FOR UPDATE SKIP LOCKED`` lets any number of workers claim
+        concurrently: each one skips rows another worker has locked instead
+        of blocking on them, so no two workers ever receive the same job.
+        """
+        runnable = (
+            select(Job.id)
+            .where(Job.status == JobStatus.QUEUED.value, Job.run_at <= func.now())
+            .order_by(Job.priority, Job.run_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        stmt = (
+            update(Job)
+            .where(Job.id.in_(runnable))
+            .values(
+                status=JobStatus.RUNNING.value,
+                attempts=Job.attempts + 1,
+                locked_at=func.now(),
+                locked_by=worker_id,
+                updated_at=func.now(),
+            )
+            .returning(Job)
+        )
+        result = await self._session.execute(stmt)
+        return sorted(
+            result.scalars().all(), key=lambda job: (job.priority, job.run_at)
+        )
+
+    async def complete(self, job_id: int) -> None:
+        """Remove a successfully processed job."""
+        await self._session.execute(delete(Job).where(Job.id == job_id))
+
+    async def retry(self, job_id: int, error: str, delay: timedelta) -> None:
+        """Put a failed job back on the queue after ``delay``."""
+        stmt = (
+            update(Job)
+            .where(Job.id == job_id)
+            .values(
+                status=JobStatus.QUEUED.value,
+                run_at=func.now() + delay,
+                locked_at=None,
+                locked_by=None,
+                last_error=error,
+                updated_at=func.now(),
+            )
+        )
+        await self._session.execute(stmt)
+
+    async def fail(self, job_id: int, error: str) -> None:
+        """Mark a job as permanently failed."""
+        stmt = (
+            update(Job)
+            .where(Job.id == job_id)
+            .values(
+                status=JobStatus.FAILED.value,
+                locked_at=None,
+                locked_by=None,
+                last_error=error,
+                updated_at=func.now(),
+            )
+        )
+        await self._session.execute(stmt)
+
+    async def requeue_stale(self, lock_timeout: timedelta) -> list[Job]:
+        """Recover running jobs whose worker died without finishing them.
+
+        Jobs with attempts left go back on the queue; jobs that have used
+        all their attempts are marked as failed, so a job that kills its
+        worker every time it runs cannot be claimed forever.
+
+        Returns:
+            The recovered jobs, with their new status.
+        """
+        exhausted = Job.attempts >= Job.max_attempts
+        stmt = (
+            update(Job)
+            .where(
+                Job.status == JobStatus.RUNNING.value,
+                Job.locked_at < func.now() - lock_timeout,
+            )
+            .values(
+                status=case(
+                    (exhausted, JobStatus.FAILED.value),
+                    else_=JobStatus.QUEUED.value,
+                ),
+                locked_at=None,
+                locked_by=None,
+                last_error=case(
+                    (exhausted, _STALE_ERROR),
+                    else_=Job.last_error,
+                ),
+                updated_at=func.now(),
+            )
+            .returning(Job)
+        )
+        result = await self._session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def count_by_status(self) -> dict[str, int]:
+        """Get the number of jobs in each status."""
+        stmt = select(Job.status, func.count()).group_by(Job.status)
+        result = await self._session.execute(stmt)
+        return dict(result.all())
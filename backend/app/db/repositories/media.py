@@ -0,0 +1,75 @@
+"""Media repository for database operations."""
+
+from uuid import UUID
+
+from sqlalchemy import ColumnElement, and_, exists, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.credit import CreditAccount
+from app.db.models.media import MediaFile, MediaStatus
+from app.db.models.program import Program, ProgramAssignment
+
+
+class MediaRepository:
+    """Repository for MediaFile model operations."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def get_by_id(self, media_id: UUID) -> MediaFile | None:
+        """Get a media file by ID."""
+        return await self._session.get(MediaFile, media_id)
+
+    async def get_viewable(self, media_id: UUID, user_id: UUID) -> MediaFile | None:
+        """Get a media file if the user owns it or trains with its owner.
+
+        A coach and student train together when the student holds credits
+        for one of the coach's bundles or is assigned one of their programs,
+        in either direction, so coaches see their students' uploads and
+        students see their coaches'. Programs are only ever assigned to
+        students holding credits with the coach, so an assignment cannot
+        open anyone's media to a stranger.
+        """
+        owner_id = MediaFile.owner_id
+
+        def pair(
+            student_id: ColumnElement[UUID], coach_id: ColumnElement[UUID]
+        ) -> ColumnElement[bool]:
+            return or_(
+                and_(student_id == user_id, coach_id == owner_id),
+                and_(student_id == owner_id, coach_id == user_id),
+            )
+
+        stmt = select(MediaFile).where(
+            MediaFile.id == media_id,
+            or_(
+                owner_id == user_id,
+                exists().where(pair(CreditAccount.student_id, CreditAccount.coach_id)),
+                exists()
+                .where(Program.id == ProgramAssignment.program_id)
+                .where(pair(ProgramAssignment.student_id, Program.coach_id)),
+            ),
+        )
+        result = await self._session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def create(self, media: MediaFile) -> MediaFile:
+        """Persist a new media file record."""
+        self._session.add(media)
+        await self._session.flush()
+        await self._session.refresh(media)
+        return media
+
+    async def mark_complete(self, media_id: UUID) -> None:
+        """Mark an upload as complete."""
+        stmt = (
+            update(MediaFile)
+            .where(MediaFile.id == media_id)
+            .values(status=MediaStatus.COMPLETE.value)
+        )
+        await self._session.execute(stmt)
+
+    async def delete(self, media: MediaFile) -> None:
+        """Delete a media file record."""
+        await self._session.delete(media)
+        await self._session.flush()
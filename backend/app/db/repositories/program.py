@@ -0,0 +1,445 @@
+"""Program repository for loading and saving program trees."""
+
+import uuid
+from collections import defaultdict
+from datetime import date, datetime
+from itertools import chain
+
+from sqlalchemy import (
+    ColumnElement,
+    Date,
+    Select,
+    Uuid,
+    any_,
+    bindparam,
+    delete,
+    exists,
+    func,
+    insert,
+    literal,
+    literal_column,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, aggregate_order_by
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.base import Base
+from app.db.models.credit import CreditAccount
+from app.db.models.program import (
+    Program,
+    ProgramActivity,
+    ProgramAssignment,
+    ProgramDay,
+    ProgramWeek,
+)
+from app.db.models.user import User
+
+PROGRAM_FIELDS = (
+    "name",
+    "description",
+    "sport",
+    "duration_weeks",
+    "days_per_week",
+    "status",
+)
+
+
+def _uuid(value: uuid.UUID | str) -> uuid.UUID:
+    return value if isinstance(value, uuid.UUID) else uuid.UUID(str(value))
+
+
+class _Level:
+    """How one level of the program tree maps onto its table."""
+
+    def __init__(
+        self,
+        model: type[Base],
+        parent_key: str,
+        fields: tuple[str, ...],
+        children_key: str | None,
+        number_field: str,
+        number_start: int,
+    ) -> None:
+        self.model = model
+        self.parent_key = parent_key
+        self.fields = fields
+        self.children_key = children_key
+        self.number_field = number_field
+        self.number_start = number_start
+
+
+_LEVELS = (
+    _Level(
+        ProgramWeek, "program_id", ("week_number", "name"), "days", "week_number", 1
+    ),
+    _Level(
+        ProgramDay,
+        "week_id",
+        ("day_number", "name", "notes"),
+        "activities",
+        "day_number",
+        1,
+    ),
+    _Level(
+        ProgramActivity,
+        "day_id",
+        ("name", "description", "metrics", "notes", "content_id", "position"),
+        None,
+        "position",
+        0,
+    ),
+)
+
+
+def _json_list(element: ColumnElement, order_by: ColumnElement) -> ColumnElement:
+    """Aggregate rows into a JSON array, or ``[]`` when there are none."""
+    return func.coalesce(
+        func.jsonb_agg(aggregate_order_by(element, order_by)),
+        literal_column("'[]'::jsonb"),
+    )
+
+
+def _json_object(**columns: ColumnElement) -> ColumnElement:
+    """Build a ``jsonb_build_object`` call from keyword arguments."""
+    return func.jsonb_build_object(*chain.from_iterable(columns.items()))
+
+
+def _tree_statement() -> Select:
+    """Build the single SELECT that returns a whole program as JSON.
+
+    Each level is a correlated subquery that aggregates its children with
+    ``jsonb_agg``, driven by the parent foreign key indexes. Postgres
+    assembles the whole document, so loading a program costs one round-trip
+    regardless of how many weeks, days and activities it has.
+    """
+    activity = _json_object(
+        id=ProgramActivity.id,
+        name=ProgramActivity.name,
+        description=ProgramActivity.description,
+        metrics=ProgramActivity.metrics,
+        notes=ProgramActivity.notes,
+        content_id=ProgramActivity.content_id,
+        position=ProgramActivity.position,
+    )
+    activities = (
+        select(_json_list(activity, ProgramActivity.position))
+        .where(ProgramActivity.day_id == ProgramDay.id)
+        .scalar_subquery()
+    )
+    day = _json_object(
+        id=ProgramDay.id,
+        day_number=ProgramDay.day_number,
+        name=ProgramDay.name,
+        notes=ProgramDay.notes,
+        activities=activities,
+    )
+    days = (
+        select(_json_list(day, ProgramDay.day_number))
+        .where(ProgramDay.week_id == ProgramWeek.id)
+        .scalar_subquery()
+    )
+    week = _json_object(
+        id=ProgramWeek.id,
+        week_number=ProgramWeek.week_number,
+        name=ProgramWeek.name,
+        days=days,
+    )
+    weeks = (
+        select(_json_list(week, ProgramWeek.week_number))
+        .where(ProgramWeek.program_id == Program.id)
+        .scalar_subquery()
+    )
+    return select(
+        _json_object(
+            id=Program.id,
+            coach_id=Program.coach_id,
+            name=Program.name,
+            description=Program.description,
+            sport=Program.sport,
+            duration_weeks=Program.duration_weeks,
+            days_per_week=Program.days_per_week,
+            status=Program.status,
+            assigned_count=Program.assigned_count,
+            created_at=Program.created_at,
+            updated_at=Program.updated_at,
+            weeks=weeks,
+        )
+    )
+
+
+class ProgramRepository:
+    """Repository for Program trees.
+
+    Reads return the tree as a plain dict built by Postgres. Writes take an
+    old and a new version of the tree and issue only the INSERT, UPDATE and
+    DELETE statements needed to turn one into the other, batched per level.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def get_tree(self, program_id: uuid.UUID) -> dict | None:
+        """Load a whole program tree in one query."""
+        stmt = _tree_statement().where(Program.id == program_id)
+        result = await self._session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def get_by_id(self, program_id: uuid.UUID) -> Program | None:
+        """Get a program row without its tree."""
+        return await self._session.get(Program, program_id)
+
+    async def list_for_coach(
+        self,
+        coach_id: uuid.UUID,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> list[Program]:
+        """Get a coach's programs, most recently edited first."""
+        stmt = (
+            select(Program)
+            .where(Program.coach_id == coach_id)
+            .order_by(Program.updated_at.desc())
+            .offset(skip)
+            .limit(limit)
+        )
+        result = await self._session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def lock_for_update(
+        self,
+        program_id: uuid.UUID,
+        coach_id: uuid.UUID,
+    ) -> datetime | None:
+        """Lock a program row for editing and bump its ``updated_at``.
+
+        Concurrent saves of the same program serialize on this row lock, so
+        each patch is applied to the tree the previous one produced.
+
+        Returns:
+            The new ``updated_at``, or None if the coach has no such program.
+        """
+        stmt = (
+            update(Program)
+            .where(Program.id == program_id, Program.coach_id == coach_id)
+            .values(updated_at=func.now())
+            .returning(Program.updated_at)
+        )
+        result = await self._session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def create(self, coach_id: uuid.UUID, tree: dict) -> uuid.UUID:
+        """Insert a new program and its whole tree.
+
+        Returns:
+            The new program's ID.
+        """
+        program = Program(
+            coach_id=coach_id,
+            **{field: tree[field] for field in PROGRAM_FIELDS},
+        )
+        self._session.add(program)
+        await self._session.flush()
+        empty = {"id": program.id, "weeks": []}
+        await self.save_tree(empty, {**tree, "id": program.id})
+        return program.id
+
+    async def save_tree(self, old: dict, new: dict) -> None:
+        """Write the difference between two versions of a program tree.
+
+        Nodes are matched by ID across the whole level, so moving a day to
+        another week is a single UPDATE of its ``week_id``. Nodes without a
+        known ID are inserted, and ``new`` is updated in place with their
+        generated IDs. Ordinal fields (week/day numbers, activity positions)
+        are renumbered from list order first.
+        """
+        program_id = _uuid(old["id"])
+        changed = {
+            field: new[field]
+            for field in PROGRAM_FIELDS
+            if field in new and new.get(field) != old.get(field)
+        }
+        if changed:
+            await self._session.execute(
+                update(Program).where(Program.id == program_id).values(**changed)
+            )
+
+        old_parents = [(program_id, old.get("weeks", []))]
+        new_parents = [(program_id, new.get("weeks", []))]
+        deletes: list[tuple[type[Base], list[uuid.UUID]]] = []
+
+        for level in _LEVELS:
+            old_nodes = {
+                str(node["id"]): (node, parent_id)
+                for parent_id, nodes in old_parents
+                for node in nodes
+            }
+            inserts: list[dict] = []
+            updates: dict[tuple[str, ...], list[dict]] = defaultdict(list)
+            seen: set[str] = set()
+
+            for parent_id, nodes in new_parents:
+                for number, node in enumerate(nodes, start=level.number_start):
+                    node[level.number_field] = number
+                    key = str(node.get("id"))
+                    if key in old_nodes and key not in seen:
+                        old_node, old_parent = old_nodes[key]
+                        values = {
+                            field: node.get(field)
+                            for field in level.fields
+                            if node.get(field) != old_node.get(field)
+                        }
+                        if parent_id != old_parent:
+                            values[level.parent_key] = parent_id
+                        if values:
+                            updates[tuple(sorted(values))].append(
+                                {"_id": _uuid(old_node["id"]), **values}
+                            )
+                    else:
+                        # New node, or a duplicate produced by a JSON Patch copy
+                        node["id"] = uuid.uuid4()
+                        inserts.append(
+                            {
+                                "id": node["id"],
+                                level.parent_key: parent_id,
+                                **{field: node.get(field) for field in level.fields},
+                            }
+                        )
+                    seen.add(str(node["id"]))
+
+            table = level.model.__table__
+            if inserts:
+                await self._session.execute(insert(table), inserts)
+            for fields, rows in updates.items():
+                stmt = (
+                    update(table)
+                    .where(table.c.id == bindparam("_id"))
+                    .values({field: bindparam(field) for field in fields})
+                )
+                await self._session.execute(stmt, rows)
+            removed = [
+                _uuid(node["id"])
+                for key, (node, _) in old_nodes.items()
+                if key not in seen
+            ]
+            if removed:
+                deletes.append((level.model, removed))
+
+            if level.children_key is None:
+                break
+            old_parents = [
+                (_uuid(node["id"]), node.get(level.children_key, []))
+                for node, _ in old_nodes.values()
+            ]
+            new_parents = [
+                (_uuid(node["id"]), node.get(level.children_key, []))
+                for _, nodes in new_parents
+                for node in nodes
+            ]
+
+        # Deletes run last so children moved out of a removed parent have
+        # already been re-parented before the cascade fires.
+        for model, ids in deletes:
+            await self._session.execute(delete(model).where(model.id.in_(ids)))
+
+    async def delete(self, program_id: uuid.UUID, coach_id: uuid.UUID) -> bool:
+        """Delete a program and, by cascade, its whole tree."""
+        stmt = delete(Program).where(
+            Program.id == program_id, Program.coach_id == coach_id
+        )
+        result = await self._session.execute(stmt)
+        return result.rowcount > 0
+
+    async def assign_students(
+        self,
+        program_id: uuid.UUID,
+        coach_id: uuid.UUID,
+        student_ids: list[uuid.UUID],
+        start_date: date | None = None,
+    ) -> tuple[int, int]:
+        """Assign a program to a batch of the coach's students in one statement.
+
+        The assignments are inserted with a single ``INSERT ... SELECT`` over
+        the ``users`` rows matching ``student_ids`` that hold a credit account
+        with the coach, so unknown IDs and users the coach does not train are
+        skipped, and students who already have the program are left alone via
+        ``ON CONFLICT DO NOTHING``. The same statement adds the number of
+        rows actually inserted to ``assigned_count``.
+
+        Returns:
+            A tuple of (students newly assigned, program's new assigned_count).
+        """
+        students = select(
+            func.gen_random_uuid(),
+            literal(program_id, Uuid),
+            User.id,
+            literal(start_date, Date),
+        ).where(
+            User.id == any_(literal(student_ids, ARRAY(Uuid))),
+            exists().where(
+                CreditAccount.student_id == User.id,
+                CreditAccount.coach_id == coach_id,
+            ),
+        )
+        inserted = (
+            pg_insert(ProgramAssignment)
+            .from_select(["id", "program_id", "student_id", "start_date"], students)
+            .on_conflict_do_nothing(constraint="uq_program_assignment_student")
+            .returning(ProgramAssignment.id)
+            .cte("inserted")
+        )
+        count = select(func.count()).select_from(inserted).scalar_subquery()
+        stmt = (
+            update(Program)
+            .where(Program.id == program_id)
+            .values(assigned_count=Program.assigned_count + count)
+            .returning(count, Program.assigned_count)
+            .add_cte(inserted)
+        )
+        result = await self._session.execute(stmt)
+        row = result.one()
+        return row[0], row[1]
+
+    async def unassign_student(
+        self,
+        program_id: uuid.UUID,
+        student_id: uuid.UUID,
+    ) -> bool:
+        """Remove a student's assignment and decrement ``assigned_count``."""
+        deleted = (
+            delete(ProgramAssignment)
+            .where(
+                ProgramAssignment.program_id == program_id,
+                ProgramAssignment.student_id == student_id,
+            )
+            .returning(ProgramAssignment.id)
+            .cte("deleted")
+        )
+        count = select(func.count()).select_from(deleted).scalar_subquery()
+        stmt = (
+            update(Program)
+            .where(Program.id == program_id)
+            .values(assigned_count=Program.assigned_count - count)
+            .returning(count)
+            .add_cte(deleted)
+        )
+        result = await self._session.execute(stmt)
+        return (result.scalar_one_or_none() or 0) > 0
+
+    async def list_assignments(
+        self,
+        program_id: uuid.UUID,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> list[ProgramAssignment]:
+        """Get a program's assignments, oldest first."""
+        stmt = (
+            select(ProgramAssignment)
+            .where(ProgramAssignment.program_id == program_id)
+            .order_by(ProgramAssignment.created_at, ProgramAssignment.id)
+            .offset(skip)
+            .limit(limit)
+        )
+        result = await self._session.execute(stmt)
+        return list(result.scalars().all())
@@ -1,11 +1,19 @@
 """User repository for database operations."""
 
-from sqlalchemy import select
+from collections.abc import AsyncIterable, Iterable
+
+from sqlalchemy import JSON, Column, String, func, literal, literal_column, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.invalidation import ALL, invalidate
 from app.db.models.user import User, UserMode
+from app.db.repositories.base import copy_to_staging, staging_table
 from app.schemas.user import UserCreate, UserUpdate
 
+# (uid, email, display name) of one Firebase user
+FirebaseUserRow = tuple[str, str, str | None]
+
 
 class UserRepository:
     """Repository for User model operations.
@@ -76,13 +84,92 @@ class UserRepository:
             # Update existing user's profile info
             # Email and display name may have changed in Firebase
             user.email = email
-            if display_name is not None:
+            if display_name is not None and display_name != user.display_name:
                 user.display_name = display_name
+                invalidate(self._session, User.__tablename__, user.id)
 
         await self._session.flush()
         await self._session.refresh(user)
         return user
 
+    async def import_from_firebase(
+        self,
+        users: Iterable[FirebaseUserRow] | AsyncIterable[FirebaseUserRow],
+    ) -> tuple[int, int]:
+        """Create or update many Firebase users at once.
+
+        The bulk counterpart of ``upsert_from_firebase``, with the same
+        rules: new users start as students with no roles, existing users
+        get their email updated and their display name too unless the new
+        one is missing. The rows are streamed into a staging table with
+        COPY and merged with one INSERT ... ON CONFLICT, so importing a
+        hundred thousand users takes a handful of statements.
+
+        Args:
+            users: (uid, email, display name) of each user. Consumed while
+                the COPY runs, so it may page through its source lazily.
+
+        Returns:
+            Number of users created and number of users updated. Users
+            whose email and display name did not change are not counted.
+        """
+        staging = staging_table(
+            "firebase_user_import",
+            Column("auth_subject", String(255), nullable=False),
+            Column("email", String(255), nullable=False),
+            Column("display_name", String(255)),
+        )
+        await copy_to_staging(self._session, staging, users)
+
+        # DISTINCT ON keeps a uid listed twice from hitting the same row twice
+        rows = select(
+            func.gen_random_uuid(),
+            literal("firebase", String),
+            staging.c.auth_subject,
+            staging.c.email,
+            staging.c.display_name,
+            literal([], JSON),
+            literal(UserMode.STUDENT.value, String),
+        ).distinct(staging.c.auth_subject)
+        insert = pg_insert(User).from_select(
+            [
+                "id",
+                "auth_provider",
+                "auth_subject",
+                "email",
+                "display_name",
+                "roles",
+                "active_mode",
+            ],
+            rows,
+        )
+        display_name = func.coalesce(insert.excluded.display_name, User.display_name)
+        merged = (
+            insert.on_conflict_do_update(
+                constraint="uq_auth_provider_subject",
+                set_={
+                    "email": insert.excluded.email,
+                    "display_name": display_name,
+                    "updated_at": func.now(),
+                },
+                where=User.email.is_distinct_from(insert.excluded.email)
+                | User.display_name.is_distinct_from(display_name),
+            )
+            # xmax is 0 only on rows this statement inserted
+            .returning(literal_column("xmax = 0").label("created"))
+            .cte("merged")
+        )
+        result = await self._session.execute(
+            select(
+                func.count().filter(merged.c.created),
+                func.count().filter(~merged.c.created),
+            )
+        )
+        created, updated = result.one()
+        if updated:
+            invalidate(self._session, User.__tablename__, ALL)
+        return created, updated
+
     async def create(self, data: UserCreate) -> User:
         """Create a new user."""
         db_obj = User(**data.model_dump())
@@ -96,6 +183,8 @@ class UserRepository:
         update_data = data.model_dump(exclude_unset=True)
         for field, value in update_data.items():
             setattr(user, field, value)
+        if "display_name" in update_data:
+            invalidate(self._session, User.__tablename__, user.id)
 
         await self._session.flush()
         await self._session.refresh(user)
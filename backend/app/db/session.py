@@ -1,34 +1,93 @@
 from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Any
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 
+from app.core.admission import ServerBusyError, get_session_limiter
 from app.core.config import get_settings
 
-settings = get_settings()
 
-engine = create_async_engine(
-    str(settings.database_url),
-    echo=settings.debug,
-    pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=10,
-)
+@lru_cache
+def get_engine() -> AsyncEngine:
+    """Get the process's database engine.
 
-async_session_factory = async_sessionmaker(
-    engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-    autocommit=False,
-    autoflush=False,
-)
+    Built on first use rather than at import, so importing the app does not
+    connect or size a pool, and each worker process builds its own.
+    """
+    settings = get_settings()
+    return create_async_engine(
+        str(settings.database_url),
+        echo=settings.debug,
+        pool_pre_ping=True,
+        pool_size=settings.database_pool_size,
+        max_overflow=settings.database_max_overflow,
+        pool_timeout=settings.database_pool_timeout_seconds,
+    )
 
 
-async def get_session() -> AsyncGenerator[AsyncSession, None]:
-    """Dependency for getting async database sessions."""
-    async with async_session_factory() as session:
+@lru_cache
+def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Get the factory for sessions on the process's engine."""
+    return async_sessionmaker(
+        get_engine(),
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autocommit=False,
+        autoflush=False,
+    )
+
+
+def asyncpg_connect_args() -> dict[str, Any]:
+    """Keyword arguments for a raw ``asyncpg.connect`` to the app database.
+
+    Used for dedicated LISTEN connections that live outside the pool. The
+    engine's dialect parses the URL, so they connect exactly like pooled
+    connections (socket paths, SSL and other query options included).
+    """
+    engine = get_engine()
+    _args, kwargs = engine.dialect.create_connect_args(engine.url)
+    return kwargs
+
+
+@asynccontextmanager
+async def session_scope() -> AsyncGenerator[AsyncSession, None]:
+    """Open a session that commits on success and rolls back on error."""
+    async with get_session_factory()() as session:
         try:
             yield session
             await session.commit()
         except Exception:
             await session.rollback()
             raise
+
+
+@asynccontextmanager
+async def admitted_session_scope() -> AsyncGenerator[AsyncSession, None]:
+    """Open a ``session_scope`` under the process-wide session limiter.
+
+    The limiter slot is held until the session has committed and closed.
+
+    Raises:
+        ServerBusyError: If no slot frees up within the queue budget.
+    """
+    limiter = get_session_limiter()
+    if not await limiter.acquire():
+        raise ServerBusyError
+    try:
+        async with session_scope() as session:
+            yield session
+    finally:
+        limiter.release()
+
+
+async def get_session() -> AsyncGenerator[AsyncSession, None]:
+    """Dependency for getting async database sessions."""
+    async with session_scope() as session:
+        yield session
@@ -0,0 +1,89 @@
+"""Bulk import of Firebase users.
+
+Run with ``python -m app.import_users`` to import every user of the
+configured Firebase project, or ``python -m app.import_users users.json``
+to import a file written by ``firebase auth:export --format=json`` without
+calling Firebase. Users normally get a row the first time they sign in;
+importing a club up front lets coaches find and assign them before then.
+
+Users are streamed into a staging table with COPY and merged into
+``users`` with one upsert, all in one transaction, so an import that fails
+part way changes nothing and can simply be run again. Disabled users are
+skipped.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import time
+from collections.abc import AsyncIterator, Iterator
+from pathlib import Path
+
+from app.core.firebase import list_user_pages
+from app.db.repositories.user import FirebaseUserRow, UserRepository
+from app.db.session import get_engine, get_session_factory
+
+logger = logging.getLogger(__name__)
+
+
+async def from_firebase(page_size: int = 1000) -> AsyncIterator[FirebaseUserRow]:
+    """Yield every enabled user of the Firebase project, page by page."""
+    pages = list_user_pages(page_size)
+    fetched = 0
+    while (page := await asyncio.to_thread(next, pages, None)) is not None:
+        fetched += len(page)
+        logger.info("Fetched %d users from Firebase", fetched)
+        for user in page:
+            yield user
+
+
+def from_export(path: Path) -> Iterator[FirebaseUserRow]:
+    """Yield the enabled users of a ``firebase auth:export`` JSON file."""
+    with path.open() as export:
+        users = json.load(export)["users"]
+    for user in users:
+        if not user.get("disabled", False):
+            yield user["localId"], user.get("email", ""), user.get("displayName")
+
+
+async def import_users(export: Path | None = None, page_size: int = 1000) -> None:
+    """Import users from ``export``, or from Firebase if it is None."""
+    users = from_export(export) if export else from_firebase(page_size)
+    started = time.perf_counter()
+    try:
+        async with get_session_factory()() as session:
+            created, updated = await UserRepository(session).import_from_firebase(users)
+            await session.commit()
+    finally:
+        await get_engine().dispose()
+    logger.info(
+        "Created %d and updated %d users in %.1f s",
+        created,
+        updated,
+        time.perf_counter() - started,
+    )
+
+
+def main() -> None:
+    """Import Firebase users from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "export",
+        nargs="?",
+        type=Path,
+        help="firebase auth:export JSON file; omit to list users from Firebase",
+    )
+    parser.add_argument(
+        "--page-size",
+        type=int,
+        default=1000,
+        help="users per Firebase list_users page (at most 1000)",
+    )
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(import_users(args.export, args.page_size))
+
+
+if __name__ == "__main__":
+    main()
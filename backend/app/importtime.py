@@ -0,0 +1,124 @@
+"""Startup import-time profiler with a budget.
+
+Run with ``python -m app.importtime``. Imports the app in fresh interpreters
+with ``python -X importtime``, saves the raw report of the fastest run,
+prints the slowest modules and exits with status 1 if importing the app
+took longer than the budget. ``tests/test_import_time.py`` holds the test
+suite to the same budget, so cold-start regressions fail ``pytest``.
+
+Heavy integrations (Firebase, the database engine, the .env lookup) load on
+first use; when this reports one of them again, make it lazy rather than
+raising the budget.
+"""
+
+import argparse
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+TARGET = "app.main"
+
+# Default budget for importing TARGET, in milliseconds
+DEFAULT_BUDGET_MS = 2000.0
+
+
+@dataclass
+class ModuleTime:
+    """Import time of one module, in microseconds."""
+
+    name: str
+    self_us: int
+    cumulative_us: int
+
+
+def profile(target: str = TARGET) -> tuple[str, list[ModuleTime]]:
+    """Import ``target`` in a fresh interpreter.
+
+    Returns:
+        The raw ``-X importtime`` report and the parsed module times.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        capture_output=True,
+        text=True,
+        cwd=Path(__file__).resolve().parent.parent,
+        check=False,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {target} failed:\n{result.stderr}")
+    return result.stderr, parse(result.stderr)
+
+
+def parse(report: str) -> list[ModuleTime]:
+    """Parse a ``-X importtime`` report."""
+    modules = []
+    for line in report.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line.removeprefix("import time:").split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # the header line
+        modules.append(
+            ModuleTime(
+                name=fields[2].strip(),
+                self_us=int(fields[0]),
+                cumulative_us=int(fields[1]),
+            )
+        )
+    return modules
+
+
+def total_ms(modules: list[ModuleTime], target: str = TARGET) -> float:
+    """Milliseconds spent importing ``target`` and everything it imported."""
+    for module in modules:
+        if module.name == target:
+            return module.cumulative_us / 1000
+    raise ValueError(f"{target} does not appear in the report")
+
+
+def main() -> None:
+    """Profile the app import and enforce the budget."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=DEFAULT_BUDGET_MS,
+        help="fail if importing the app takes longer (ms)",
+    )
+    parser.add_argument(
+        "--runs",
+        type=int,
+        default=5,
+        help="fresh imports to time; the fastest counts",
+    )
+    parser.add_argument("--top", type=int, default=15, help="slowest modules to list")
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path("importtime.log"),
+        help="where to save the raw report of the fastest run",
+    )
+    args = parser.parse_args()
+
+    # The fastest run is the least disturbed by disk cache and CPU noise
+    runs = [profile() for _ in range(max(1, args.runs))]
+    report, modules = min(runs, key=lambda run: total_ms(run[1]))
+    args.output.write_text(report)
+    total = total_ms(modules)
+
+    print(f"Slowest modules by self time (of {len(modules)} imported):")
+    for module in sorted(modules, key=lambda m: m.self_us, reverse=True)[: args.top]:
+        print(
+            f"  {module.self_us / 1000:8.1f} ms self"
+            f"  {module.cumulative_us / 1000:8.1f} ms cumulative  {module.name}"
+        )
+    print(f"Raw report saved to {args.output}")
+    print(f"Importing {TARGET} took {total:.0f} ms (budget {args.budget:.0f} ms)")
+    if total > args.budget:
+        print("Import time is over budget", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
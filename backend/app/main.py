@@ -1,13 +1,25 @@
+import asyncio
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 
 from app.api.router import api_router
 from app.api.routes.health import router as health_router
+from app.core.admission import ServerBusyError, server_busy_response
+from app.core.compression import CompressionMiddleware
 from app.core.config import get_settings
+from app.core.invalidation import get_invalidation_bus
+from app.core.loop_monitor import LoopMonitorMiddleware, get_loop_monitor
+from app.core.query_stats import QueryStatsMiddleware
+from app.core.readiness import get_readiness_probe
 from app.db.init import init_db
+from app.services.autocomplete import get_autocomplete
+from app.services.events import get_event_broker
+from app.services.jobs import JobWorker
+from app.services.recommendations import get_coach_recommender
 
 settings = get_settings()
 
@@ -15,10 +27,34 @@ settings = get_settings()
 @asynccontextmanager
 async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan handler for startup and shutdown events."""
-    # Startup: Initialize database tables
+    # Startup: Initialize database tables and listen for cache invalidations
+    if settings.loop_monitor_enabled:
+        get_loop_monitor().start()
     await init_db()
+    await get_invalidation_bus().start()
+    get_readiness_probe().start()
+    get_coach_recommender().start()
+    get_autocomplete().start()
+
+    worker_task = None
+    if settings.job_worker_in_process:
+        import app.services.tasks  # noqa: F401 - registers job handlers
+
+        worker = JobWorker()
+        worker_task = asyncio.create_task(worker.run())
+
     yield
-    # Shutdown
+
+    # Shutdown: let the in-process worker finish its current batch
+    if worker_task is not None:
+        worker.stop()
+        await worker_task
+    await get_autocomplete().stop()
+    await get_coach_recommender().stop()
+    await get_readiness_probe().stop()
+    await get_event_broker().close()
+    await get_invalidation_bus().close()
+    await get_loop_monitor().stop()
 
 
 def create_app() -> FastAPI:
@@ -38,6 +74,34 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    # Compress large responses; added after CORS so it wraps it and sees
+    # final bodies
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.compression_minimum_size,
+        gzip_level=settings.compression_gzip_level,
+        brotli_quality=settings.compression_brotli_quality,
+        cache_max_bytes=settings.compression_cache_max_bytes,
+    )
+
+    # Count SQL statements per request; timing headers in debug mode only
+    if settings.query_stats_enabled:
+        app.add_middleware(
+            QueryStatsMiddleware,
+            headers=settings.debug,
+            repeat_threshold=settings.query_repeat_threshold,
+            strict=settings.query_budget_strict,
+        )
+
+    # Catch code that blocks the event loop; outermost, so a stall anywhere
+    # in a request, middleware included, is attributed to it
+    if settings.loop_monitor_enabled:
+        app.add_middleware(LoopMonitorMiddleware, monitor=get_loop_monitor())
+
+    # Shed load with 503 rather than queueing for a database connection
+    app.add_exception_handler(ServerBusyError, server_busy_response)
+    app.add_exception_handler(PoolTimeoutError, server_busy_response)
+
     # Mount routers
     app.include_router(health_router)  # Health at root level
     app.include_router(api_router, prefix=settings.api_prefix)
@@ -1,4 +1,62 @@
-from app.schemas.item import ItemCreate, ItemList, ItemResponse, ItemUpdate
+from app.schemas.activity_log import (
+    ActivityLogBatch,
+    ActivityLogBatchResult,
+    ActivityLogCreate,
+    ActivityRollupResponse,
+    RollupPeriod,
+)
+from app.schemas.annotation import (
+    AnnotationColor,
+    AnnotationPoint,
+    VideoAnnotationCreate,
+    VideoAnnotationResponse,
+    VideoAnnotationUpdate,
+)
+from app.schemas.autocomplete import AutocompleteSuggestion, SuggestionKind
+from app.schemas.coach import (
+    CoachProfileResponse,
+    CoachProfileUpdate,
+    CoachRecommendation,
+)
+from app.schemas.content import (
+    ContentFolderCreate,
+    ContentFolderResponse,
+    ContentFolderUpdate,
+    ContentItemCreate,
+    ContentItemResponse,
+    ContentItemUpdate,
+    ContentSearchResponse,
+    ContentTagFacet,
+    ContentTagMatch,
+    ContentType,
+)
+from app.schemas.credit import (
+    CreditAccountResponse,
+    CreditLedgerEntryResponse,
+    CreditRedeemRequest,
+)
+from app.schemas.item import (
+    ItemCreate,
+    ItemImportResult,
+    ItemImportRowError,
+    ItemList,
+    ItemResponse,
+    ItemUpdate,
+)
+from app.schemas.media import MediaResponse, MediaUploadCreate, MediaUploadStatus
+from app.schemas.program import (
+    ActivityMetrics,
+    JsonPatchOperation,
+    ProgramActivityData,
+    ProgramAssignmentCreate,
+    ProgramAssignmentProgress,
+    ProgramAssignmentResponse,
+    ProgramCreate,
+    ProgramDayData,
+    ProgramResponse,
+    ProgramSummary,
+    ProgramWeekData,
+)
 from app.schemas.user import (
     SessionLoginRequest,
     SessionLoginResponse,
@@ -10,15 +68,59 @@ from app.schemas.user import (
 )
 
 __all__ = [
+    "ActivityLogBatch",
+    "ActivityLogBatchResult",
+    "ActivityLogCreate",
+    "ActivityMetrics",
+    "ActivityRollupResponse",
+    "AnnotationColor",
+    "AnnotationPoint",
+    "AutocompleteSuggestion",
+    "CoachProfileResponse",
+    "CoachProfileUpdate",
+    "CoachRecommendation",
+    "ContentFolderCreate",
+    "ContentFolderResponse",
+    "ContentFolderUpdate",
+    "ContentItemCreate",
+    "ContentItemResponse",
+    "ContentItemUpdate",
+    "ContentSearchResponse",
+    "ContentTagFacet",
+    "ContentTagMatch",
+    "ContentType",
+    "CreditAccountResponse",
+    "CreditLedgerEntryResponse",
+    "CreditRedeemRequest",
     "ItemCreate",
+    "ItemImportResult",
+    "ItemImportRowError",
     "ItemList",
     "ItemResponse",
     "ItemUpdate",
+    "JsonPatchOperation",
+    "MediaResponse",
+    "MediaUploadCreate",
+    "MediaUploadStatus",
+    "ProgramActivityData",
+    "ProgramAssignmentCreate",
+    "ProgramAssignmentProgress",
+    "ProgramAssignmentResponse",
+    "ProgramCreate",
+    "ProgramDayData",
+    "ProgramResponse",
+    "ProgramSummary",
+    "ProgramWeekData",
+    "RollupPeriod",
     "SessionLoginRequest",
     "SessionLoginResponse",
     "SessionLogoutResponse",
+    "SuggestionKind",
     "UserCreate",
     "UserMode",
     "UserResponse",
     "UserUpdate",
+    "VideoAnnotationCreate",
+    "VideoAnnotationResponse",
+    "VideoAnnotationUpdate",
 ]
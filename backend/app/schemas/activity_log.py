@@ -0,0 +1,76 @@
+from datetime import date
+from enum import Enum
+from uuid import UUID
+
+from pydantic import AwareDatetime, BaseModel, ConfigDict, Field, model_validator
+
+# Most entries one ingestion request may carry
+MAX_BATCH_ENTRIES = 1000
+
+
+class RollupPeriod(str, Enum):
+    """Granularity of activity log rollups."""
+
+    DAY = "day"
+    WEEK = "week"
+
+
+class ActivityLogCreate(BaseModel):
+    """What a student did for one program activity."""
+
+    activity_id: UUID
+    performed_at: AwareDatetime = Field(
+        ...,
+        description=(
+            "When the activity was done, with the student's UTC offset; the "
+            "local date decides which day and week it counts towards"
+        ),
+    )
+    sets: int | None = Field(default=None, ge=0)
+    reps: int | None = Field(default=None, ge=0, description="Total reps")
+    duration_seconds: int | None = Field(default=None, ge=0)
+    distance_meters: float | None = Field(default=None, ge=0)
+    count: int | None = Field(default=None, ge=0)
+
+    @model_validator(mode="after")
+    def _has_a_metric(self) -> "ActivityLogCreate":
+        """Reject entries that record nothing."""
+        metrics = (
+            self.sets,
+            self.reps,
+            self.duration_seconds,
+            self.distance_meters,
+            self.count,
+        )
+        if all(metric is None for metric in metrics):
+            raise ValueError("At least one metric is required")
+        return self
+
+
+class ActivityLogBatch(BaseModel):
+    """Activity log entries to record at once, such as a whole session."""
+
+    entries: list[ActivityLogCreate] = Field(
+        ..., min_length=1, max_length=MAX_BATCH_ENTRIES
+    )
+
+
+class ActivityLogBatchResult(BaseModel):
+    """Outcome of recording a batch of activity log entries."""
+
+    logged: int = Field(..., description="Entries recorded")
+
+
+class ActivityRollupResponse(BaseModel):
+    """A student's totals for one activity over one day or week."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    period_start: date = Field(..., description="The day, or the Monday of the week")
+    activity_id: UUID
+    entries: int
+    sets: int
+    reps: int
+    duration_seconds: int
+    distance_meters: float
+    count: int
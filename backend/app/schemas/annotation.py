@@ -0,0 +1,147 @@
+"""Pydantic schemas for video annotations.
+
+Shapes mirror the annotation layer's types in the frontend. Coordinates and
+sizes are percentages of the video frame and are stored to two decimal
+places.
+"""
+
+from datetime import datetime
+from enum import Enum
+from typing import Annotated, Literal
+from uuid import UUID
+
+from pydantic import BaseModel, Field, model_validator
+
+# Generous bounds: shapes may be dragged partly outside the frame
+Coordinate = Annotated[float, Field(ge=-1000, le=1000)]
+Size = Annotated[float, Field(ge=-1000, le=1000)]
+
+# Times are stored as 32-bit milliseconds; a day is far longer than any
+# session recording and far below the 24.8 days that fit
+MAX_VIDEO_SECONDS = 24 * 60 * 60
+VideoTime = Annotated[float, Field(ge=0, le=MAX_VIDEO_SECONDS)]
+
+# Longest span an annotation with an end time may cover; looking up a time
+# window only scans annotations that start this long before it
+MAX_ANNOTATION_SECONDS = 10 * 60
+
+# Annotations saved per request, each with up to 500 shapes
+MAX_ANNOTATION_BATCH = 100
+
+
+class AnnotationColor(str, Enum):
+    """Enum for annotation stroke colors."""
+
+    RED = "red"
+    YELLOW = "yellow"
+    GREEN = "green"
+    BLUE = "blue"
+    WHITE = "white"
+
+
+class AnnotationPoint(BaseModel):
+    """A point as percentages of the video width and height."""
+
+    x: Coordinate
+    y: Coordinate
+
+
+class _ShapeBase(BaseModel):
+    id: str = Field(..., min_length=1, max_length=64)
+    color: AnnotationColor
+    stroke_width: float = Field(..., ge=0, le=100)
+
+
+class CircleShape(_ShapeBase):
+    type: Literal["circle"]
+    center: AnnotationPoint
+    radius: Size
+
+
+class ArrowShape(_ShapeBase):
+    type: Literal["arrow"]
+    start: AnnotationPoint
+    end: AnnotationPoint
+
+
+class LineShape(_ShapeBase):
+    type: Literal["line"]
+    start: AnnotationPoint
+    end: AnnotationPoint
+
+
+class RectangleShape(_ShapeBase):
+    type: Literal["rectangle"]
+    top_left: AnnotationPoint
+    width: Size
+    height: Size
+
+
+class FreehandShape(_ShapeBase):
+    type: Literal["freehand"]
+    points: list[AnnotationPoint] = Field(..., max_length=20_000)
+
+
+class TextShape(_ShapeBase):
+    type: Literal["text"]
+    position: AnnotationPoint
+    content: str = Field(..., max_length=1000)
+    font_size: float = Field(..., ge=0, le=1000)
+
+
+Shape = Annotated[
+    CircleShape | ArrowShape | LineShape | RectangleShape | FreehandShape | TextShape,
+    Field(discriminator="type"),
+]
+
+
+class VideoAnnotationCreate(BaseModel):
+    """Schema for saving an annotation."""
+
+    label: str | None = Field(default=None, max_length=255)
+    start_time: VideoTime = Field(..., description="Seconds into the video")
+    end_time: VideoTime | None = Field(
+        default=None,
+        description="Seconds into the video, or null to stay until the end",
+    )
+    shapes: list[Shape] = Field(..., max_length=500)
+
+    @model_validator(mode="after")
+    def _check_times(self) -> "VideoAnnotationCreate":
+        if self.end_time is not None:
+            if self.end_time < self.start_time:
+                raise ValueError("end_time must not be before start_time")
+            if self.end_time - self.start_time > MAX_ANNOTATION_SECONDS:
+                raise ValueError(
+                    f"An annotation may last at most {MAX_ANNOTATION_SECONDS} "
+                    "seconds; leave end_time empty to keep it until the end"
+                )
+        return self
+
+
+VideoAnnotationBatch = Annotated[
+    list[VideoAnnotationCreate], Field(max_length=MAX_ANNOTATION_BATCH)
+]
+
+
+class VideoAnnotationUpdate(BaseModel):
+    """Schema for updating an annotation. All fields are optional."""
+
+    label: str | None = Field(default=None, max_length=255)
+    start_time: VideoTime | None = None
+    end_time: VideoTime | None = None
+    shapes: list[Shape] | None = Field(default=None, max_length=500)
+
+
+class VideoAnnotationResponse(BaseModel):
+    """Schema for annotation API responses."""
+
+    id: UUID
+    media_id: UUID
+    author_id: UUID
+    label: str | None
+    start_time: float
+    end_time: float | None
+    shapes: list[Shape]
+    created_at: datetime
+    updated_at: datetime
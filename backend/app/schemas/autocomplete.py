@@ -0,0 +1,25 @@
+"""Pydantic schemas for search autocomplete."""
+
+from enum import Enum
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+
+class SuggestionKind(str, Enum):
+    """Enum for what a suggestion refers to."""
+
+    COACH = "coach"
+    SPECIALTY = "specialty"
+    CONTENT = "content"
+
+
+class AutocompleteSuggestion(BaseModel):
+    """Schema for one as-you-type search suggestion."""
+
+    kind: SuggestionKind
+    text: str
+    id: UUID | None = Field(
+        default=None,
+        description="The coach or content item; null for specialties",
+    )
@@ -0,0 +1,57 @@
+"""Pydantic schemas for coach profiles and recommendations."""
+
+from uuid import UUID
+
+from pydantic import BaseModel, Field, field_validator, model_validator
+
+from app.schemas.content import normalize_tags
+
+
+class CoachProfileUpdate(BaseModel):
+    """Schema for setting the current coach's profile."""
+
+    bio: str | None = Field(default=None, max_length=2000)
+    specialties: list[str] = Field(default_factory=list, max_length=20)
+    location: str | None = Field(default=None, max_length=255)
+    latitude: float | None = Field(default=None, ge=-90, le=90)
+    longitude: float | None = Field(default=None, ge=-180, le=180)
+    hourly_rate: int | None = Field(default=None, ge=0)
+
+    @field_validator("specialties")
+    @classmethod
+    def _normalize_specialties(cls, specialties: list[str]) -> list[str]:
+        return normalize_tags(specialties)
+
+    @model_validator(mode="after")
+    def _coordinates_together(self) -> "CoachProfileUpdate":
+        """Reject a latitude without a longitude, or the reverse."""
+        if (self.latitude is None) != (self.longitude is None):
+            raise ValueError("latitude and longitude must be set together")
+        return self
+
+
+class CoachProfileResponse(BaseModel):
+    """Schema for a coach's public profile."""
+
+    id: UUID = Field(..., description="The coach's user ID")
+    display_name: str | None
+    bio: str | None
+    specialties: list[str]
+    location: str | None
+    latitude: float | None
+    longitude: float | None
+    hourly_rate: int | None
+    rating: float | None
+    review_count: int
+
+
+class CoachRecommendation(CoachProfileResponse):
+    """Schema for a coach recommended to the current student."""
+
+    score: float | None = Field(
+        ...,
+        description=(
+            "Cosine similarity to the coaches you already train with, or null "
+            "when you have none yet and coaches are ranked by rating"
+        ),
+    )
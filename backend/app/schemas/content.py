@@ -0,0 +1,138 @@
+"""Pydantic schemas for the content library."""
+
+from datetime import datetime
+from enum import Enum
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+
+class ContentType(str, Enum):
+    """Enum for the kind of content item."""
+
+    VIDEO = "video"
+    IMAGE = "image"
+    DOCUMENT = "document"
+    LINK = "link"
+
+
+class ContentTagMatch(str, Enum):
+    """Enum for how multiple tag filters combine."""
+
+    ALL = "all"
+    ANY = "any"
+
+
+def normalize_tags(tags: list[str] | None) -> list[str] | None:
+    """Strip whitespace and drop empty or repeated tags, keeping order."""
+    if tags is None:
+        return None
+    tags = list(dict.fromkeys(tag.strip() for tag in tags if tag.strip()))
+    if any(len(tag) > 50 for tag in tags):
+        raise ValueError("Tags must be at most 50 characters")
+    return tags
+
+
+class ContentFolderCreate(BaseModel):
+    """Schema for creating a content folder."""
+
+    name: str = Field(..., min_length=1, max_length=255)
+    color: str = Field(default="bg-blue-500", max_length=50)
+    parent_id: UUID | None = Field(
+        default=None, description="Parent folder, or null for a top-level folder"
+    )
+
+
+class ContentFolderUpdate(BaseModel):
+    """Schema for renaming or moving a folder.
+
+    Setting ``parent_id`` moves the folder and everything inside it; an
+    explicit null moves it to the top level.
+    """
+
+    name: str | None = Field(default=None, min_length=1, max_length=255)
+    color: str | None = Field(default=None, max_length=50)
+    parent_id: UUID | None = None
+
+
+class ContentFolderResponse(BaseModel):
+    """Schema for a folder with its item counts."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    name: str
+    color: str
+    parent_id: UUID | None
+    depth: int
+    item_count: int = Field(default=0, description="Items filed in this folder")
+    total_item_count: int = Field(
+        default=0, description="Items in this folder and all of its subfolders"
+    )
+    created_at: datetime
+    updated_at: datetime
+
+
+class ContentItemBase(BaseModel):
+    """Base schema for content items."""
+
+    title: str = Field(..., min_length=1, max_length=255)
+    description: str | None = None
+    type: ContentType
+    folder_id: UUID | None = None
+    tags: list[str] = Field(default_factory=list, max_length=50)
+    thumbnail_url: str | None = Field(default=None, max_length=2048)
+    file_url: str | None = Field(default=None, max_length=2048)
+    duration: int | None = Field(default=None, ge=0, description="Seconds")
+    file_size: int | None = Field(default=None, ge=0, description="Bytes")
+
+    _normalize_tags = field_validator("tags")(normalize_tags)
+
+
+class ContentItemCreate(ContentItemBase):
+    """Schema for creating a content item."""
+
+    pass
+
+
+class ContentItemUpdate(BaseModel):
+    """Schema for updating a content item. All fields are optional."""
+
+    title: str | None = Field(default=None, min_length=1, max_length=255)
+    description: str | None = None
+    type: ContentType | None = None
+    folder_id: UUID | None = None
+    tags: list[str] | None = Field(default=None, max_length=50)
+    thumbnail_url: str | None = Field(default=None, max_length=2048)
+    file_url: str | None = Field(default=None, max_length=2048)
+    duration: int | None = Field(default=None, ge=0)
+    file_size: int | None = Field(default=None, ge=0)
+
+    _normalize_tags = field_validator("tags")(normalize_tags)
+
+
+class ContentItemResponse(ContentItemBase):
+    """Schema for content item API responses."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    created_at: datetime
+    updated_at: datetime
+
+
+class ContentTagFacet(BaseModel):
+    """Number of matching items carrying a tag."""
+
+    tag: str
+    count: int
+
+
+class ContentSearchResponse(BaseModel):
+    """Schema for a tag-filtered page of content with facet counts."""
+
+    items: list[ContentItemResponse]
+    total: int = Field(..., description="Items matching the filter")
+    facets: list[ContentTagFacet] = Field(
+        ..., description="Tag counts over all matching items, most common first"
+    )
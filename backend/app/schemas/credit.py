@@ -0,0 +1,45 @@
+"""Pydantic schemas for bundle credits."""
+
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class CreditAccountResponse(BaseModel):
+    """Schema for a student's credit balance with one coach service."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    coach_id: UUID
+    service_id: str
+    balance: int
+    updated_at: datetime
+
+
+class CreditRedeemRequest(BaseModel):
+    """Request body for redeeming bundle credits."""
+
+    coach_id: UUID
+    service_id: str = Field(..., min_length=1, max_length=64)
+    amount: int = Field(default=1, ge=1)
+    reference: str | None = Field(
+        default=None,
+        max_length=255,
+        description="External reference such as a booking ID",
+    )
+
+
+class CreditLedgerEntryResponse(BaseModel):
+    """Schema for a single credit ledger entry."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    account_id: UUID
+    kind: str
+    delta: int
+    balance_after: int
+    reference: str | None
+    created_at: datetime
@@ -36,6 +36,25 @@ class ItemResponse(ItemBase):
     updated_at: datetime
 
 
+class ItemImportRowError(BaseModel):
+    """Why one row of an item import was rejected."""
+
+    row: int = Field(..., description="1-based row number, not counting a CSV header")
+    errors: list[str]
+
+
+class ItemImportResult(BaseModel):
+    """Outcome of a bulk item import."""
+
+    rows: int = Field(..., description="Rows read from the upload")
+    created: int
+    updated: int
+    failed: int = Field(..., description="Rows rejected by validation")
+    errors: list[ItemImportRowError] = Field(
+        ..., description="The first rejected rows and why, up to a limit"
+    )
+
+
 class ItemList(BaseModel):
     """Schema for paginated list of items."""
 
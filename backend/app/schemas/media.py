@@ -0,0 +1,44 @@
+"""Pydantic schemas for media uploads."""
+
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class MediaUploadCreate(BaseModel):
+    """Request body for starting a resumable upload."""
+
+    filename: str = Field(..., min_length=1, max_length=255)
+    content_type: str = Field(
+        default="application/octet-stream",
+        max_length=127,
+    )
+    size: int = Field(..., ge=1, description="Total file size in bytes")
+    sha256: str = Field(
+        ...,
+        pattern=r"^[0-9a-fA-F]{64}$",
+        description="Hex-encoded SHA-256 of the complete file",
+    )
+
+
+class MediaResponse(BaseModel):
+    """Schema for media file API responses."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    filename: str
+    content_type: str
+    size: int
+    status: str
+    created_at: datetime
+
+
+class MediaUploadStatus(BaseModel):
+    """Progress of a resumable upload."""
+
+    id: UUID
+    offset: int
+    size: int
+    status: str
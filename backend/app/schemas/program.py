@@ -0,0 +1,155 @@
+"""Pydantic schemas for training programs."""
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Literal
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field, model_serializer
+
+
+class ProgramStatus(str, Enum):
+    """Enum for program publication status."""
+
+    DRAFT = "draft"
+    PUBLISHED = "published"
+    ARCHIVED = "archived"
+
+
+class ActivityMetrics(BaseModel):
+    """Prescribed volume for an activity."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    type: Literal["sets_reps", "duration", "distance", "count", "custom"]
+    sets: int | None = None
+    # Ranges such as "10-12" are allowed
+    reps: int | str | None = None
+    duration: int | None = Field(default=None, description="Duration in seconds")
+    duration_unit: Literal["seconds", "minutes"] | None = None
+    distance: float | None = None
+    distance_unit: Literal["meters", "yards", "miles", "feet"] | None = None
+    count: int | None = None
+    custom_label: str | None = None
+    custom_value: str | None = None
+
+    @model_serializer(mode="wrap")
+    def _drop_unset_metrics(self, handler) -> dict:
+        """Omit metrics that do not apply to this activity type."""
+        return {key: value for key, value in handler(self).items() if value is not None}
+
+
+class ProgramActivityData(BaseModel):
+    """An activity node in a program tree."""
+
+    id: UUID | None = None
+    name: str = Field(..., min_length=1, max_length=255)
+    description: str | None = None
+    metrics: ActivityMetrics
+    notes: str | None = None
+    content_id: str | None = Field(default=None, max_length=64)
+    position: int = 0
+
+
+class ProgramDayData(BaseModel):
+    """A day node in a program tree."""
+
+    id: UUID | None = None
+    day_number: int = 1
+    name: str | None = Field(default=None, max_length=255)
+    notes: str | None = None
+    activities: list[ProgramActivityData] = Field(default_factory=list)
+
+
+class ProgramWeekData(BaseModel):
+    """A week node in a program tree."""
+
+    id: UUID | None = None
+    week_number: int = 1
+    name: str | None = Field(default=None, max_length=255)
+    days: list[ProgramDayData] = Field(default_factory=list)
+
+
+class ProgramBase(BaseModel):
+    """Base schema for Program with common attributes."""
+
+    name: str = Field(..., min_length=1, max_length=255)
+    description: str | None = None
+    sport: str | None = Field(default=None, max_length=100)
+    duration_weeks: int = Field(default=1, ge=1)
+    days_per_week: int = Field(default=1, ge=1, le=7)
+    status: ProgramStatus = ProgramStatus.DRAFT
+
+
+class ProgramCreate(ProgramBase):
+    """Schema for creating a Program, optionally with its full tree."""
+
+    weeks: list[ProgramWeekData] = Field(default_factory=list)
+
+
+class ProgramSummary(ProgramBase):
+    """Schema for Program list responses, without the tree."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    coach_id: UUID
+    assigned_count: int
+    created_at: datetime
+    updated_at: datetime
+
+
+class ProgramResponse(ProgramSummary):
+    """Schema for a Program with its full week/day/activity tree."""
+
+    weeks: list[ProgramWeekData]
+
+
+class JsonPatchOperation(BaseModel):
+    """A single RFC 6902 JSON Patch operation."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    op: Literal["add", "remove", "replace", "move", "copy", "test"]
+    path: str
+    value: Any = None
+    from_: str | None = Field(default=None, alias="from")
+
+
+class ProgramAssignmentCreate(BaseModel):
+    """Schema for assigning a program to a roster of students."""
+
+    student_ids: list[UUID] = Field(
+        ..., min_length=1, max_length=50_000, description="Students to assign"
+    )
+    start_date: date | None = Field(
+        default=None, description="Date the students should start the program"
+    )
+
+
+class ProgramAssignmentProgress(BaseModel):
+    """Progress of a bulk assignment, reported after each batch."""
+
+    processed: int = Field(..., description="Students processed so far")
+    total: int = Field(..., description="Distinct students in the request")
+    assigned: int = Field(..., description="Students newly assigned so far")
+    skipped: int = Field(
+        ...,
+        description=(
+            "Students already assigned, without an account or holding no "
+            "credits with the coach"
+        ),
+    )
+    assigned_count: int = Field(..., description="The program's assigned count")
+
+
+class ProgramAssignmentResponse(BaseModel):
+    """Schema for a student's program assignment."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    program_id: UUID
+    student_id: UUID
+    start_date: date | None
+    created_at: datetime
@@ -0,0 +1,216 @@
+"""Production multi-process API server.
+
+Run with ``python -m app.server``. A supervisor process binds the listening
+socket once and forks a pool of uvicorn workers that share it:
+
+- The pool is sized from the CPUs this process may use (affinity and the
+  container's cgroup quota) unless ``SERVER_WORKERS`` is set.
+- Workers use uvloop and httptools when they are installed.
+- Each worker runs the app's lifespan, so it opens its own database pool,
+  event listeners and caches.
+- A worker exits after ``SERVER_MAX_REQUESTS`` requests (plus jitter, so
+  workers do not all restart together) and is replaced.
+- On SIGTERM or SIGINT the supervisor asks every worker to stop accepting
+  connections and finish in-flight requests, and kills any still running
+  after ``SERVER_GRACEFUL_TIMEOUT`` seconds.
+- With ``SERVER_PRELOAD=true`` the app is imported once before forking, so
+  workers start faster and share imported code pages.
+"""
+
+import logging
+import math
+import multiprocessing
+import os
+import random
+import signal
+import socket
+import time
+from importlib.util import find_spec
+from multiprocessing.connection import wait
+from pathlib import Path
+from typing import Any
+
+import uvicorn
+
+from app.core.config import get_settings
+
+logger = logging.getLogger("app.server")
+
+APP = "app.main:app"
+
+# Workers that die sooner than this after starting count as crashes
+_MIN_WORKER_LIFETIME = 5.0
+
+
+def cpu_count() -> int:
+    """Number of CPUs this process can actually use."""
+    try:
+        count = len(os.sched_getaffinity(0))
+    except AttributeError:  # pragma: no cover - not available on macOS
+        count = os.cpu_count() or 1
+    try:
+        # cgroup v2 quota, e.g. "200000 100000" for two CPUs, or "max 100000"
+        quota, period = Path("/sys/fs/cgroup/cpu.max").read_text().split()
+        if quota != "max":
+            count = min(count, math.ceil(int(quota) / int(period)))
+    except (OSError, ValueError):
+        pass
+    return max(1, count)
+
+
+def _loop_and_http() -> tuple[str, str]:
+    loop = "uvloop" if find_spec("uvloop") else "asyncio"
+    http = "httptools" if find_spec("httptools") else "h11"
+    return loop, http
+
+
+def _bind(host: str, port: int, backlog: int) -> socket.socket:
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    sock.set_inheritable(True)
+    return sock
+
+
+def _run_worker(target: Any, sock: socket.socket, options: dict[str, Any]) -> None:
+    # Drop the supervisor's handlers; uvicorn installs its own
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    if not isinstance(target, str):
+        # Importing the app does not build the engine, but if the supervisor
+        # ever did, make sure its connections are not shared across processes
+        from app.db.session import get_engine
+
+        get_engine().sync_engine.dispose(close=False)
+    config = uvicorn.Config(target, lifespan="on", **options)
+    uvicorn.Server(config).run(sockets=[sock])
+
+
+class Supervisor:
+    """Keeps a pool of uvicorn worker processes running."""
+
+    def __init__(
+        self,
+        target: Any,
+        sock: socket.socket,
+        workers: int,
+        max_requests: int,
+        max_requests_jitter: int,
+        graceful_timeout: float,
+    ) -> None:
+        self._target = target
+        self._sock = sock
+        self._workers = workers
+        self._max_requests = max_requests
+        self._max_requests_jitter = max_requests_jitter
+        self._graceful_timeout = graceful_timeout
+        self._context = multiprocessing.get_context("fork")
+        self._processes: dict[
+            int, tuple[multiprocessing.process.BaseProcess, float]
+        ] = {}
+        self._stopping = False
+        self._loop, self._http = _loop_and_http()
+
+    def run(self) -> None:
+        """Run workers until SIGTERM or SIGINT, then drain them."""
+        signal.signal(signal.SIGTERM, self._stop)
+        signal.signal(signal.SIGINT, self._stop)
+        logger.info(
+            "Starting %d workers (loop=%s, http=%s)",
+            self._workers,
+            self._loop,
+            self._http,
+        )
+        for _ in range(self._workers):
+            self._spawn()
+
+        while not self._stopping:
+            sentinels = [process.sentinel for process, _ in self._processes.values()]
+            wait(sentinels, timeout=1.0)
+            self._reap()
+        self._drain()
+
+    def _spawn(self) -> None:
+        limit = None
+        if self._max_requests > 0:
+            limit = self._max_requests + random.randint(0, self._max_requests_jitter)
+        options = {
+            "loop": self._loop,
+            "http": self._http,
+            "limit_max_requests": limit,
+            "timeout_graceful_shutdown": self._graceful_timeout,
+            "log_config": None,
+        }
+        process = self._context.Process(
+            target=_run_worker,
+            args=(self._target, self._sock, options),
+            daemon=False,
+        )
+        process.start()
+        self._processes[process.pid] = (process, time.monotonic())
+        logger.info("Started worker %d", process.pid)
+
+    def _reap(self) -> None:
+        for pid, (process, started) in list(self._processes.items()):
+            if process.is_alive():
+                continue
+            process.join()
+            del self._processes[pid]
+            if self._stopping:
+                continue
+            if time.monotonic() - started < _MIN_WORKER_LIFETIME:
+                # Back off instead of fork-bombing on a broken deploy
+                logger.error(
+                    "Worker %d exited early with code %s", pid, process.exitcode
+                )
+                time.sleep(1.0)
+            else:
+                logger.info("Worker %d exited; replacing it", pid)
+            self._spawn()
+
+    def _stop(self, signum: int, _frame: Any) -> None:
+        if self._stopping:
+            return
+        logger.info("Received %s; draining workers", signal.Signals(signum).name)
+        self._stopping = True
+
+    def _drain(self) -> None:
+        for process, _ in self._processes.values():
+            if process.is_alive():
+                os.kill(process.pid, signal.SIGTERM)
+        # uvicorn waits up to the graceful timeout, then runs lifespan shutdown
+        deadline = time.monotonic() + self._graceful_timeout + 10.0
+        for process, _ in self._processes.values():
+            process.join(max(0.0, deadline - time.monotonic()))
+            if process.is_alive():
+                logger.warning("Killing worker %d after drain timeout", process.pid)
+                process.kill()
+                process.join()
+        self._sock.close()
+
+
+def main() -> None:
+    """Run the API with a supervised pool of worker processes."""
+    settings = get_settings()
+    workers = settings.server_workers or cpu_count()
+    sock = _bind(settings.host, settings.port, settings.server_backlog)
+
+    target: Any = APP
+    if settings.server_preload:
+        from app.main import app as target
+
+    Supervisor(
+        target,
+        sock,
+        workers=workers,
+        max_requests=settings.server_max_requests,
+        max_requests_jitter=settings.server_max_requests_jitter,
+        graceful_timeout=settings.server_graceful_timeout,
+    ).run()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
@@ -1,3 +1,22 @@
+from app.services.annotation import AnnotationService
+from app.services.content import ContentFolderError, ContentService
+from app.services.credit import CreditService, InsufficientCreditsError
 from app.services.item import ItemService
+from app.services.jobs import JobQueue, JobWorker, job_handler
+from app.services.media import MediaService
+from app.services.program import ProgramPatchError, ProgramService
 
-__all__ = ["ItemService"]
+__all__ = [
+    "AnnotationService",
+    "ContentFolderError",
+    "ContentService",
+    "CreditService",
+    "InsufficientCreditsError",
+    "ItemService",
+    "JobQueue",
+    "JobWorker",
+    "MediaService",
+    "ProgramPatchError",
+    "ProgramService",
+    "job_handler",
+]
@@ -0,0 +1,80 @@
+"""Service layer for the workout activity log."""
+
+from datetime import UTC, date
+from uuid import UUID
+
+from app.db.models.activity_log import (
+    ActivityLog,
+    ActivityLogDaily,
+    ActivityLogWeekly,
+    ActivityRollupMixin,
+)
+from app.db.models.base import get_partitioning
+from app.db.partitions import covered_days
+from app.db.repositories.activity_log import ActivityLogRepository
+from app.schemas.activity_log import (
+    ActivityLogBatch,
+    ActivityLogBatchResult,
+    RollupPeriod,
+)
+
+_ROLLUPS = {
+    RollupPeriod.DAY: ActivityLogDaily,
+    RollupPeriod.WEEK: ActivityLogWeekly,
+}
+
+
+class ActivityLogService:
+    """Service layer for logging workouts and reading progress totals."""
+
+    def __init__(self, repository: ActivityLogRepository) -> None:
+        self._repository = repository
+
+    async def log_entries(
+        self,
+        student_id: UUID,
+        batch: ActivityLogBatch,
+    ) -> ActivityLogBatchResult:
+        """Record a batch of entries and add them to the rollups.
+
+        Raises:
+            ValueError: If an entry falls outside the months the log is
+                partitioned for, from the start of last month to a few
+                months ahead.
+        """
+        first, end = covered_days(get_partitioning(ActivityLog.__table__))
+        for entry in batch.entries:
+            if not first <= entry.performed_at.astimezone(UTC).date() < end:
+                raise ValueError(
+                    f"performed_at must be on or after {first} and before {end}"
+                )
+        rows = [
+            {
+                "student_id": student_id,
+                **entry.model_dump(),
+                # In the offset the client sent, i.e. the student's local day
+                "performed_on": entry.performed_at.date(),
+            }
+            for entry in batch.entries
+        ]
+        logged = await self._repository.append(rows)
+        return ActivityLogBatchResult(logged=logged)
+
+    async def get_rollups(
+        self,
+        student_id: UUID,
+        period: RollupPeriod,
+        start: date,
+        end: date,
+        activity_id: UUID | None = None,
+    ) -> list[ActivityRollupMixin]:
+        """Get a student's daily or weekly totals between two days.
+
+        Raises:
+            ValueError: If ``end`` is before ``start``.
+        """
+        if end < start:
+            raise ValueError("end must not be before start")
+        return await self._repository.get_rollups(
+            _ROLLUPS[period], student_id, start, end, activity_id
+        )
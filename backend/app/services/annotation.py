@@ -0,0 +1,166 @@
+"""Service layer for video annotations."""
+
+from uuid import UUID
+
+from app.core.strokes import decode_shapes, encode_shapes
+from app.db.models.annotation import VideoAnnotation
+from app.db.models.media import MediaStatus
+from app.db.repositories.annotation import AnnotationRepository
+from app.db.repositories.media import MediaRepository
+from app.schemas.annotation import (
+    MAX_ANNOTATION_SECONDS,
+    VideoAnnotationCreate,
+    VideoAnnotationResponse,
+    VideoAnnotationUpdate,
+)
+
+
+def _to_ms(seconds: float | None) -> int | None:
+    return None if seconds is None else round(seconds * 1000)
+
+
+def _to_response(annotation: VideoAnnotation) -> VideoAnnotationResponse:
+    return VideoAnnotationResponse(
+        id=annotation.id,
+        media_id=annotation.media_id,
+        author_id=annotation.author_id,
+        label=annotation.label,
+        start_time=annotation.start_ms / 1000,
+        end_time=None if annotation.end_ms is None else annotation.end_ms / 1000,
+        shapes=decode_shapes(annotation.shapes),
+        created_at=annotation.created_at,
+        updated_at=annotation.updated_at,
+    )
+
+
+class AnnotationService:
+    """Service layer for annotations drawn over videos.
+
+    Shapes are converted between the API's JSON and the binary storage
+    format here, so the repository only ever handles opaque blobs. Videos
+    are annotated and read by the users who may watch them, once their
+    upload is complete.
+    """
+
+    def __init__(
+        self, repository: AnnotationRepository, media: MediaRepository
+    ) -> None:
+        self._repository = repository
+        self._media = media
+
+    async def _can_annotate(self, media_id: UUID, user_id: UUID) -> bool:
+        media = await self._media.get_viewable(media_id, user_id)
+        return media is not None and media.status == MediaStatus.COMPLETE.value
+
+    async def get_annotations(
+        self,
+        media_id: UUID,
+        viewer_id: UUID,
+        start_time: float = 0,
+        end_time: float | None = None,
+    ) -> list[VideoAnnotationResponse] | None:
+        """Get the annotations visible between two points of a video.
+
+        Returns:
+            The annotations ordered by start time, or None if the video
+            does not exist, is still uploading or the viewer may not see it.
+        """
+        if not await self._can_annotate(media_id, viewer_id):
+            return None
+        annotations = await self._repository.get_in_window(
+            media_id, _to_ms(start_time), _to_ms(end_time)
+        )
+        return [_to_response(annotation) for annotation in annotations]
+
+    async def create_annotations(
+        self,
+        media_id: UUID,
+        author_id: UUID,
+        data: list[VideoAnnotationCreate],
+    ) -> list[VideoAnnotationResponse] | None:
+        """Save a batch of annotations for a video.
+
+        Returns:
+            The saved annotations, or None if the video does not exist, is
+            still uploading or the author may not see it.
+        """
+        if not await self._can_annotate(media_id, author_id):
+            return None
+        if not data:
+            return []
+        rows = [
+            {
+                "media_id": media_id,
+                "author_id": author_id,
+                "label": annotation.label,
+                "start_ms": _to_ms(annotation.start_time),
+                "end_ms": _to_ms(annotation.end_time),
+                "shapes": encode_shapes(annotation.model_dump(mode="json")["shapes"]),
+            }
+            for annotation in data
+        ]
+        annotations = await self._repository.create_many(rows)
+        return [_to_response(annotation) for annotation in annotations]
+
+    async def update_annotation(
+        self,
+        media_id: UUID,
+        annotation_id: UUID,
+        author_id: UUID,
+        data: VideoAnnotationUpdate,
+    ) -> VideoAnnotationResponse | None:
+        """Update one of the author's annotations.
+
+        Raises:
+            ValueError: If the update would end the annotation before it
+                starts, or make it last longer than ``MAX_ANNOTATION_SECONDS``.
+        """
+        annotation = await self._repository.get_by_id(annotation_id)
+        if (
+            annotation is None
+            or annotation.media_id != media_id
+            or annotation.author_id != author_id
+        ):
+            return None
+
+        values = {}
+        fields = data.model_fields_set
+        if "label" in fields:
+            values["label"] = data.label
+        if "start_time" in fields and data.start_time is not None:
+            values["start_ms"] = _to_ms(data.start_time)
+        if "end_time" in fields:
+            values["end_ms"] = _to_ms(data.end_time)
+        if "shapes" in fields and data.shapes is not None:
+            values["shapes"] = encode_shapes(data.model_dump(mode="json")["shapes"])
+
+        start_ms = values.get("start_ms", annotation.start_ms)
+        end_ms = values.get("end_ms", annotation.end_ms)
+        if end_ms is not None:
+            if end_ms < start_ms:
+                raise ValueError("end_time must not be before start_time")
+            if end_ms - start_ms > MAX_ANNOTATION_SECONDS * 1000:
+                raise ValueError(
+                    f"An annotation may last at most {MAX_ANNOTATION_SECONDS} "
+                    "seconds; leave end_time empty to keep it until the end"
+                )
+
+        annotation = await self._repository.update(annotation, values)
+        return _to_response(annotation)
+
+    async def delete_annotation(
+        self,
+        media_id: UUID,
+        annotation_id: UUID,
+        author_id: UUID,
+    ) -> bool:
+        """Delete one of the author's annotations."""
+        annotation = await self._repository.get_by_id(annotation_id)
+        if (
+            annotation is None
+            or annotation.media_id != media_id
+            or annotation.author_id != author_id
+        ):
+            return False
+        await self._repository.delete(annotation)
+        return True
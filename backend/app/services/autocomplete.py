@@ -0,0 +1,424 @@
+"""As-you-type search suggestions from an in-memory prefix index.
+
+A ``LIKE 'foo%'`` query per keystroke would put the search box's load on
+Postgres, so each worker keeps an ``AutocompleteIndex`` of coach names,
+specialties and content titles instead. A ``PrefixIndex`` is a sorted
+array of keys searched with ``bisect``: every suggestion is indexed under
+each word it contains from its start on, so "john" finds "Sarah Johnson".
+The best matches of each prefix are cached, and a write only drops the
+cached prefixes of the keys it touched. A repeated keystroke costs a dict
+lookup and a new prefix one bisect over its range.
+
+Suggestions rank by popularity: a coach's review count, how many coaches
+offer a specialty, and how many program activities link a content item.
+Coach names and specialties are shown to everyone; content titles only to
+the coach whose library holds them.
+
+``Autocomplete`` builds the index at startup and keeps it current from
+the invalidation bus: writes to coach profiles, user names and content
+items on any worker name the coaches whose entries to reload, and only
+those are reloaded. A namespace-wide invalidation, such as a bulk import
+or a lost listener connection, rebuilds the whole index.
+"""
+
+import asyncio
+import heapq
+import logging
+import time
+import unicodedata
+import uuid
+from bisect import bisect_left
+from collections import Counter
+from collections.abc import Iterable
+from contextlib import suppress
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import islice
+from operator import attrgetter
+
+from app.core.config import get_settings
+from app.core.invalidation import ALL, get_invalidation_bus
+from app.db.models.coach import CoachProfile
+from app.db.models.content import ContentItem
+from app.db.models.user import User
+from app.db.repositories.coach import CoachRepository, ProfileRow
+from app.db.repositories.content import ContentRepository
+from app.db.session import get_session_factory
+from app.schemas.autocomplete import AutocompleteSuggestion, SuggestionKind
+
+logger = logging.getLogger(__name__)
+
+# Most suggestions kept per cached prefix, and so returned per request
+MAX_SUGGESTIONS = 20
+
+# Word starts indexed per suggestion, so long titles stay cheap
+_MAX_WORD_STARTS = 8
+
+# Sorts after every character a key can contain
+_KEY_END = "\U0010ffff"
+
+_RETRY_SECONDS = 5.0
+
+
+def normalize(text: str) -> str:
+    """Casefold, strip accents and collapse whitespace, for matching."""
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    return " ".join(
+        "".join(c for c in decomposed if not unicodedata.combining(c)).split()
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class Entry:
+    """A suggestion with what it is indexed and ranked by."""
+
+    # Unique within its index
+    ident: str
+    # Smaller ranks first: (-popularity, normalized text)
+    rank: tuple[int, str]
+    keys: tuple[str, ...]
+    suggestion: AutocompleteSuggestion
+
+
+def make_entry(
+    kind: SuggestionKind,
+    text: str,
+    popularity: int,
+    ref: uuid.UUID | None = None,
+) -> Entry:
+    """An entry for ``text``, indexed under each of its word starts."""
+    normalized = normalize(text)
+    words = normalized.split(" ")
+    keys = dict.fromkeys(
+        " ".join(words[i:]) for i in range(min(len(words), _MAX_WORD_STARTS))
+    )
+    return Entry(
+        ident=f"{kind.value}:{ref or normalized}",
+        rank=(-popularity, normalized),
+        keys=tuple(keys),
+        suggestion=AutocompleteSuggestion(kind=kind, text=text, id=ref),
+    )
+
+
+class PrefixIndex:
+    """Entries in a sorted array of keys, with the best matches per prefix cached."""
+
+    def __init__(self, cache_size: int = 0) -> None:
+        # "<key>\0<ident>", so equal keys of different entries stay distinct
+        self._keys: list[str] = []
+        self._entries: list[Entry] = []
+        self._cache: dict[str, tuple[Entry, ...]] = {}
+        self._cache_size = cache_size
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    @classmethod
+    def build(cls, entries: Iterable[Entry], cache_size: int = 0) -> "PrefixIndex":
+        """Index many entries with one sort rather than one insert each."""
+        index = cls(cache_size)
+        pairs = sorted(
+            (f"{key}\0{entry.ident}", entry) for entry in entries for key in entry.keys
+        )
+        index._keys = [key for key, _entry in pairs]
+        index._entries = [entry for _key, entry in pairs]
+        return index
+
+    def add(self, entry: Entry) -> None:
+        """Index an entry."""
+        for key in entry.keys:
+            position = bisect_left(self._keys, f"{key}\0{entry.ident}")
+            self._keys.insert(position, f"{key}\0{entry.ident}")
+            self._entries.insert(position, entry)
+        self._forget(entry)
+
+    def remove(self, entry: Entry) -> None:
+        """Stop indexing an entry added earlier."""
+        for key in entry.keys:
+            indexed = f"{key}\0{entry.ident}"
+            position = bisect_left(self._keys, indexed)
+            if position < len(self._keys) and self._keys[position] == indexed:
+                del self._keys[position]
+                del self._entries[position]
+        self._forget(entry)
+
+    def search(self, prefix: str, limit: int) -> tuple[Entry, ...]:
+        """The best ``limit`` entries with a key starting with ``prefix``."""
+        found = self._cache.get(prefix)
+        if found is None:
+            start = bisect_left(self._keys, prefix)
+            end = bisect_left(self._keys, prefix + _KEY_END, start)
+            # An entry can match on several of its word starts
+            matches = {entry.ident: entry for entry in self._entries[start:end]}
+            found = tuple(
+                heapq.nsmallest(
+                    MAX_SUGGESTIONS, matches.values(), key=attrgetter("rank")
+                )
+            )
+            if self._cache_size:
+                if len(self._cache) >= self._cache_size:
+                    del self._cache[next(iter(self._cache))]
+                self._cache[prefix] = found
+        return found[:limit]
+
+    def _forget(self, entry: Entry) -> None:
+        # Only the prefixes of its own keys can have matched the entry
+        for key in entry.keys:
+            for end in range(1, len(key) + 1):
+                self._cache.pop(key[:end], None)
+
+
+def _coach_entries(
+    profile: CoachProfile, display_name: str | None
+) -> tuple[Entry | None, dict[str, str]]:
+    """A coach's name entry, and their specialties by normalized name."""
+    specialties: dict[str, str] = {}
+    for text in profile.specialties:
+        specialties.setdefault(normalize(text), text)
+    name = None
+    if display_name:
+        name = make_entry(
+            SuggestionKind.COACH, display_name, profile.review_count, profile.user_id
+        )
+    return name, specialties
+
+
+class AutocompleteIndex:
+    """Coach names and specialties for everyone, and each coach's content titles."""
+
+    def __init__(self, public: PrefixIndex) -> None:
+        self._public = public
+        self._coaches: dict[uuid.UUID, tuple[Entry | None, tuple[str, ...]]] = {}
+        # Coaches offering each specialty, and its entry, by normalized name
+        self._specialties: dict[str, tuple[int, Entry]] = {}
+        self._libraries: dict[uuid.UUID, PrefixIndex] = {}
+        # Coach user IDs by auth subject, so requests need no user lookup
+        self._owners: dict[str, uuid.UUID] = {}
+
+    @classmethod
+    def build(
+        cls,
+        profiles: list[ProfileRow],
+        titles: list[tuple[uuid.UUID, str, uuid.UUID, str, int]],
+        cache_size: int,
+    ) -> "AutocompleteIndex":
+        """Build the index from every coach profile and content title."""
+        index = cls(PrefixIndex())
+        counts: Counter[str] = Counter()
+        texts: dict[str, str] = {}
+        for profile, display_name in profiles:
+            name, specialties = _coach_entries(profile, display_name)
+            index._coaches[profile.user_id] = (name, tuple(specialties))
+            counts.update(specialties.keys())
+            for specialty, text in specialties.items():
+                texts.setdefault(specialty, text)
+        for specialty, count in counts.items():
+            entry = make_entry(SuggestionKind.SPECIALTY, texts[specialty], count)
+            index._specialties[specialty] = (count, entry)
+        index._public = PrefixIndex.build(
+            [
+                *(name for name, _ in index._coaches.values() if name is not None),
+                *(entry for _count, entry in index._specialties.values()),
+            ],
+            cache_size,
+        )
+        index._set_libraries({}, titles)
+        return index
+
+    def suggest(
+        self, query: str, auth_subject: str, limit: int
+    ) -> list[AutocompleteSuggestion]:
+        """The best ``limit`` suggestions starting with ``query``."""
+        prefix = normalize(query)
+        if not prefix:
+            return []
+        found: Iterable[Entry] = self._public.search(prefix, limit)
+        library = self._libraries.get(self._owners.get(auth_subject))
+        if library is not None:
+            found = heapq.merge(
+                found, library.search(prefix, limit), key=attrgetter("rank")
+            )
+        return [entry.suggestion for entry in islice(found, limit)]
+
+    def set_coaches(
+        self, coach_ids: Iterable[uuid.UUID], profiles: list[ProfileRow]
+    ) -> None:
+        """Replace the entries of these coaches; those without a profile go."""
+        loaded = {profile.user_id: (profile, name) for profile, name in profiles}
+        for coach_id in coach_ids:
+            name, specialties = self._coaches.pop(coach_id, (None, ()))
+            if name is not None:
+                self._public.remove(name)
+            for specialty in specialties:
+                self._count_specialty(specialty, -1)
+            if coach_id in loaded:
+                name, specialties = _coach_entries(*loaded[coach_id])
+                self._coaches[coach_id] = (name, tuple(specialties))
+                if name is not None:
+                    self._public.add(name)
+                for specialty, text in specialties.items():
+                    self._count_specialty(specialty, 1, text)
+
+    def set_libraries(
+        self,
+        coach_ids: Iterable[uuid.UUID],
+        titles: list[tuple[uuid.UUID, str, uuid.UUID, str, int]],
+    ) -> None:
+        """Replace these coaches' content titles with ``titles``."""
+        self._set_libraries(dict.fromkeys(coach_ids), titles)
+
+    def _set_libraries(
+        self,
+        coach_ids: dict[uuid.UUID, None],
+        titles: list[tuple[uuid.UUID, str, uuid.UUID, str, int]],
+    ) -> None:
+        entries: dict[uuid.UUID, list[Entry]] = {key: [] for key in coach_ids}
+        for coach_id, auth_subject, item_id, title, uses in titles:
+            self._owners[auth_subject] = coach_id
+            entries.setdefault(coach_id, []).append(
+                make_entry(SuggestionKind.CONTENT, title, uses, item_id)
+            )
+        for coach_id, library in entries.items():
+            if library:
+                self._libraries[coach_id] = PrefixIndex.build(library)
+            else:
+                self._libraries.pop(coach_id, None)
+
+    def _count_specialty(self, specialty: str, delta: int, text: str = "") -> None:
+        count, old = self._specialties.pop(specialty, (0, None))
+        count += delta
+        if old is not None:
+            self._public.remove(old)
+            text = old.suggestion.text
+        if count > 0:
+            entry = make_entry(SuggestionKind.SPECIALTY, text, count)
+            self._specialties[specialty] = (count, entry)
+            self._public.add(entry)
+
+
+class Autocomplete:
+    """Keeps this process's autocomplete index built and current."""
+
+    def __init__(self, cache_size: int) -> None:
+        self._cache_size = cache_size
+        self.index: AutocompleteIndex | None = None
+        self._stale = True
+        self._coaches: set[uuid.UUID] = set()
+        self._libraries: set[uuid.UUID] = set()
+        self._wake = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    def suggest(
+        self, query: str, auth_subject: str, limit: int
+    ) -> list[AutocompleteSuggestion]:
+        """The best ``limit`` suggestions for ``query``; empty until first built."""
+        if self.index is None:
+            return []
+        return self.index.suggest(query, auth_subject, limit)
+
+    def changed(self, kind: str, keys: frozenset[str]) -> None:
+        """Queue the coaches named by an invalidation for reloading.
+
+        ``kind`` is ``"coach"`` for names and specialties or ``"library"``
+        for content titles.
+        """
+        if ALL in keys:
+            self._stale = True
+        else:
+            pending = self._coaches if kind == "coach" else self._libraries
+            pending.update(uuid.UUID(key) for key in keys)
+        self._wake.set()
+
+    def start(self) -> None:
+        """Build the index in the background, then keep it current."""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop updating."""
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def update(self) -> None:
+        """Rebuild the index if it is stale, else reload the queued coaches."""
+        if self._stale:
+            self._stale = False
+            self._coaches.clear()
+            self._libraries.clear()
+            try:
+                await self._rebuild()
+            except BaseException:
+                self._stale = True
+                raise
+            return
+
+        coaches, self._coaches = self._coaches, set()
+        libraries, self._libraries = self._libraries, set()
+        try:
+            async with get_session_factory()() as session:
+                profiles = (
+                    await CoachRepository(session).list_profiles(list(coaches))
+                    if coaches
+                    else []
+                )
+                titles = (
+                    await ContentRepository(session).list_titles(list(libraries))
+                    if libraries
+                    else []
+                )
+        except BaseException:
+            self._coaches |= coaches
+            self._libraries |= libraries
+            raise
+        self.index.set_coaches(coaches, profiles)
+        self.index.set_libraries(libraries, titles)
+
+    async def _rebuild(self) -> None:
+        started = time.perf_counter()
+        async with get_session_factory()() as session:
+            profiles = await CoachRepository(session).list_profiles()
+            titles = await ContentRepository(session).list_titles()
+        # Sorting every key is the slow part; keep it off the event loop
+        self.index = await asyncio.to_thread(
+            AutocompleteIndex.build, profiles, titles, self._cache_size
+        )
+        logger.info(
+            "Built autocomplete index of %d coaches and %d content items in %.2f s",
+            len(profiles),
+            len(titles),
+            time.perf_counter() - started,
+        )
+
+    async def _run(self) -> None:
+        while True:
+            self._wake.clear()
+            try:
+                await self.update()
+            except Exception:
+                logger.exception("Autocomplete index update failed")
+                await asyncio.sleep(_RETRY_SECONDS)
+                continue
+            if not (self._stale or self._coaches or self._libraries):
+                await self._wake.wait()
+
+
+@lru_cache
+def get_autocomplete() -> Autocomplete:
+    """Get this process's autocomplete index.
+
+    Writes on any worker queue the affected coaches through the
+    invalidation bus.
+    """
+    autocomplete = Autocomplete(get_settings().autocomplete_cache_max_prefixes)
+    bus = get_invalidation_bus()
+    bus.subscribe(
+        CoachProfile.__tablename__, lambda keys: autocomplete.changed("coach", keys)
+    )
+    bus.subscribe(User.__tablename__, lambda keys: autocomplete.changed("coach", keys))
+    bus.subscribe(
+        ContentItem.__tablename__, lambda keys: autocomplete.changed("library", keys)
+    )
+    return autocomplete
@@ -0,0 +1,46 @@
+"""Service layer for coach profiles."""
+
+from uuid import UUID
+
+from app.db.repositories.coach import CoachRepository, ProfileRow
+from app.schemas.coach import CoachProfileResponse, CoachProfileUpdate
+
+
+def profile_fields(row: ProfileRow) -> dict:
+    """``CoachProfileResponse`` fields of a profile row."""
+    profile, display_name = row
+    return {
+        "id": profile.user_id,
+        "display_name": display_name,
+        "bio": profile.bio,
+        "specialties": profile.specialties,
+        "location": profile.location,
+        "latitude": profile.latitude,
+        "longitude": profile.longitude,
+        "hourly_rate": profile.hourly_rate,
+        "rating": profile.rating,
+        "review_count": profile.review_count,
+    }
+
+
+class CoachService:
+    """Service layer for the profiles coaches are discovered by."""
+
+    def __init__(self, repository: CoachRepository) -> None:
+        self._repository = repository
+
+    async def get_profile(self, user_id: UUID) -> CoachProfileResponse | None:
+        """Get a coach's profile."""
+        row = await self._repository.get_profile(user_id)
+        return None if row is None else CoachProfileResponse(**profile_fields(row))
+
+    async def set_profile(
+        self,
+        user_id: UUID,
+        data: CoachProfileUpdate,
+    ) -> CoachProfileResponse:
+        """Create or replace the coach's own profile."""
+        await self._repository.upsert_profile(user_id, data.model_dump())
+        return CoachProfileResponse(
+            **profile_fields(await self._repository.get_profile(user_id))
+        )
@@ -0,0 +1,295 @@
+"""Service layer for the content library."""
+
+from functools import lru_cache
+from uuid import UUID, uuid4
+
+from app.core.cache import GroupedCache
+from app.core.config import get_settings
+from app.core.invalidation import ALL, get_invalidation_bus
+from app.db.models.content import MAX_FOLDER_PATH_LENGTH, ContentFolder, ContentItem
+from app.db.repositories.content import ROOT_PATH, ContentRepository, folder_path
+from app.schemas.content import (
+    ContentFolderCreate,
+    ContentFolderResponse,
+    ContentFolderUpdate,
+    ContentItemCreate,
+    ContentItemResponse,
+    ContentItemUpdate,
+    ContentSearchResponse,
+    ContentTagFacet,
+    ContentTagMatch,
+    normalize_tags,
+)
+
+# Item columns that cannot be cleared with an explicit null
+_REQUIRED_ITEM_FIELDS = ("title", "type", "tags")
+
+
+class ContentFolderError(Exception):
+    """Raised when a folder or item is placed somewhere it cannot go."""
+
+
+def _parent_path(path: str) -> str:
+    return path[: path.rstrip("/").rfind("/") + 1]
+
+
+def _check_path_length(length: int) -> None:
+    if length > MAX_FOLDER_PATH_LENGTH:
+        raise ContentFolderError("Folders cannot be nested this deep")
+
+
+@lru_cache
+def get_facet_cache() -> GroupedCache:
+    """Get the process-wide cache of tag facet counts, grouped by coach.
+
+    Item writes on any worker evict the coach's entries through the
+    invalidation bus.
+    """
+    settings = get_settings()
+    cache = GroupedCache(
+        ttl=settings.content_facet_cache_ttl_seconds,
+        max_entries=settings.content_facet_cache_max_entries,
+    )
+
+    def evict(coach_ids: frozenset[str]) -> None:
+        if ALL in coach_ids:
+            cache.clear()
+            return
+        for coach_id in coach_ids:
+            cache.invalidate(UUID(coach_id))
+
+    get_invalidation_bus().subscribe(ContentItem.__tablename__, evict)
+    return cache
+
+
+class ContentService:
+    """Service layer for a coach's folders and content items.
+
+    Tag facet counts are cached per coach and dropped on every worker
+    once a write to one of the coach's items commits, so repeated filter
+    clicks are answered from memory.
+    """
+
+    def __init__(
+        self,
+        repository: ContentRepository,
+        facet_cache: GroupedCache | None = None,
+    ) -> None:
+        self._repository = repository
+        self._facet_cache = facet_cache or get_facet_cache()
+
+    async def get_folders(
+        self,
+        coach_id: UUID,
+        root_id: UUID | None = None,
+    ) -> list[ContentFolderResponse] | None:
+        """Get folders with direct and subtree item counts.
+
+        Direct counts come from one grouped query; subtree totals are rolled
+        up from them in memory, children before parents.
+
+        Args:
+            coach_id: Owner of the library.
+            root_id: Only return this folder and its descendants.
+
+        Returns:
+            Folders ordered by path, or None if ``root_id`` is not found.
+        """
+        root = None
+        if root_id is not None:
+            root = await self._repository.get_folder(root_id, coach_id)
+            if root is None:
+                return None
+
+        rows = await self._repository.get_folder_counts(coach_id, root=root)
+        totals = {folder.path: count for folder, count in rows}
+        for folder, _ in reversed(rows):
+            parent = _parent_path(folder.path)
+            if parent in totals:
+                totals[parent] += totals[folder.path]
+
+        return [
+            ContentFolderResponse.model_validate(folder).model_copy(
+                update={"item_count": count, "total_item_count": totals[folder.path]}
+            )
+            for folder, count in rows
+        ]
+
+    async def create_folder(
+        self, coach_id: UUID, data: ContentFolderCreate
+    ) -> ContentFolder:
+        """Create a folder.
+
+        Raises:
+            ContentFolderError: If the parent folder does not exist or is
+                nested too deep to hold another level.
+        """
+        parent = await self._get_parent(coach_id, data.parent_id)
+        folder_id = uuid4()
+        path = folder_path(parent.path if parent else ROOT_PATH, folder_id)
+        _check_path_length(len(path))
+        folder = ContentFolder(
+            id=folder_id,
+            coach_id=coach_id,
+            parent_id=data.parent_id,
+            name=data.name,
+            color=data.color,
+            path=path,
+        )
+        return await self._repository.create_folder(folder)
+
+    async def update_folder(
+        self,
+        folder_id: UUID,
+        coach_id: UUID,
+        data: ContentFolderUpdate,
+    ) -> ContentFolderResponse | None:
+        """Rename a folder, or move it with its whole subtree.
+
+        Raises:
+            ContentFolderError: If the new parent does not exist, is the
+                folder itself or one of its descendants, or would nest the
+                subtree too deep.
+        """
+        folder = await self._repository.get_folder(folder_id, coach_id)
+        if folder is None:
+            return None
+
+        values = data.model_dump(exclude_unset=True, exclude={"parent_id"})
+        values = {field: value for field, value in values.items() if value is not None}
+        if values:
+            folder = await self._repository.update_folder(folder, values)
+
+        if "parent_id" in data.model_fields_set and data.parent_id != folder.parent_id:
+            parent = await self._get_parent(coach_id, data.parent_id)
+            if parent is not None and parent.path.startswith(folder.path):
+                raise ContentFolderError("A folder cannot be moved into itself")
+            # The subtree's deepest path grows or shrinks by the same amount
+            new_path = folder_path(parent.path if parent else ROOT_PATH, folder.id)
+            deepest = await self._repository.get_subtree_path_length(folder)
+            _check_path_length(deepest - len(folder.path) + len(new_path))
+            await self._repository.move_folder(folder, parent)
+
+        folders = await self.get_folders(coach_id, folder.id)
+        return folders[0]
+
+    async def delete_folder(self, folder_id: UUID, coach_id: UUID) -> bool:
+        """Delete a folder and its subfolders. Their items move to the root."""
+        folder = await self._repository.get_folder(folder_id, coach_id)
+        if folder is None:
+            return False
+        await self._repository.delete_folder(folder)
+        return True
+
+    async def get_item(self, item_id: UUID, coach_id: UUID) -> ContentItem | None:
+        """Get a content item."""
+        return await self._repository.get_item(item_id, coach_id)
+
+    async def get_items(
+        self,
+        coach_id: UUID,
+        folder_id: UUID | None = None,
+        recursive: bool = False,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> list[ContentItem] | None:
+        """Get content items, optionally only those in a folder or its subtree.
+
+        Returns:
+            The items, or None if ``folder_id`` is not found.
+        """
+        folder = None
+        if folder_id is not None:
+            folder = await self._repository.get_folder(folder_id, coach_id)
+            if folder is None:
+                return None
+        return await self._repository.list_items(
+            coach_id, folder=folder, recursive=recursive, skip=skip, limit=limit
+        )
+
+    async def search_items(
+        self,
+        coach_id: UUID,
+        tags: list[str],
+        match: ContentTagMatch = ContentTagMatch.ALL,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> ContentSearchResponse:
+        """Filter content by tags and count the tags of everything matched.
+
+        Args:
+            coach_id: Owner of the library.
+            tags: Tags to filter by; empty matches every item.
+            match: Whether items need all of the tags or any of them.
+        """
+        tags = normalize_tags(tags)
+        match_all = match == ContentTagMatch.ALL
+        key = (match_all, tuple(sorted(tags)))
+        facets = self._facet_cache.get(coach_id, key)
+        if facets is None:
+            facets = await self._repository.get_tag_facets(coach_id, tags, match_all)
+            self._facet_cache.set(coach_id, key, facets)
+
+        total, counts = facets
+        items = []
+        if total > skip:
+            items = await self._repository.search_items(
+                coach_id, tags, match_all=match_all, skip=skip, limit=limit
+            )
+        return ContentSearchResponse(
+            items=[ContentItemResponse.model_validate(item) for item in items],
+            total=total,
+            facets=[ContentTagFacet(tag=tag, count=count) for tag, count in counts],
+        )
+
+    async def create_item(self, coach_id: UUID, data: ContentItemCreate) -> ContentItem:
+        """Create a content item.
+
+        Raises:
+            ContentFolderError: If the folder does not exist.
+        """
+        await self._get_parent(coach_id, data.folder_id)
+        item = ContentItem(coach_id=coach_id, **data.model_dump(mode="json"))
+        item.folder_id = data.folder_id
+        return await self._repository.create_item(item)
+
+    async def update_item(
+        self,
+        item_id: UUID,
+        coach_id: UUID,
+        data: ContentItemUpdate,
+    ) -> ContentItem | None:
+        """Update a content item.
+
+        Raises:
+            ContentFolderError: If the new folder does not exist.
+        """
+        item = await self._repository.get_item(item_id, coach_id)
+        if item is None:
+            return None
+        values = data.model_dump(mode="json", exclude_unset=True)
+        for field in _REQUIRED_ITEM_FIELDS:
+            if values.get(field, ...) is None:
+                del values[field]
+        if "folder_id" in values:
+            await self._get_parent(coach_id, data.folder_id)
+            values["folder_id"] = data.folder_id
+        return await self._repository.update_item(item, values)
+
+    async def delete_item(self, item_id: UUID, coach_id: UUID) -> bool:
+        """Delete a content item."""
+        item = await self._repository.get_item(item_id, coach_id)
+        if item is None:
+            return False
+        await self._repository.delete_item(item)
+        return True
+
+    async def _get_parent(
+        self, coach_id: UUID, folder_id: UUID | None
+    ) -> ContentFolder | None:
+        if folder_id is None:
+            return None
+        folder = await self._repository.get_folder(folder_id, coach_id)
+        if folder is None:
+            raise ContentFolderError(f"Folder with id '{folder_id}' not found")
+        return folder
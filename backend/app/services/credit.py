@@ -0,0 +1,97 @@
+"""Service layer for bundle credits."""
+
+from uuid import UUID
+
+from app.core.config import get_settings
+from app.db.models.credit import CreditAccount, CreditEntryKind, CreditLedgerEntry
+from app.db.repositories.credit import CreditRepository
+
+
+class InsufficientCreditsError(Exception):
+    """Raised when an account does not hold enough credits to redeem."""
+
+    def __init__(self, requested: int) -> None:
+        super().__init__(f"Insufficient credits to redeem {requested}")
+        self.requested = requested
+
+
+class CreditService:
+    """Service layer for bundle credit business logic.
+
+    Purchases grant credits, bookings redeem them. The account balance is
+    the fast path for reads and redemptions; the ledger plus snapshots is
+    the audit trail used by ``verify_balance``.
+    """
+
+    def __init__(self, repository: CreditRepository) -> None:
+        self._repository = repository
+
+    async def get_balances(self, student_id: UUID) -> list[CreditAccount]:
+        """Get all credit balances for a student."""
+        return await self._repository.get_accounts_for_student(student_id)
+
+    async def grant(
+        self,
+        student_id: UUID,
+        coach_id: UUID,
+        service_id: str,
+        credits: int,
+        reference: str | None = None,
+    ) -> CreditLedgerEntry:
+        """Grant credits for a purchased bundle."""
+        if credits <= 0:
+            raise ValueError("credits must be positive")
+        return await self._repository.credit(
+            student_id, coach_id, service_id, credits, reference=reference
+        )
+
+    async def refund(
+        self,
+        student_id: UUID,
+        coach_id: UUID,
+        service_id: str,
+        credits: int,
+        reference: str | None = None,
+    ) -> CreditLedgerEntry:
+        """Return previously redeemed credits, e.g. for a cancelled booking."""
+        if credits <= 0:
+            raise ValueError("credits must be positive")
+        return await self._repository.credit(
+            student_id,
+            coach_id,
+            service_id,
+            credits,
+            kind=CreditEntryKind.REFUND,
+            reference=reference,
+        )
+
+    async def redeem(
+        self,
+        student_id: UUID,
+        coach_id: UUID,
+        service_id: str,
+        credits: int = 1,
+        reference: str | None = None,
+    ) -> CreditLedgerEntry:
+        """Redeem credits from a student's bundle.
+
+        Raises:
+            InsufficientCreditsError: If the balance does not cover the amount.
+        """
+        entry = await self._repository.debit(
+            student_id, coach_id, service_id, credits, reference=reference
+        )
+        if entry is None:
+            raise InsufficientCreditsError(credits)
+        return entry
+
+    async def verify_balance(self, account: CreditAccount) -> bool:
+        """Check the account balance against the snapshot-plus-ledger total."""
+        return await self._repository.get_ledger_balance(account.id) == account.balance
+
+    async def snapshot_balances(self) -> int:
+        """Write balance snapshots for accounts with a long ledger tail."""
+        settings = get_settings()
+        return await self._repository.create_snapshots(
+            min_tail=settings.credit_snapshot_min_tail
+        )
@@ -0,0 +1,186 @@
+"""Real-time change events over Postgres LISTEN/NOTIFY.
+
+Writers call ``EventPublisher.publish`` inside their request transaction;
+it issues ``pg_notify`` so the event is only delivered if, and when, the
+transaction commits. Every worker process runs one ``EventBroker`` with a
+single dedicated LISTEN connection and fans each notification out to its
+local subscribers, typically the ``GET /events`` server-sent event streams.
+
+Each subscriber has a bounded queue. A client that falls behind does not
+slow the broker down or grow memory without bound: its queue is emptied and
+replaced by one ``resync`` event, telling it to refetch what it shows.
+"""
+
+import asyncio
+import json
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any
+
+import asyncpg
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.db.session import asyncpg_connect_args
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "velo_events"
+
+# Topics any authenticated user may subscribe to
+PUBLIC_TOPICS = frozenset({"items"})
+
+RESYNC = "resync"
+
+
+def user_topic(auth_subject: str) -> str:
+    """Private topic for changes to one user's own profile."""
+    return f"user:{auth_subject}"
+
+
+@dataclass
+class Event:
+    """A change notification delivered to subscribers."""
+
+    topic: str
+    type: str
+    data: dict[str, Any] = field(default_factory=dict)
+
+
+class EventPublisher:
+    """Publishes events as part of the caller's database transaction."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def publish(self, topic: str, type: str, data: dict[str, Any]) -> None:
+        """Queue an event for delivery when the transaction commits.
+
+        Payloads must stay small (Postgres caps NOTIFY at 8000 bytes), so
+        send IDs and let clients refetch rather than whole records.
+        """
+        payload = json.dumps({"topic": topic, "type": type, "data": data})
+        await self._session.execute(select(func.pg_notify(CHANNEL, payload)))
+
+
+class Subscription:
+    """A subscriber's bounded queue of events."""
+
+    def __init__(self, topics: frozenset[str], maxsize: int) -> None:
+        self.topics = topics
+        self._queue: asyncio.Queue[Event] = asyncio.Queue(maxsize=maxsize)
+        self.dropped = 0
+
+    def put(self, event: Event) -> None:
+        """Enqueue an event without blocking the broker.
+
+        If the subscriber is too slow and its queue is full, the backlog is
+        discarded and replaced with a single resync event.
+        """
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.dropped += self._queue.qsize() + 1
+            while not self._queue.empty():
+                self._queue.get_nowait()
+            self._queue.put_nowait(Event(topic="*", type=RESYNC))
+
+    async def get(self) -> Event:
+        """Wait for the next event."""
+        return await self._queue.get()
+
+
+class EventBroker:
+    """Per-process fan-out of Postgres notifications to local subscribers."""
+
+    def __init__(self, connect_args: dict[str, Any], queue_size: int) -> None:
+        self._connect_args = connect_args
+        self._queue_size = queue_size
+        self._subscriptions: dict[str, set[Subscription]] = {}
+        self._connection: asyncpg.Connection | None = None
+        self._lock = asyncio.Lock()
+        self._closed = False
+        self._reconnect_task: asyncio.Task | None = None
+
+    @property
+    def subscriptions(self) -> set[Subscription]:
+        """All open subscriptions."""
+        return set().union(*self._subscriptions.values())
+
+    @asynccontextmanager
+    async def subscribe(self, topics: set[str]) -> AsyncIterator[Subscription]:
+        """Subscribe to topics for the duration of the context."""
+        await self._ensure_listening()
+        subscription = Subscription(frozenset(topics), self._queue_size)
+        for topic in subscription.topics:
+            self._subscriptions.setdefault(topic, set()).add(subscription)
+        try:
+            yield subscription
+        finally:
+            for topic in subscription.topics:
+                subscribers = self._subscriptions.get(topic)
+                if subscribers is not None:
+                    subscribers.discard(subscription)
+                    if not subscribers:
+                        del self._subscriptions[topic]
+
+    async def close(self) -> None:
+        """Stop listening. Called on application shutdown."""
+        self._closed = True
+        if self._connection is not None and not self._connection.is_closed():
+            await self._connection.close()
+        self._connection = None
+
+    async def _ensure_listening(self) -> None:
+        if self._connection is not None and not self._connection.is_closed():
+            return
+        async with self._lock:
+            if self._connection is not None and not self._connection.is_closed():
+                return
+            self._closed = False
+            connection = await asyncpg.connect(**self._connect_args)
+            await connection.add_listener(CHANNEL, self._on_notify)
+            connection.add_termination_listener(self._on_terminated)
+            self._connection = connection
+            logger.info("Listening for events on %r", CHANNEL)
+
+    def _on_notify(self, _conn: Any, _pid: int, _channel: str, payload: str) -> None:
+        try:
+            event = Event(**json.loads(payload))
+        except (TypeError, ValueError):
+            logger.warning("Ignoring malformed event payload: %r", payload)
+            return
+        for subscription in self._subscriptions.get(event.topic, ()):
+            subscription.put(event)
+
+    def _on_terminated(self, _conn: Any) -> None:
+        if self._closed:
+            return
+        # Notifications sent while reconnecting are lost, so every
+        # subscriber is told to resync once the listener is back.
+        logger.warning("Event listener connection lost; reconnecting")
+        self._connection = None
+        self._reconnect_task = asyncio.get_running_loop().create_task(self._reconnect())
+
+    async def _reconnect(self) -> None:
+        delay = 0.5
+        while not self._closed and self._subscriptions:
+            try:
+                await self._ensure_listening()
+            except (OSError, asyncpg.PostgresError):
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 30.0)
+                continue
+            for subscription in self.subscriptions:
+                subscription.put(Event(topic="*", type=RESYNC))
+            return
+
+
+@lru_cache
+def get_event_broker() -> EventBroker:
+    """Get this process's event broker."""
+    return EventBroker(asyncpg_connect_args(), get_settings().events_queue_size)
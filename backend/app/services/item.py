@@ -1,51 +1,190 @@
+from collections.abc import AsyncIterator, Callable
+from contextlib import AbstractAsyncContextManager
+from functools import lru_cache
+from tempfile import SpooledTemporaryFile
 from uuid import UUID
 
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import get_settings
+from app.core.singleflight import SingleFlight, coalesced
 from app.db.models.item import Item
 from app.db.repositories.item import ItemRepository
-from app.schemas.item import ItemCreate, ItemUpdate
+from app.db.session import admitted_session_scope, get_session_factory
+from app.schemas.item import ItemCreate, ItemImportResult, ItemResponse, ItemUpdate
+from app.services.events import EventPublisher
+from app.services.item_import import SPOOL_MEMORY_BYTES, read_upload, spooled_rows
+
+
+class ItemNameTakenError(Exception):
+    """Raised when an item would take a name another item already has."""
+
+    def __init__(self, name: str) -> None:
+        super().__init__(f"An item named {name!r} already exists")
+        self.name = name
+
+
+@lru_cache
+def get_item_flights() -> SingleFlight:
+    """Get the process-wide group that coalesces concurrent item reads."""
+    return SingleFlight(timeout=get_settings().coalesce_timeout_seconds)
 
 
 class ItemService:
     """Service layer for Item business logic.
 
     This layer sits between the API routes and the repository,
-    handling business logic and validation.
+    handling business logic and validation. Identical reads running at
+    the same time share one query. A shared read outlives the request that
+    started it and its result goes to other requests, so it runs on its own
+    session and returns plain response models rather than ORM objects.
     """
 
-    def __init__(self, repository: ItemRepository) -> None:
+    def __init__(
+        self,
+        repository: ItemRepository,
+        events: EventPublisher | None = None,
+        flights: SingleFlight | None = None,
+        session_factory: async_sessionmaker[AsyncSession] | None = None,
+    ) -> None:
         self._repository = repository
+        self._events = events
+        self._flights = flights or get_item_flights()
+        self._session_factory = session_factory or get_session_factory()
+
+    async def _publish(self, type: str, item_id: UUID) -> None:
+        self._flights.forget()
+        if self._events is not None:
+            await self._events.publish("items", type, {"id": str(item_id)})
 
-    async def get_item(self, item_id: UUID) -> Item | None:
+    @coalesced
+    async def get_item(self, item_id: UUID) -> ItemResponse | None:
         """Get a single item by ID."""
-        return await self._repository.get_by_id(item_id)
+        async with self._session_factory() as session:
+            item = await ItemRepository(session).get_by_id(item_id)
+        return None if item is None else ItemResponse.model_validate(item)
 
+    @coalesced
     async def get_items(
         self,
         skip: int = 0,
         limit: int = 100,
         active_only: bool = False,
-    ) -> list[Item]:
+    ) -> list[ItemResponse]:
         """Get all items with optional filtering."""
-        if active_only:
-            return await self._repository.get_active(skip=skip, limit=limit)
-        return await self._repository.get_all(skip=skip, limit=limit)
+        async with self._session_factory() as session:
+            repository = ItemRepository(session)
+            if active_only:
+                items = await repository.get_active(skip=skip, limit=limit)
+            else:
+                items = await repository.get_all(skip=skip, limit=limit)
+        return [ItemResponse.model_validate(item) for item in items]
 
     async def create_item(self, data: ItemCreate) -> Item:
-        """Create a new item."""
-        return await self._repository.create(data)
+        """Create a new item.
+
+        Raises:
+            ItemNameTakenError: If another item already has the name.
+        """
+        try:
+            item = await self._repository.create(data)
+        except IntegrityError as exc:
+            raise ItemNameTakenError(data.name) from exc
+        await self._publish("item.created", item.id)
+        return item
 
     async def update_item(
         self,
         item_id: UUID,
         data: ItemUpdate,
     ) -> Item | None:
-        """Update an existing item."""
-        return await self._repository.update(item_id, data)
+        """Update an existing item.
+
+        Raises:
+            ItemNameTakenError: If another item already has the new name.
+        """
+        try:
+            item = await self._repository.update(item_id, data)
+        except IntegrityError as exc:
+            raise ItemNameTakenError(str(data.name)) from exc
+        if item is not None:
+            await self._publish("item.updated", item.id)
+        return item
 
     async def delete_item(self, item_id: UUID) -> bool:
         """Delete an item by ID."""
-        return await self._repository.delete(item_id)
+        deleted = await self._repository.delete(item_id)
+        if deleted:
+            await self._publish("item.deleted", item_id)
+        return deleted
 
     async def get_item_by_name(self, name: str) -> Item | None:
         """Get an item by its name."""
         return await self._repository.get_by_name(name)
+
+
+class ItemImportService:
+    """Bulk item imports from CSV and NDJSON uploads.
+
+    The upload is validated and spooled before the database is touched, and
+    the merge then runs in a short session of its own, so a slow client
+    holds neither a pooled connection nor a session limiter slot while its
+    body arrives.
+    """
+
+    def __init__(
+        self,
+        flights: SingleFlight | None = None,
+        sessions: Callable[
+            [], AbstractAsyncContextManager[AsyncSession]
+        ] = admitted_session_scope,
+    ) -> None:
+        self._flights = flights or get_item_flights()
+        self._sessions = sessions
+
+    async def import_items(
+        self,
+        chunks: AsyncIterator[bytes],
+        media_type: str,
+    ) -> ItemImportResult:
+        """Create or update items in bulk from a CSV or NDJSON upload.
+
+        Invalid rows are reported and skipped; valid rows are merged by name
+        even when others fail.
+
+        Raises:
+            UnsupportedImportTypeError: If ``media_type`` is not CSV or NDJSON.
+            ImportFormatError: If the upload cannot be read.
+            ImportTooLargeError: If the upload is over the size limit.
+            ServerBusyError: If no database session frees up for the merge.
+        """
+        settings = get_settings()
+        with SpooledTemporaryFile(max_size=SPOOL_MEMORY_BYTES) as spool:
+            report = await read_upload(
+                chunks,
+                media_type,
+                spool,
+                max_bytes=settings.item_import_max_bytes,
+                chunk_rows=settings.item_import_chunk_rows,
+                max_errors=settings.item_import_max_errors,
+            )
+            async with self._sessions() as session:
+                created, updated = await ItemRepository(session).import_rows(
+                    spooled_rows(spool)
+                )
+                if created or updated:
+                    await EventPublisher(session).publish(
+                        "items",
+                        "item.imported",
+                        {"created": created, "updated": updated},
+                    )
+        if created or updated:
+            self._flights.forget()
+        return ItemImportResult(
+            rows=report.rows,
+            created=created,
+            updated=updated,
+            failed=report.failed,
+            errors=report.errors,
+        )
@@ -0,0 +1,223 @@
+"""Reading and validating bulk item uploads.
+
+Uploads are CSV with a header row or NDJSON, one JSON object per line. The
+body is read chunk by chunk and complete rows are validated against
+``ItemCreate`` in batches as they arrive. Valid rows are spooled to a
+temporary file that moves to disk once it grows past ``SPOOL_MEMORY_BYTES``,
+so memory stays bounded however large the upload is. The database is only
+touched once the whole body has arrived, in a session ``ItemImportService``
+opens for the merge, so a slow client holds no pooled connection or session
+limiter slot while it uploads.
+"""
+
+import asyncio
+import codecs
+import csv
+import json
+import pickle
+from collections.abc import AsyncIterator, Iterable, Iterator
+from dataclasses import dataclass, field
+from typing import IO, Any
+
+from pydantic import ValidationError
+
+from app.db.repositories.item import ItemRow
+from app.schemas.item import ItemCreate, ItemImportRowError
+
+CSV_TYPES = frozenset({"text/csv"})
+NDJSON_TYPES = frozenset(
+    {"application/x-ndjson", "application/ndjson", "application/jsonl"}
+)
+
+# Valid rows kept in memory before the spool file moves to disk
+SPOOL_MEMORY_BYTES = 8 * 1024 * 1024
+
+
+class UnsupportedImportTypeError(Exception):
+    """Raised when an upload is neither CSV nor NDJSON."""
+
+    def __init__(self, media_type: str) -> None:
+        super().__init__(f"Cannot import {media_type or 'an untyped body'}")
+
+
+class ImportFormatError(Exception):
+    """Raised when an upload cannot be read as its declared format."""
+
+
+class ImportTooLargeError(Exception):
+    """Raised when an upload exceeds the import size limit."""
+
+
+@dataclass
+class ImportReport:
+    """Rows read from an upload and the ones that failed validation."""
+
+    rows: int = 0
+    failed: int = 0
+    # The first ``max_errors`` rejected rows
+    errors: list[ItemImportRowError] = field(default_factory=list)
+
+
+async def read_upload(
+    chunks: AsyncIterator[bytes],
+    media_type: str,
+    spool: IO[bytes],
+    max_bytes: int,
+    chunk_rows: int,
+    max_errors: int,
+) -> ImportReport:
+    """Validate an upload and write its valid rows to ``spool``.
+
+    Raises:
+        UnsupportedImportTypeError: If ``media_type`` is not CSV or NDJSON.
+        ImportFormatError: If the body is not UTF-8 or a CSV header has no
+            ``name`` column.
+        ImportTooLargeError: If the body is longer than ``max_bytes``.
+    """
+    media_type = media_type.split(";")[0].strip().lower()
+    records: _CsvRecords | _NdjsonRecords
+    if media_type in CSV_TYPES:
+        records = _CsvRecords()
+    elif media_type in NDJSON_TYPES:
+        records = _NdjsonRecords()
+    else:
+        raise UnsupportedImportTypeError(media_type)
+
+    report = ImportReport()
+    batch: list[Any] = []
+    async for lines in _lines(chunks, max_bytes):
+        batch.extend(records.feed(lines))
+        if len(batch) >= chunk_rows:
+            _validate(batch, spool, report, max_errors)
+            batch = []
+            # Let other requests run between batches
+            await asyncio.sleep(0)
+    batch.extend(records.close())
+    _validate(batch, spool, report, max_errors)
+    return report
+
+
+def spooled_rows(spool: IO[bytes]) -> Iterator[ItemRow]:
+    """Read back the rows ``read_upload`` spooled, in upload order."""
+    spool.seek(0)
+    # The spool holds one pickled list of rows per validated batch
+    while True:
+        try:
+            yield from pickle.load(spool)
+        except EOFError:
+            return
+
+
+async def _lines(
+    chunks: AsyncIterator[bytes], max_bytes: int
+) -> AsyncIterator[list[str]]:
+    # utf-8-sig drops the byte order mark spreadsheet exports start with
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    size = 0
+    pending = ""
+    try:
+        async for chunk in chunks:
+            size += len(chunk)
+            if size > max_bytes:
+                raise ImportTooLargeError(f"Upload exceeds {max_bytes} bytes")
+            lines = (pending + decoder.decode(chunk)).split("\n")
+            pending = lines.pop()
+            if lines:
+                yield lines
+        pending += decoder.decode(b"", final=True)
+    except UnicodeDecodeError as exc:
+        raise ImportFormatError("Upload is not valid UTF-8") from exc
+    if pending:
+        yield [pending]
+
+
+class _CsvRecords:
+    """Turns lines into one dict per CSV record, keyed by the header."""
+
+    def __init__(self) -> None:
+        self._header: list[str] | None = None
+        self._parts: list[str] = []
+        self._quotes = 0
+
+    def feed(self, lines: Iterable[str]) -> Iterator[Any]:
+        for line in lines:
+            self._parts.append(line)
+            # A quoted field may span lines; the record ends once quotes balance
+            self._quotes += line.count('"')
+            if self._quotes % 2 == 0:
+                yield from self._record()
+
+    def close(self) -> Iterator[Any]:
+        """Flush a last record left open by an unbalanced quote."""
+        if self._parts:
+            yield from self._record()
+
+    def _record(self) -> Iterator[Any]:
+        text = "\n".join(self._parts)
+        self._parts.clear()
+        self._quotes = 0
+        if not text.strip():
+            return
+        fields = next(csv.reader([text]))
+        if self._header is None:
+            self._header = [name.strip() for name in fields]
+            if "name" not in self._header:
+                raise ImportFormatError("CSV header has no name column")
+            return
+        # Empty cells fall back to the ItemCreate defaults
+        yield {
+            column: value
+            for column, value in zip(self._header, fields, strict=False)
+            if value != ""
+        }
+
+
+class _NdjsonRecords:
+    """Turns lines into one decoded JSON value per non-blank line."""
+
+    def feed(self, lines: Iterable[str]) -> Iterator[Any]:
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError as exc:
+                yield _Invalid(f"Invalid JSON: {exc}")
+
+    def close(self) -> Iterator[Any]:
+        """Lines are complete records, so nothing is ever left over."""
+        return iter(())
+
+
+@dataclass
+class _Invalid:
+    """A record that could not be decoded."""
+
+    error: str
+
+
+def _validate(
+    records: list[Any], spool: IO[bytes], report: ImportReport, max_errors: int
+) -> None:
+    valid: list[ItemRow] = []
+    for record in records:
+        report.rows += 1
+        if isinstance(record, _Invalid):
+            errors = [record.error]
+        else:
+            try:
+                item = ItemCreate.model_validate(record)
+            except ValidationError as exc:
+                errors = [
+                    f"{'.'.join(str(part) for part in error['loc']) or 'row'}: "
+                    f"{error['msg']}"
+                    for error in exc.errors()
+                ]
+            else:
+                valid.append((report.rows, item.name, item.description, item.is_active))
+                continue
+        report.failed += 1
+        if len(report.errors) < max_errors:
+            report.errors.append(ItemImportRowError(row=report.rows, errors=errors))
+    if valid:
+        pickle.dump(valid, spool, protocol=pickle.HIGHEST_PROTOCOL)
@@ -0,0 +1,287 @@
+"""Postgres-backed background job queue.
+
+Jobs are rows in the ``jobs`` table. Request handlers enqueue them through
+``JobQueue`` inside their own transaction, and ``JobWorker`` claims them in
+batches with ``SELECT ... FOR UPDATE SKIP LOCKED``. A worker can run inside
+the API process (see ``job_worker_in_process``) or standalone via
+``python -m app.worker``; both use the same code.
+
+Handlers are registered with the ``job_handler`` decorator and receive a
+fresh session plus the job payload. The job row is deleted in that same
+session, so a handler's writes and the job's completion commit atomically.
+Failed jobs are retried with exponential backoff until ``max_attempts``.
+
+Handlers registered with ``every`` also run on a schedule. Every worker
+enqueues them at startup, and each run, successful or not, enqueues the
+next one ``every()`` later. Scheduled jobs share a dedupe key, so however
+many workers start, one run at a time is pending.
+"""
+
+import asyncio
+import contextlib
+import logging
+import random
+import socket
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import get_settings
+from app.db.models.job import Job, JobStatus
+from app.db.repositories.job import JobRepository
+from app.db.session import get_session_factory
+
+logger = logging.getLogger(__name__)
+
+JobHandler = Callable[[AsyncSession, dict], Awaitable[None]]
+
+_handlers: dict[str, JobHandler] = {}
+# Interval of each scheduled job, called whenever its next run is enqueued
+_schedules: dict[str, Callable[[], timedelta]] = {}
+
+_SCHEDULED = "scheduled"
+
+
+def job_handler(
+    name: str,
+    every: Callable[[], timedelta] | None = None,
+) -> Callable[[JobHandler], JobHandler]:
+    """Register a coroutine function as the handler for jobs named ``name``.
+
+    Args:
+        name: Job name the handler runs.
+        every: Interval between scheduled runs, read from settings when each
+            run is enqueued. Without it, the job only runs when enqueued.
+    """
+
+    def decorator(func: JobHandler) -> JobHandler:
+        if name in _handlers:
+            raise ValueError(f"Job handler {name!r} is already registered")
+        _handlers[name] = func
+        if every is not None:
+            _schedules[name] = every
+        return func
+
+    return decorator
+
+
+class JobQueue:
+    """Enqueues jobs as part of the caller's database transaction."""
+
+    def __init__(self, repository: JobRepository) -> None:
+        self._repository = repository
+
+    async def enqueue(
+        self,
+        name: str,
+        payload: dict | None = None,
+        priority: int = 0,
+        delay: timedelta | None = None,
+        max_attempts: int | None = None,
+        dedupe_key: str | None = None,
+    ) -> Job | None:
+        """Enqueue a job.
+
+        Args:
+            name: Registered handler name, e.g. "users.sync_profile".
+            payload: JSON-serializable arguments for the handler.
+            priority: Lower values are claimed first.
+            delay: Optional delay before the job becomes runnable.
+            max_attempts: Attempts before the job is marked failed.
+            dedupe_key: Skip the enqueue while a job with the same name and
+                key is queued or running.
+
+        Returns:
+            The new job, or None when it was deduplicated.
+        """
+        settings = get_settings()
+        run_at = datetime.now(UTC) + delay if delay is not None else None
+        return await self._repository.enqueue(
+            name,
+            payload or {},
+            priority=priority,
+            max_attempts=max_attempts or settings.job_max_attempts,
+            run_at=run_at,
+            dedupe_key=dedupe_key,
+        )
+
+
+@dataclass
+class JobMetrics:
+    """Throughput counters for a single worker."""
+
+    claimed: int = 0
+    succeeded: int = 0
+    retried: int = 0
+    failed: int = 0
+    batches: int = 0
+    busy_seconds: float = 0.0
+    started_at: float = field(default_factory=time.monotonic)
+
+    def snapshot(self) -> dict[str, float]:
+        """Get the current counters plus derived throughput figures."""
+        uptime = max(time.monotonic() - self.started_at, 1e-9)
+        return {
+            "claimed": self.claimed,
+            "succeeded": self.succeeded,
+            "retried": self.retried,
+            "failed": self.failed,
+            "batches": self.batches,
+            "uptime_seconds": round(uptime, 3),
+            "jobs_per_second": round(self.succeeded / uptime, 3),
+            "utilization": round(min(self.busy_seconds / uptime, 1.0), 3),
+        }
+
+
+class JobWorker:
+    """Claims and runs queued jobs until stopped."""
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession] | None = None,
+        batch_size: int | None = None,
+        poll_interval: float | None = None,
+        worker_id: str | None = None,
+    ) -> None:
+        settings = get_settings()
+        self._session_factory = session_factory or get_session_factory()
+        self._batch_size = batch_size or settings.job_batch_size
+        self._poll_interval = poll_interval or settings.job_poll_interval_seconds
+        self._lock_timeout = timedelta(seconds=settings.job_lock_timeout_seconds)
+        self._backoff_base = settings.job_retry_backoff_seconds
+        self._backoff_max = settings.job_retry_backoff_max_seconds
+        self._metrics_interval = settings.job_metrics_interval_seconds
+        self.worker_id = worker_id or f"{socket.gethostname()}-{uuid4().hex[:8]}"
+        self.metrics = JobMetrics()
+        self._stopping = asyncio.Event()
+
+    def stop(self) -> None:
+        """Ask the worker to exit after its current batch."""
+        self._stopping.set()
+
+    async def run(self) -> None:
+        """Process jobs until ``stop`` is called."""
+        logger.info("Job worker %s started", self.worker_id)
+        try:
+            await self._schedule_all()
+        except Exception:
+            logger.exception("Job worker %s failed to schedule jobs", self.worker_id)
+        next_stale_check = 0.0
+        next_metrics_log = time.monotonic() + self._metrics_interval
+
+        while not self._stopping.is_set():
+            now = time.monotonic()
+            try:
+                if now >= next_stale_check:
+                    await self._requeue_stale()
+                    next_stale_check = now + self._lock_timeout.total_seconds() / 2
+                processed = await self.run_once()
+            except Exception:
+                logger.exception("Job worker %s failed to poll", self.worker_id)
+                processed = 0
+
+            if now >= next_metrics_log:
+                logger.info("Job worker metrics: %s", self.metrics.snapshot())
+                next_metrics_log = now + self._metrics_interval
+
+            # A full batch means there is probably more work waiting
+            if processed < self._batch_size:
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(
+                        self._stopping.wait(), timeout=self._poll_interval
+                    )
+
+        logger.info(
+            "Job worker %s stopped: %s", self.worker_id, self.metrics.snapshot()
+        )
+
+    async def run_once(self) -> int:
+        """Claim and process a single batch.
+
+        Returns:
+            Number of jobs claimed.
+        """
+        async with self._session_factory() as session:
+            jobs = await JobRepository(session).claim_batch(
+                self.worker_id, self._batch_size
+            )
+            await session.commit()
+
+        if not jobs:
+            return 0
+
+        self.metrics.claimed += len(jobs)
+        self.metrics.batches += 1
+        started = time.perf_counter()
+        await asyncio.gather(*(self._process(job) for job in jobs))
+        self.metrics.busy_seconds += time.perf_counter() - started
+        return len(jobs)
+
+    async def _process(self, job: Job) -> None:
+        handler = _handlers.get(job.name)
+        try:
+            if handler is None:
+                raise LookupError(f"No handler registered for job {job.name!r}")
+            async with self._session_factory() as session:
+                await handler(session, job.payload)
+                await JobRepository(session).complete(job.id)
+                await self._schedule_next(session, job.name)
+                await session.commit()
+        except Exception as exc:
+            error = f"{type(exc).__name__}: {exc}"
+            logger.warning("Job %s (%s) failed: %s", job.id, job.name, error)
+            async with self._session_factory() as session:
+                repository = JobRepository(session)
+                if job.attempts >= job.max_attempts:
+                    await repository.fail(job.id, error)
+                    await self._schedule_next(session, job.name)
+                    self.metrics.failed += 1
+                else:
+                    await repository.retry(job.id, error, self._backoff(job.attempts))
+                    self.metrics.retried += 1
+                await session.commit()
+        else:
+            self.metrics.succeeded += 1
+
+    async def _schedule_all(self) -> None:
+        """Enqueue every scheduled job that has no run pending."""
+        async with self._session_factory() as session:
+            queue = JobQueue(JobRepository(session))
+            for name in _schedules:
+                await queue.enqueue(name, dedupe_key=_SCHEDULED)
+            await session.commit()
+
+    async def _schedule_next(self, session: AsyncSession, name: str) -> None:
+        every = _schedules.get(name)
+        if every is not None:
+            await JobQueue(JobRepository(session)).enqueue(
+                name, delay=every(), dedupe_key=_SCHEDULED
+            )
+
+    def _backoff(self, attempts: int) -> timedelta:
+        """Exponential backoff with jitter so retries do not arrive in lockstep."""
+        delay = min(self._backoff_base * 2 ** (attempts - 1), self._backoff_max)
+        return timedelta(seconds=delay * random.uniform(0.5, 1.0))
+
+    async def _requeue_stale(self) -> None:
+        async with self._session_factory() as session:
+            stale = await JobRepository(session).requeue_stale(self._lock_timeout)
+            failed = [job for job in stale if job.status == JobStatus.FAILED.value]
+            for job in failed:
+                await self._schedule_next(session, job.name)
+            await session.commit()
+        self.metrics.failed += len(failed)
+        if len(stale) > len(failed):
+            logger.warning("Requeued %d stale jobs", len(stale) - len(failed))
+        for job in failed:
+            logger.error(
+                "Job %s (%s) failed: its worker stopped responding on the last "
+                "of %d attempts",
+                job.id,
+                job.name,
+                job.max_attempts,
+            )
@@ -0,0 +1,171 @@
+"""Service layer for media uploads."""
+
+from collections.abc import AsyncIterator, Callable
+from contextlib import AbstractAsyncContextManager
+from pathlib import Path
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.core.storage import (
+    LocalMediaStorage,
+    UploadInfo,
+    UploadNotFoundError,
+    UploadTooLargeError,
+)
+from app.db.models.media import MediaFile, MediaStatus
+from app.db.models.user import User
+from app.db.repositories.media import MediaRepository
+from app.db.session import admitted_session_scope
+from app.schemas.media import MediaUploadCreate, MediaUploadStatus
+
+
+class MediaService:
+    """Service layer for media uploads and downloads.
+
+    Runs on the request session, which closes when the endpoint returns,
+    before a download is streamed. Chunks are appended by
+    ``MediaChunkService``, which takes no request session.
+    """
+
+    def __init__(self, repository: MediaRepository, storage: LocalMediaStorage) -> None:
+        self._repository = repository
+        self._storage = storage
+
+    async def create_upload(self, owner: User, data: MediaUploadCreate) -> MediaFile:
+        """Start a new resumable upload.
+
+        Raises:
+            UploadTooLargeError: If the declared size exceeds the upload limit.
+        """
+        settings = get_settings()
+        if data.size > settings.media_max_upload_bytes:
+            raise UploadTooLargeError(data.filename)
+
+        media = await self._repository.create(
+            MediaFile(
+                owner_id=owner.id,
+                filename=data.filename,
+                content_type=data.content_type,
+                size=data.size,
+                sha256=data.sha256.lower(),
+                status=MediaStatus.UPLOADING.value,
+            )
+        )
+        await self._storage.create_upload(
+            media.id,
+            UploadInfo(owner=owner.auth_subject, size=data.size, sha256=media.sha256),
+        )
+        return media
+
+    async def get_upload_status(self, media_id: UUID, owner: User) -> MediaUploadStatus:
+        """Get the resume offset of an upload owned by ``owner``.
+
+        Raises:
+            UploadNotFoundError: If the upload does not exist for this user.
+        """
+        try:
+            info, offset = await self._storage.get_upload(media_id)
+        except UploadNotFoundError:
+            # No in-progress state, so the upload may already be complete
+            media = await self._repository.get_by_id(media_id)
+            if (
+                media is None
+                or media.owner_id != owner.id
+                or media.status != MediaStatus.COMPLETE.value
+            ):
+                raise
+            return MediaUploadStatus(
+                id=media_id, offset=media.size, size=media.size, status=media.status
+            )
+
+        if info.owner != owner.auth_subject:
+            raise UploadNotFoundError(str(media_id))
+        return MediaUploadStatus(
+            id=media_id,
+            offset=offset,
+            size=info.size,
+            status=MediaStatus.UPLOADING.value,
+        )
+
+    async def get_file(
+        self, media_id: UUID, viewer: User
+    ) -> tuple[MediaFile, Path] | None:
+        """Get a completed media file ``viewer`` may see, and its path on disk."""
+        media = await self._repository.get_viewable(media_id, viewer.id)
+        if media is None or media.status != MediaStatus.COMPLETE.value:
+            return None
+        return media, self._storage.file_path(media_id)
+
+    async def delete_media(self, media_id: UUID, owner: User) -> bool:
+        """Delete a media file owned by ``owner``."""
+        media = await self._repository.get_by_id(media_id)
+        if media is None or media.owner_id != owner.id:
+            return False
+        await self._repository.delete(media)
+        await self._storage.delete(media_id)
+        return True
+
+
+class MediaChunkService:
+    """Appends chunks to resumable uploads.
+
+    Upload offsets live on disk, so chunks are written without a request
+    database session. A short session is opened only once the final chunk
+    lands, so a slow client streaming a large video holds neither a pooled
+    connection nor a session limiter slot while its request body trickles in.
+    """
+
+    def __init__(
+        self,
+        storage: LocalMediaStorage,
+        sessions: Callable[
+            [], AbstractAsyncContextManager[AsyncSession]
+        ] = admitted_session_scope,
+    ) -> None:
+        self._storage = storage
+        self._sessions = sessions
+
+    async def append_chunk(
+        self,
+        media_id: UUID,
+        uid: str,
+        offset: int,
+        chunks: AsyncIterator[bytes],
+        chunk_sha256: str | None = None,
+    ) -> MediaUploadStatus:
+        """Write the next chunk of an upload, completing it on the last byte.
+
+        Raises:
+            UploadNotFoundError: If the upload does not exist for this user.
+            UploadConflictError: If ``offset`` is not the current offset.
+            UploadTooLargeError: If the chunk is over the chunk limit or runs
+                past the declared file size.
+            UploadChecksumError: If the chunk or completed file is corrupt.
+            ServerBusyError: If the last chunk arrived but no database
+                session frees up to record the completed upload.
+        """
+        settings = get_settings()
+        info, _ = await self._storage.get_upload(media_id)
+        if info.owner != uid:
+            raise UploadNotFoundError(str(media_id))
+
+        new_offset = await self._storage.write_chunk(
+            media_id,
+            offset,
+            chunks,
+            max_bytes=min(settings.media_max_chunk_bytes, info.size - offset),
+            expected_sha256=chunk_sha256,
+        )
+
+        status = MediaStatus.UPLOADING
+        if new_offset == info.size:
+            async with self._sessions() as session:
+                await self._storage.complete_upload(media_id, info)
+                await MediaRepository(session).mark_complete(media_id)
+            status = MediaStatus.COMPLETE
+
+        return MediaUploadStatus(
+            id=media_id, offset=new_offset, size=info.size, status=status.value
+        )
@@ -0,0 +1,191 @@
+"""Service layer for training programs."""
+
+from collections.abc import AsyncIterator
+from datetime import date
+from uuid import UUID
+
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import get_settings
+from app.core.json_patch import JsonPatchError, apply_patch
+from app.db.models.program import Program, ProgramAssignment
+from app.db.repositories.program import ProgramRepository
+from app.db.session import get_session_factory
+from app.schemas.program import (
+    ProgramAssignmentCreate,
+    ProgramAssignmentProgress,
+    ProgramCreate,
+    ProgramResponse,
+)
+
+# Fields the client may read but never patch
+_READ_ONLY_FIELDS = ("id", "coach_id", "assigned_count", "created_at", "updated_at")
+
+
+class ProgramPatchError(Exception):
+    """Raised when a JSON Patch cannot be applied to a program."""
+
+
+class ProgramService:
+    """Service layer for Program business logic.
+
+    Programs are read as whole trees and edited with JSON Patch, so the
+    studio editor can save a single changed activity without resending
+    (or rewriting) the rest of the program.
+    """
+
+    def __init__(
+        self,
+        repository: ProgramRepository,
+        session_factory: async_sessionmaker[AsyncSession] | None = None,
+    ) -> None:
+        self._repository = repository
+        self._session_factory = session_factory or get_session_factory()
+
+    async def get_programs(
+        self,
+        coach_id: UUID,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> list[Program]:
+        """Get a coach's programs without their trees."""
+        return await self._repository.list_for_coach(coach_id, skip=skip, limit=limit)
+
+    async def get_program(
+        self, program_id: UUID, coach_id: UUID
+    ) -> ProgramResponse | None:
+        """Get a program with its full tree."""
+        tree = await self._repository.get_tree(program_id)
+        if tree is None or tree["coach_id"] != str(coach_id):
+            return None
+        return ProgramResponse.model_validate(tree)
+
+    async def create_program(
+        self, coach_id: UUID, data: ProgramCreate
+    ) -> ProgramResponse:
+        """Create a program, including any weeks, days and activities given."""
+        program_id = await self._repository.create(
+            coach_id, data.model_dump(mode="json")
+        )
+        return await self.get_program(program_id, coach_id)
+
+    async def patch_program(
+        self,
+        program_id: UUID,
+        coach_id: UUID,
+        operations: list[dict],
+    ) -> ProgramResponse | None:
+        """Apply a JSON Patch to a program tree.
+
+        The patch is applied to the stored tree in memory and validated as a
+        whole; only the nodes that actually differ are then written.
+
+        Raises:
+            ProgramPatchError: If the patch fails or produces an invalid program.
+        """
+        for operation in operations:
+            for pointer in (operation.get("path"), operation.get("from")):
+                if pointer and pointer.lstrip("/").split("/")[0] in _READ_ONLY_FIELDS:
+                    raise ProgramPatchError(f"{pointer} is read-only")
+
+        updated_at = await self._repository.lock_for_update(program_id, coach_id)
+        if updated_at is None:
+            return None
+        old = ProgramResponse.model_validate(
+            await self._repository.get_tree(program_id)
+        ).model_dump(mode="json")
+
+        try:
+            patched = ProgramResponse.model_validate(apply_patch(old, operations))
+        except (JsonPatchError, ValidationError) as exc:
+            raise ProgramPatchError(str(exc))
+
+        new = patched.model_dump(mode="json")
+        await self._repository.save_tree(old, new)
+        return ProgramResponse.model_validate({**new, "updated_at": updated_at})
+
+    async def delete_program(self, program_id: UUID, coach_id: UUID) -> bool:
+        """Delete a program and its tree."""
+        return await self._repository.delete(program_id, coach_id)
+
+    async def assign_program(
+        self,
+        program_id: UUID,
+        coach_id: UUID,
+        data: ProgramAssignmentCreate,
+    ) -> AsyncIterator[ProgramAssignmentProgress] | None:
+        """Assign a program to a roster of students.
+
+        Only students who hold credits with the coach are assigned; anyone
+        else in the roster is skipped. Students are assigned in batches of ``program_assignment_batch_size``
+        with one statement per batch, so a whole team costs a handful of
+        round-trips instead of one per student. Each batch commits in its own
+        session and yields its progress, so very large rosters can be
+        streamed to the client and an interrupted run can simply be repeated.
+
+        Returns:
+            An iterator of progress reports, or None if the coach has no
+            such program.
+        """
+        program = await self._repository.get_by_id(program_id)
+        if program is None or program.coach_id != coach_id:
+            return None
+        student_ids = list(dict.fromkeys(data.student_ids))
+        return self._assign_batches(
+            program_id, coach_id, student_ids, data.start_date, program.assigned_count
+        )
+
+    async def _assign_batches(
+        self,
+        program_id: UUID,
+        coach_id: UUID,
+        student_ids: list[UUID],
+        start_date: date | None,
+        assigned_count: int,
+    ) -> AsyncIterator[ProgramAssignmentProgress]:
+        batch_size = get_settings().program_assignment_batch_size
+        assigned = 0
+        for start in range(0, len(student_ids), batch_size):
+            batch = student_ids[start : start + batch_size]
+            async with self._session_factory() as session:
+                inserted, assigned_count = await ProgramRepository(
+                    session
+                ).assign_students(program_id, coach_id, batch, start_date)
+                await session.commit()
+            assigned += inserted
+            processed = start + len(batch)
+            yield ProgramAssignmentProgress(
+                processed=processed,
+                total=len(student_ids),
+                assigned=assigned,
+                skipped=processed - assigned,
+                assigned_count=assigned_count,
+            )
+
+    async def get_assignments(
+        self,
+        program_id: UUID,
+        coach_id: UUID,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> list[ProgramAssignment] | None:
+        """Get the students a program is assigned to."""
+        program = await self._repository.get_by_id(program_id)
+        if program is None or program.coach_id != coach_id:
+            return None
+        return await self._repository.list_assignments(
+            program_id, skip=skip, limit=limit
+        )
+
+    async def unassign_student(
+        self,
+        program_id: UUID,
+        coach_id: UUID,
+        student_id: UUID,
+    ) -> bool:
+        """Remove a program from a student."""
+        program = await self._repository.get_by_id(program_id)
+        if program is None or program.coach_id != coach_id:
+            return False
+        return await self._repository.unassign_student(program_id, student_id)
@@ -0,0 +1,186 @@
+"""In-memory coach recommendation index, built with NumPy.
+
+A ``RecommendationIndex`` holds:
+
+- a coach feature matrix with one unit-length row per coach, made of a
+  multi-hot block of specialties, the z-scored log hourly rate and the
+  z-scored rating (a Bayesian average, so a single 5-star review does not
+  top the list);
+- each coach's position as a unit vector on the sphere;
+- each student's history: the rows of the coaches they hold credits with
+  or are assigned programs by.
+
+A student's query vector is the mean of their coaches' rows, with the
+rating weight always positive so better-rated coaches rank higher. Scores
+blend its cosine similarity with every coach, one matrix-vector product,
+with proximity to the spherical mean of those coaches' positions. The top
+``limit`` come from ``argpartition``, and the student's current coaches are
+left out. Students with no history yet get coaches by rating.
+
+Indexes are immutable, so a request always reads one consistent snapshot.
+"""
+
+import uuid
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+from app.schemas.coach import CoachRecommendation
+
+# Weights of the feature blocks in the cosine
+SPECIALTY_WEIGHT = 1.0
+PRICE_WEIGHT = 0.4
+RATING_WEIGHT = 0.4
+# Share of the score that comes from proximity rather than the cosine
+PROXIMITY_WEIGHT = 0.3
+# Proximity halves every this many kilometres from the student's coaches
+PROXIMITY_HALF_KM = 25.0
+# Reviews' worth of the average rating every coach starts with
+PRIOR_REVIEWS = 10
+
+_EARTH_RADIUS_KM = 6371.0
+# exp(kappa * (cos(d / R) - 1)) is 1/2 at d = PROXIMITY_HALF_KM
+_KAPPA = np.float32(np.log(2) / (1 - np.cos(PROXIMITY_HALF_KM / _EARTH_RADIUS_KM)))
+
+
+def _unit_rows(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
+
+
+def _z_scores(values: np.ndarray) -> np.ndarray:
+    std = values.std() if values.size else 0
+    if std == 0:
+        return np.zeros_like(values)
+    return np.clip((values - values.mean()) / std, -2, 2)
+
+
+@dataclass(frozen=True)
+class RecommendationIndex:
+    """One immutable snapshot of coach features and student histories."""
+
+    coaches: list[CoachRecommendation]
+    positions: dict[uuid.UUID, int]
+    # Unit rows; the last column is the rating
+    features: np.ndarray
+    # Unit vectors on the sphere, zero for coaches without coordinates
+    locations: np.ndarray
+    # Coach rows by student
+    history: dict[uuid.UUID, np.ndarray]
+    # Coach rows by Bayesian average rating, best first
+    by_rating: np.ndarray
+
+    def recommend(self, student_id: uuid.UUID, limit: int) -> list[CoachRecommendation]:
+        """The ``limit`` best coaches for a student, best first."""
+        coached = self.history.get(student_id, np.empty(0, dtype=np.intp))
+        # Coaches using the student side are not recommended themselves
+        own = self.positions.get(student_id)
+        excluded = coached if own is None else np.append(coached, own)
+
+        query = self.features[coached].sum(axis=0)
+        if not query[:-1].any():
+            ranked = self.by_rating[~np.isin(self.by_rating, excluded)][:limit]
+            return [self.coaches[row] for row in ranked]
+
+        query[-1] = RATING_WEIGHT * np.linalg.norm(query[:-1])
+        scores = self.features @ (query / np.linalg.norm(query))
+        home = self.locations[coached].sum(axis=0)
+        if home.any():
+            home /= np.linalg.norm(home)
+            # A coach without coordinates has a zero vector and exp(-kappa) = 0
+            near = self.locations @ home
+            near -= 1
+            near *= _KAPPA
+            np.exp(near, out=near)
+            scores *= 1 - PROXIMITY_WEIGHT
+            scores += PROXIMITY_WEIGHT * near
+        scores[excluded] = -np.inf
+
+        k = min(limit, len(self.coaches) - len(np.unique(excluded)))
+        if k <= 0:
+            return []
+        top = np.argpartition(scores, -k)[-k:]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [
+            self.coaches[row].model_copy(update={"score": round(float(scores[row]), 4)})
+            for row in top
+        ]
+
+
+def build_index(
+    coaches: list[CoachRecommendation],
+    pairs: Sequence[tuple[uuid.UUID, uuid.UUID]],
+) -> RecommendationIndex:
+    """Build the feature matrices for coaches and the coaching ``pairs``.
+
+    Args:
+        coaches: Every coach profile, with no score.
+        pairs: (student, coach) pairs that train together.
+    """
+    n = len(coaches)
+    positions = {coach.id: row for row, coach in enumerate(coaches)}
+
+    vocabulary: dict[str, int] = {}
+    rows, columns = [], []
+    for row, coach in enumerate(coaches):
+        for specialty in coach.specialties:
+            rows.append(row)
+            columns.append(vocabulary.setdefault(specialty.casefold(), len(vocabulary)))
+    specialties = np.zeros((n, len(vocabulary)))
+    specialties[rows, columns] = 1
+
+    rates = np.array(
+        [np.nan if c.hourly_rate is None else c.hourly_rate for c in coaches]
+    )
+    log_rates = np.log1p(rates)
+    known = ~np.isnan(log_rates)
+    price = np.where(known, log_rates, log_rates[known].mean() if known.any() else 0)
+
+    ratings = np.array([c.rating or 0.0 for c in coaches])
+    reviews = np.array(
+        [0 if c.rating is None else c.review_count for c in coaches], dtype=float
+    )
+    prior = ratings[reviews > 0].mean() if reviews.any() else 0.0
+    bayesian = (PRIOR_REVIEWS * prior + reviews * ratings) / (PRIOR_REVIEWS + reviews)
+
+    features = _unit_rows(
+        np.hstack(
+            [
+                SPECIALTY_WEIGHT * _unit_rows(specialties),
+                PRICE_WEIGHT * _z_scores(price)[:, None],
+                RATING_WEIGHT * _z_scores(bayesian)[:, None],
+            ]
+        )
+    ).astype(np.float32)
+
+    latitudes = np.radians([c.latitude or 0.0 for c in coaches])
+    longitudes = np.radians([c.longitude or 0.0 for c in coaches])
+    locations = np.column_stack(
+        [
+            np.cos(latitudes) * np.cos(longitudes),
+            np.cos(latitudes) * np.sin(longitudes),
+            np.sin(latitudes),
+        ]
+    ).reshape(n, 3)
+    located = np.array([c.latitude is not None for c in coaches], dtype=bool)
+    locations[~located] = 0
+    locations = locations.astype(np.float32)
+
+    coached: dict[uuid.UUID, list[int]] = {}
+    for student_id, coach_id in pairs:
+        row = positions.get(coach_id)
+        if row is not None:
+            coached.setdefault(student_id, []).append(row)
+
+    return RecommendationIndex(
+        coaches=coaches,
+        positions=positions,
+        features=features,
+        locations=locations,
+        history={
+            student_id: np.array(rows, dtype=np.intp)
+            for student_id, rows in coached.items()
+        },
+        by_rating=np.argsort(-bayesian, kind="stable"),
+    )
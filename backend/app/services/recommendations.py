@@ -0,0 +1,103 @@
+"""Coach recommendations from an in-memory index, rebuilt in the background.
+
+Scoring every coach per request from the database would be far too slow
+for the discover page, so each worker keeps a ``RecommendationIndex`` (see
+``app.services.recommendation_index``) and answers from it with a few
+vectorized operations.
+
+``CoachRecommender`` rebuilds the index every
+``recommendation_refresh_seconds``. Loading runs on the event loop and the
+NumPy work in a thread, where NumPy is also first imported so importing
+the app stays cheap. The new index then replaces the old one in one
+assignment. New profiles and coaching relationships show up after the
+next rebuild.
+"""
+
+import asyncio
+import logging
+import time
+import uuid
+from collections.abc import Sequence
+from contextlib import suppress
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from app.core.config import get_settings
+from app.db.repositories.coach import CoachRepository
+from app.db.session import get_session_factory
+from app.schemas.coach import CoachRecommendation
+from app.services.coach import profile_fields
+
+if TYPE_CHECKING:
+    from app.services.recommendation_index import RecommendationIndex
+
+logger = logging.getLogger(__name__)
+
+
+def _build_index(
+    coaches: list[CoachRecommendation],
+    pairs: Sequence[tuple[uuid.UUID, uuid.UUID]],
+) -> "RecommendationIndex":
+    from app.services.recommendation_index import build_index
+
+    return build_index(coaches, pairs)
+
+
+class CoachRecommender:
+    """Keeps this process's recommendation index and rebuilds it on an interval."""
+
+    def __init__(self, interval: float) -> None:
+        self._interval = interval
+        self.index: RecommendationIndex | None = None
+        self._task: asyncio.Task | None = None
+
+    def recommend(self, student_id: uuid.UUID, limit: int) -> list[CoachRecommendation]:
+        """The ``limit`` best coaches for a student; empty until first built."""
+        if self.index is None:
+            return []
+        return self.index.recommend(student_id, limit)
+
+    def start(self) -> None:
+        """Start rebuilding in the background, beginning now."""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop rebuilding."""
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def refresh(self) -> None:
+        """Load profiles and coaching history and rebuild the index."""
+        started = time.perf_counter()
+        async with get_session_factory()() as session:
+            repository = CoachRepository(session)
+            profiles = await repository.list_profiles()
+            pairs = await repository.list_coaching_pairs()
+        coaches = [
+            CoachRecommendation(**profile_fields(row), score=None) for row in profiles
+        ]
+        self.index = await asyncio.to_thread(_build_index, coaches, pairs)
+        logger.info(
+            "Rebuilt recommendation index of %d coaches and %d students in %.2f s",
+            len(coaches),
+            len(self.index.history),
+            time.perf_counter() - started,
+        )
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except Exception:
+                logger.exception("Recommendation index rebuild failed")
+            await asyncio.sleep(self._interval)
+
+
+@lru_cache
+def get_coach_recommender() -> CoachRecommender:
+    """Get this process's coach recommender."""
+    return CoachRecommender(get_settings().recommendation_refresh_seconds)
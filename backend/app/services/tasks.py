@@ -0,0 +1,45 @@
+"""Background job handlers.
+
+Importing this module registers every handler with the job queue. Both the
+standalone worker and the in-process worker import it at startup.
+"""
+
+from datetime import timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.db.partitions import create_partitions
+from app.db.repositories.credit import CreditRepository
+from app.db.repositories.user import UserRepository
+from app.services.credit import CreditService
+from app.services.events import EventPublisher, user_topic
+from app.services.jobs import job_handler
+
+
+@job_handler("users.sync_profile")
+async def sync_user_profile(session: AsyncSession, payload: dict) -> None:
+    """Copy email and display name from Firebase claims onto the local user."""
+    await UserRepository(session).upsert_from_firebase(payload)
+    await EventPublisher(session).publish(
+        user_topic(payload["uid"]), "user.updated", {}
+    )
+
+
+@job_handler(
+    "credits.snapshot",
+    every=lambda: timedelta(seconds=get_settings().credit_snapshot_interval_seconds),
+)
+async def snapshot_credit_balances(session: AsyncSession, _payload: dict) -> None:
+    """Write balance snapshots for credit accounts with long ledger tails."""
+    await CreditService(CreditRepository(session)).snapshot_balances()
+
+
+@job_handler(
+    "partitions.maintain",
+    every=lambda: timedelta(seconds=get_settings().partition_maintain_interval_seconds),
+)
+async def maintain_partitions(session: AsyncSession, _payload: dict) -> None:
+    """Create the range partitions for the intervals coming up."""
+    connection = await session.connection()
+    await connection.run_sync(create_partitions)
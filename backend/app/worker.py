@@ -0,0 +1,31 @@
+"""Standalone background job worker.
+
+Run with ``python -m app.worker``. Stops gracefully on SIGINT/SIGTERM after
+finishing the batch it is working on.
+"""
+
+import asyncio
+import logging
+import signal
+
+import app.services.tasks  # noqa: F401 - registers job handlers
+from app.db.session import get_engine
+from app.services.jobs import JobWorker
+
+
+async def main() -> None:
+    """Run a job worker until it receives a termination signal."""
+    worker = JobWorker()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, worker.stop)
+
+    try:
+        await worker.run()
+    finally:
+        await get_engine().dispose()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
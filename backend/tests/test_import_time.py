@@ -0,0 +1,24 @@
+"""Cold-start budget for importing the app."""
+
+import os
+
+import pytest
+
+from app.importtime import DEFAULT_BUDGET_MS, profile, total_ms
+
+
+def test_app_import_is_within_budget(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Importing builds the settings but never connects, so any URL will do
+    if "DATABASE_URL" not in os.environ:
+        monkeypatch.setenv("DATABASE_URL", "postgresql://velo@localhost/velo")
+
+    # The fastest run is the least disturbed by disk cache and CPU noise
+    modules = min((profile()[1] for _ in range(3)), key=total_ms)
+    total = total_ms(modules)
+
+    slowest = sorted(modules, key=lambda m: m.self_us, reverse=True)[:10]
+    report = "\n".join(f"  {m.self_us / 1000:8.1f} ms  {m.name}" for m in slowest)
+    assert total <= DEFAULT_BUDGET_MS, (
+        f"Importing the app took {total:.0f} ms, over the "
+        f"{DEFAULT_BUDGET_MS:.0f} ms budget. Slowest modules:\n{report}"
+    )